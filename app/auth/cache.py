@@ -0,0 +1,137 @@
+"""In-process cache of authenticated principals keyed by token subject"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+from sqlalchemy.orm import Session, make_transient_to_detached
+
+from app.config import settings
+from app.models import User
+
+# Columns snapshotted into the cache. The password hash is deliberately left
+# out; it is lazily loaded from the database if a handler ever touches it.
+CACHED_USER_COLUMNS = ("id", "email", "first_name", "last_name", "age", "is_active", "created_at")
+
+
+class PrincipalCache:
+    """Bounded LRU cache of user rows with a per-entry TTL"""
+
+    def __init__(self, max_size: int, ttl_seconds: float):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, subject: str) -> Optional[Dict[str, Any]]:
+        """Return the cached column values for a subject, or None"""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(subject)
+            if entry is None or entry[0] <= now:
+                if entry is not None:
+                    del self._entries[subject]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(subject)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, subject: str, user: User) -> None:
+        """Snapshot a loaded user row into the cache"""
+        if self.max_size <= 0 or self.ttl_seconds <= 0:
+            return
+        values = {column: getattr(user, column) for column in CACHED_USER_COLUMNS}
+        expires_at = time.monotonic() + self.ttl_seconds
+        with self._lock:
+            self._entries[subject] = (expires_at, values)
+            self._entries.move_to_end(subject)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, subject: str) -> None:
+        """Drop a subject, e.g. after its profile changed"""
+        with self._lock:
+            self._entries.pop(subject, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters for monitoring"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+            }
+
+
+class ExpiringIdSet:
+    """Bounded set of user ids, each remembered for ``ttl_seconds``"""
+
+    def __init__(self, ttl_seconds: float, max_size: int):
+        self.ttl_seconds = ttl_seconds
+        self.max_size = max_size
+        self._revoked: "OrderedDict[int, float]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def add(self, user_id: int) -> None:
+        with self._lock:
+            self._revoked[user_id] = time.monotonic() + self.ttl_seconds
+            self._revoked.move_to_end(user_id)
+            self._purge(time.monotonic())
+
+    def __contains__(self, user_id: int) -> bool:
+        now = time.monotonic()
+        with self._lock:
+            expires_at = self._revoked.get(user_id)
+            if expires_at is None:
+                return False
+            if expires_at <= now:
+                del self._revoked[user_id]
+                return False
+            return True
+
+    def _purge(self, now: float) -> None:
+        # Entries are kept in expiry order, so expired ones sit at the front
+        while self._revoked:
+            user_id, expires_at = next(iter(self._revoked.items()))
+            if expires_at > now and len(self._revoked) <= self.max_size:
+                break
+            del self._revoked[user_id]
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._revoked)
+
+
+def attach_cached_user(db: Session, values: Dict[str, Any]) -> User:
+    """Turn cached column values into a persistent User without a SELECT"""
+    user = User(**values)
+    make_transient_to_detached(user)
+    return db.merge(user, load=False)
+
+
+principal_cache = PrincipalCache(
+    max_size=settings.principal_cache_max_size,
+    ttl_seconds=settings.principal_cache_ttl_seconds,
+)
+
+# Claims tokens are trusted without a database lookup, so deactivation is
+# enforced by remembering the user id until every token issued before it
+# has expired.
+revoked_principals = ExpiringIdSet(
+    ttl_seconds=settings.access_token_expire_minutes * 60,
+    max_size=10_000,
+)
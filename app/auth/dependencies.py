@@ -1,10 +1,16 @@
+from dataclasses import dataclass
+
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from jose import JWTError, jwt
 
+from app import database
+from app.auth.cache import attach_cached_user, principal_cache, revoked_principals
 from app.config import settings
-from app.dependencies import get_db
+from app.dependencies import get_async_db, get_db
 from app.models import User
 from app.schemas import TokenData
 
@@ -16,39 +22,180 @@ SECRET_KEY = str(settings.jwt_secret.get_secret_value())
 ALGORITHM = "HS256"
 
 
-def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)) -> User:
-    """
-    Dependency to get the current authenticated user from JWT token
-    """
-    credentials_exception = HTTPException(
+@dataclass(frozen=True)
+class Principal:
+    """Authenticated identity taken from signed token claims (no DB row)"""
+    id: int
+    email: str
+    is_active: bool = True
+
+
+def access_token_claims(user: User) -> dict:
+    """Claims to sign into an access token for the given user"""
+    claims = {"sub": user.email}
+    if settings.auth_claims_tokens:
+        claims.update({"uid": user.id, "act": user.is_active})
+    return claims
+
+
+def load_user(db: Session, email: str) -> User | None:
+    """Load a user by email, going through the principal cache"""
+    cached = principal_cache.get(email)
+    if cached is not None:
+        return attach_cached_user(db, cached)
+
+    user = db.query(User).filter(User.email == email).first()
+    if user is not None:
+        principal_cache.put(email, user)
+    return user
+
+
+def credentials_error() -> HTTPException:
+    return HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
 
+
+def token_subject(token: str) -> tuple[str, Principal | None]:
+    """
+    Validate a bearer token and return its subject email.
+
+    For claims tokens the Principal is returned too, so callers can skip the
+    users table entirely.
+    """
     try:
         payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
         email: str = payload.get("sub")
         if email is None:
-            raise credentials_exception
+            raise credentials_error()
         token_data = TokenData(email=email)
     except JWTError:
-        raise credentials_exception
+        raise credentials_error()
 
-    user = db.query(User).filter(User.email == token_data.email).first()
+    # Claims tokens carry everything handlers need; skip the users table
+    user_id = payload.get("uid")
+    if settings.auth_claims_tokens and isinstance(user_id, int):
+        if user_id in revoked_principals:
+            raise credentials_error()
+        return token_data.email, Principal(id=user_id, email=token_data.email, is_active=bool(payload.get("act", True)))
+    return token_data.email, None
+
+
+def ensure_active(current_user: User | Principal) -> User | Principal:
+    if not current_user.is_active:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Inactive user"
+        )
+    return current_user
+
+
+def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)) -> User | Principal:
+    """
+    Dependency to get the current authenticated user from JWT token
+    """
+    email, user = token_subject(token)
     if user is None:
-        raise credentials_exception
+        user = load_user(db, email)
+        if user is None:
+            raise credentials_error()
 
+    # Lets a committed write keep this user's reads on the primary
+    db.info["principal_id"] = user.id
     return user
 
 
-def get_current_active_user(current_user: User = Depends(get_current_user)) -> User:
+def get_current_active_user(current_user: User | Principal = Depends(get_current_user)) -> User | Principal:
     """
     Dependency to get current active user (not disabled)
     """
-    if not current_user.is_active:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Inactive user"
-        )
-    return current_user
\ No newline at end of file
+    return ensure_active(current_user)
+
+
+def get_current_db_user(
+        current_user: User | Principal = Depends(get_current_active_user),
+        db: Session = Depends(get_db)
+) -> User:
+    """
+    Dependency for handlers that need the full User row, not just the principal
+    """
+    if isinstance(current_user, User):
+        return current_user
+
+    user = load_user(db, current_user.email)
+    if user is None or user.id != current_user.id:
+        raise credentials_error()
+    return user
+
+
+def get_read_db(
+        db: Session = Depends(get_db),
+        current_user: User | Principal = Depends(get_current_active_user)
+):
+    """
+    Session for read-only GET handlers.
+
+    Reads go to a replica (round-robin) unless none are configured or the
+    user wrote recently, in which case the primary session is used so they
+    see their own writes. Only reads that do go to a replica advance the
+    rotation.
+    """
+    if not database.replica_engines or database.wrote_recently(db, current_user.id):
+        yield db
+        return
+
+    replica = database.next_replica()
+
+    read_db = database.RoutingSession(bind=db.get_bind(), info={"replica": replica}, autoflush=False)
+    try:
+        yield read_db
+    finally:
+        read_db.close()
+
+
+# Async counterparts for the routers served on the asyncio engine
+
+async def load_user_async(db: AsyncSession, email: str) -> User | None:
+    """load_user for an AsyncSession"""
+    cached = principal_cache.get(email)
+    if cached is not None:
+        return await db.run_sync(attach_cached_user, cached)
+
+    user = (await db.execute(select(User).where(User.email == email))).scalars().first()
+    if user is not None:
+        principal_cache.put(email, user)
+    return user
+
+
+async def get_current_user_async(
+        token: str = Depends(oauth2_scheme),
+        db: AsyncSession = Depends(get_async_db)
+) -> User | Principal:
+    email, principal = token_subject(token)
+    user = principal or await load_user_async(db, email)
+    if user is None:
+        raise credentials_error()
+
+    db.info["principal_id"] = user.id
+    return user
+
+
+async def get_current_active_user_async(
+        current_user: User | Principal = Depends(get_current_user_async)
+) -> User | Principal:
+    return ensure_active(current_user)
+
+
+async def get_current_db_user_async(
+        current_user: User | Principal = Depends(get_current_active_user_async),
+        db: AsyncSession = Depends(get_async_db)
+) -> User:
+    if isinstance(current_user, User):
+        return current_user
+
+    user = await load_user_async(db, current_user.email)
+    if user is None or user.id != current_user.id:
+        raise credentials_error()
+    return user
@@ -1,5 +1,9 @@
 # app/config.py
 
+import os
+import tempfile
+from typing import List
+
 from dotenv import load_dotenv
 from pydantic import PostgresDsn, EmailStr, SecretStr, HttpUrl
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -32,6 +36,83 @@ class Settings(BaseSettings):
     jwt_secret: SecretStr
     vite_api_base_url: HttpUrl
 
+    # Connection pool (PostgreSQL engines; SQLite keeps its defaults)
+    db_pool_size: int = 5
+    db_max_overflow: int = 10
+    db_pool_timeout: float = 30.0
+    db_pool_recycle_seconds: int = 1800
+    db_pool_pre_ping: bool = True
+    # Open db_pool_size connections at startup, before serving traffic
+    db_pool_warmup: bool = True
+    # Server-side per-statement timeout; 0 disables it
+    db_statement_timeout_ms: int = 30000
+
+    # Log SQL statements slower than this (0 disables the slow-query log)
+    slow_query_ms: float = 200.0
+    # Add a Server-Timing header (db;dur=, app;dur=) to every response
+    server_timing: bool = True
+
+    # Gzip API responses at least this large (0 disables it); static files
+    # are compressed at build time by scripts/precompress_static.py
+    gzip_min_size: int = 1024
+    gzip_level: int = 6
+
+    # Comma-separated read replica URLs; GET list/stats routes read from them
+    # round-robin. Users stay on the primary for a while after writing.
+    database_replica_urls: str = ""
+    replica_sticky_seconds: float = 5.0
+
+    # Serve the hot routes from async handlers on an asyncpg engine instead
+    # of sync handlers in the threadpool
+    async_db: bool = False
+
+    access_token_expire_minutes: int = 30
+    # Put the user id and active flag in access tokens so requests can be
+    # authenticated without a users-table lookup
+    auth_claims_tokens: bool = False
+
+    # Authenticated-user cache (0 disables it)
+    principal_cache_ttl_seconds: float = 30.0
+    principal_cache_max_size: int = 1024
+
+    # Encode list responses straight from selected columns instead of
+    # validating every row through the response model
+    fast_json_responses: bool = True
+
+    # Maximum operations accepted by one /tasks/batch request
+    task_batch_max_items: int = 5000
+    # Rows validated and loaded per step of POST /tasks/import
+    task_import_chunk_size: int = 1000
+    # Rejected rows listed in an import response; "failed" still counts all
+    task_import_max_errors: int = 100
+
+    # Only one process (the holder of a Postgres advisory lock, or of a file
+    # lock on SQLite) runs scheduler jobs; the others retry every interval
+    scheduler_leader_election: bool = True
+    scheduler_lock_key: int = 7262013
+    scheduler_lock_file: str = os.path.join(tempfile.gettempdir(), "tasklytics-scheduler.lock")
+    leader_check_seconds: float = 15.0
+
+    # Lead times (minutes before due_at) for tasks that don't set their own
+    default_reminder_minutes: List[int] = [5]
+
+    # Wake exactly when the next reminder is due instead of polling every
+    # minute; the full scan then only runs as a safety net
+    reminder_timer: bool = True
+    reminder_scan_minutes: float = 10.0
+
+    # Due tasks claimed (marked reminded + notified) per scheduler statement
+    reminder_batch_size: int = 1000
+
+    # Reminders missed while no scheduler was running (deploys, free-tier
+    # sleep) are drained at this pace after startup rather than all at once
+    reminder_catchup_batch_size: int = 100
+    reminder_catchup_interval_seconds: float = 5.0
+
+    # bcrypt worker pool used by login/registration
+    password_hash_workers: int = 2
+    password_hash_max_pending: int = 64
+
 
 # Instantiate settings
 settings = Settings()
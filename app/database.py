@@ -1,21 +1,153 @@
 # app/database.py
 
+import itertools
 import os
+from datetime import datetime, timedelta
+from typing import Optional
 from dotenv import load_dotenv
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, declarative_base
+from sqlalchemy import DateTime, bindparam, create_engine, event, text
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session, sessionmaker, declarative_base
+from sqlalchemy.sql.dml import UpdateBase
 
 load_dotenv()
 
 # bring in your new Pydantic settings
 from app.config import settings
+from app.db_pool import InstrumentedAsyncQueuePool, InstrumentedQueuePool
 
 DATABASE_URL = settings.database_url
 
-engine_kwargs = {}
-if str(DATABASE_URL).startswith("sqlite"):
-    engine_kwargs["connect_args"] = {"check_same_thread": False}
 
-engine = create_engine(str(DATABASE_URL), **engine_kwargs)
+def engine_options(url: str, is_async: bool = False) -> dict:
+    """create_engine/create_async_engine keyword arguments for a database URL"""
+    if url.startswith("sqlite"):
+        return {} if is_async else {"connect_args": {"check_same_thread": False}}
+
+    options = {
+        "poolclass": InstrumentedAsyncQueuePool if is_async else InstrumentedQueuePool,
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_timeout": settings.db_pool_timeout,
+        "pool_recycle": settings.db_pool_recycle_seconds,
+        "pool_pre_ping": settings.db_pool_pre_ping,
+    }
+    timeout_ms = settings.db_statement_timeout_ms
+    if timeout_ms:
+        if is_async:
+            options["connect_args"] = {"server_settings": {"statement_timeout": str(timeout_ms)}}
+        else:
+            options["connect_args"] = {"options": f"-c statement_timeout={timeout_ms}"}
+    return options
+
+
+engine = create_engine(str(DATABASE_URL), **engine_options(str(DATABASE_URL)))
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base = declarative_base()
+
+# Read replicas, used round-robin by read-only GET handlers
+replica_engines = [
+    create_engine(url.strip(), **engine_options(url.strip()))
+    for url in settings.database_replica_urls.split(",")
+    if url.strip()
+]
+_replica_counter = itertools.count()
+
+
+def next_replica():
+    """The next replica engine in rotation, or None when none are configured"""
+    if not replica_engines:
+        return None
+    return replica_engines[next(_replica_counter) % len(replica_engines)]
+
+
+class RoutingSession(Session):
+    """
+    Session that reads from ``info["replica"]`` and sends writes to its bind.
+
+    Flushes and INSERT/UPDATE/DELETE statements always go to the primary, so
+    a handler that unexpectedly writes still lands in the right place.
+    """
+
+    def get_bind(self, mapper=None, clause=None, **kw):
+        replica = self.info.get("replica")
+        if replica is None or self._flushing or isinstance(clause, UpdateBase):
+            return super().get_bind(mapper=mapper, clause=clause, **kw)
+        return replica
+
+
+# Read-your-writes. Replicas lag the primary a little, so a user who just
+# wrote keeps reading from the primary for replica_sticky_seconds. The time
+# of their last write lives in user_last_writes on the primary, keyed by the
+# authenticated user id: their next request usually lands on another worker,
+# and API clients needn't carry anything for it.
+_RECORD_WRITE = text(
+    "INSERT INTO user_last_writes (user_id, written_at) VALUES (:user_id, :written_at) "
+    "ON CONFLICT (user_id) DO UPDATE SET written_at = excluded.written_at"
+).bindparams(bindparam("written_at", type_=DateTime))
+_LAST_WRITE = text(
+    "SELECT written_at FROM user_last_writes WHERE user_id = :user_id"
+).columns(written_at=DateTime)
+
+
+def wrote_recently(db: Session, user_id: int, now: Optional[datetime] = None) -> bool:
+    """Whether the user committed a write within the sticky window (one primary key lookup)"""
+    written_at = db.execute(_LAST_WRITE, {"user_id": user_id}).scalar()
+    if written_at is None:
+        return False
+    return (now or datetime.utcnow()) - written_at < timedelta(seconds=settings.replica_sticky_seconds)
+
+
+@event.listens_for(Session, "after_flush")
+def _flag_flush_write(session, flush_context):
+    session.info["wrote"] = True
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _flag_statement_write(orm_execute_state):
+    if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+        orm_execute_state.session.info["wrote"] = True
+
+
+@event.listens_for(Session, "before_commit")
+def _record_write(session):
+    # Sessions are tagged with info["principal_id"] by the auth dependencies;
+    # the mark commits (or rolls back) together with the write itself
+    if not replica_engines or "principal_id" not in session.info:
+        return
+    if session.info.get("wrote") or session.new or session.dirty or session.deleted:
+        session.execute(_RECORD_WRITE, {"user_id": session.info["principal_id"], "written_at": datetime.utcnow()})
+
+
+@event.listens_for(Session, "after_commit")
+def _clear_write(session):
+    session.info.pop("wrote", None)
+
+
+@event.listens_for(Session, "after_rollback")
+def _forget_write(session):
+    session.info.pop("wrote", None)
+
+
+def async_database_url(url: str) -> str:
+    """Point a sync database URL at the matching asyncio driver"""
+    url = make_url(url)
+    if url.get_backend_name() == "sqlite":
+        return url.set(drivername="sqlite+aiosqlite").render_as_string(hide_password=False)
+
+    # asyncpg takes ``ssl`` rather than libpq's ``sslmode``
+    query = dict(url.query)
+    if "sslmode" in query:
+        query["ssl"] = query.pop("sslmode")
+    return url.set(drivername="postgresql+asyncpg", query=query).render_as_string(hide_password=False)
+
+
+# Native asyncio stack, used by the async routers when ASYNC_DB is enabled
+async_engine = None
+AsyncSessionLocal = None
+if settings.async_db:
+    async_engine = create_async_engine(
+        async_database_url(str(DATABASE_URL)), **engine_options(str(DATABASE_URL), is_async=True)
+    )
+    AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
@@ -0,0 +1,126 @@
+"""Connection pool instrumentation and warm-up
+
+Gauges come from the pool itself (checked out, overflow, idle) plus
+counters maintained from SQLAlchemy pool events. Checkout wait time is
+measured around the pool's internal get, which is where a request blocks
+when every connection is busy.
+"""
+
+import logging
+import threading
+import time
+from typing import Any, Dict
+
+from sqlalchemy import event, exc
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+logger = logging.getLogger(__name__)
+
+
+class PoolStats:
+    """Counters for one pool, updated from pool events and checkout timing"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.connects = 0
+        self.checkouts = 0
+        self.invalidations = 0
+        self.timeouts = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+
+    def record_wait(self, seconds: float) -> None:
+        with self._lock:
+            self.checkouts += 1
+            self.wait_seconds_total += seconds
+            self.wait_seconds_max = max(self.wait_seconds_max, seconds)
+
+    def incr(self, counter: str) -> None:
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "connects": self.connects,
+                "checkouts": self.checkouts,
+                "invalidations": self.invalidations,
+                "timeouts": self.timeouts,
+                "wait_ms_avg": round(self.wait_seconds_total / self.checkouts * 1000, 3) if self.checkouts else 0.0,
+                "wait_ms_max": round(self.wait_seconds_max * 1000, 3),
+            }
+
+
+class _TimedCheckout:
+    """Mixin timing how long each checkout waits for a connection"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.stats = PoolStats()
+        event.listen(self, "connect", lambda *_: self.stats.incr("connects"))
+        event.listen(self, "invalidate", lambda *_: self.stats.incr("invalidations"))
+        event.listen(self, "soft_invalidate", lambda *_: self.stats.incr("invalidations"))
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        except exc.TimeoutError:
+            self.stats.incr("timeouts")
+            raise
+        finally:
+            self.stats.record_wait(time.perf_counter() - start)
+
+
+class InstrumentedQueuePool(_TimedCheckout, QueuePool):
+    pass
+
+
+class InstrumentedAsyncQueuePool(_TimedCheckout, AsyncAdaptedQueuePool):
+    pass
+
+
+def pool_stats(engine: Engine) -> Dict[str, Any]:
+    """Live gauges and counters for an engine's pool"""
+    pool = engine.pool
+    stats = {"pool": type(pool).__name__}
+    if isinstance(pool, QueuePool):
+        stats.update({
+            "size": pool.size(),
+            "checked_out": pool.checkedout(),
+            "idle": pool.checkedin(),
+            "overflow": max(pool.overflow(), 0),
+        })
+    if isinstance(pool, _TimedCheckout):
+        stats.update(pool.stats.snapshot())
+    return stats
+
+
+def warm_up(engine: Engine, connections: int) -> int:
+    """Open up to ``connections`` connections and return them to the pool idle"""
+    opened = []
+    try:
+        for _ in range(connections):
+            opened.append(engine.connect())
+    except exc.SQLAlchemyError as e:
+        logger.warning(f"Pool warm-up stopped after {len(opened)} connections: {str(e)}")
+    finally:
+        for connection in opened:
+            connection.close()
+    return len(opened)
+
+
+async def warm_up_async(engine: AsyncEngine, connections: int) -> int:
+    """warm_up for the asyncio engine behind the async routers"""
+    opened = []
+    try:
+        for _ in range(connections):
+            opened.append(await engine.connect())
+    except exc.SQLAlchemyError as e:
+        logger.warning(f"Async pool warm-up stopped after {len(opened)} connections: {str(e)}")
+    finally:
+        for connection in opened:
+            await connection.close()
+    return len(opened)
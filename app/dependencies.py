@@ -1,4 +1,4 @@
-from .database import SessionLocal
+from .database import AsyncSessionLocal, SessionLocal
 from fastapi import Depends
 
 
@@ -7,4 +7,9 @@ def get_db():
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
+
+
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
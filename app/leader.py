@@ -0,0 +1,158 @@
+"""Scheduler leader election across worker processes
+
+Every uvicorn worker runs the APScheduler, but only the one holding the
+lock runs the jobs. On PostgreSQL the lock is a session-level advisory lock
+on a dedicated connection; elsewhere (SQLite, local dev) it is an exclusive
+``flock`` on a lock file. Either way the lock goes away with the process,
+so a follower takes over on its next check after the leader dies.
+"""
+
+import logging
+import os
+import threading
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional
+
+from sqlalchemy import create_engine, exc, text
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.pool import NullPool
+
+from app.config import settings
+
+try:
+    import fcntl
+except ImportError:  # Windows: no flock, assume a single local process
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+
+class LeaderElection:
+    """Holds (or keeps trying to take) the scheduler lock for this process"""
+
+    def __init__(self, engine: Engine, lock_key: int, lock_file: str, enabled: bool = True):
+        self.engine = engine
+        self.lock_key = lock_key
+        self.lock_file = lock_file
+        self.enabled = enabled
+        self.backend = "postgres" if engine.dialect.name == "postgresql" else "file"
+        self.leader_since: Optional[datetime] = None
+        self._lock_engine: Optional[Engine] = None
+        self._connection: Optional[Connection] = None
+        self._fd: Optional[int] = None
+        self._mutex = threading.Lock()
+
+    @property
+    def is_leader(self) -> bool:
+        return not self.enabled or self.leader_since is not None
+
+    def check(self) -> bool:
+        """Confirm the lock is still held, or try to take it; returns leadership"""
+        if not self.enabled:
+            return True
+        with self._mutex:
+            if self.leader_since is not None:
+                if self._still_held():
+                    return True
+                logger.warning("Lost scheduler leadership")
+                self._drop()
+            if self._acquire():
+                self.leader_since = datetime.now(timezone.utc)
+                logger.info(f"Became scheduler leader (pid {os.getpid()}, {self.backend} lock)")
+            return self.leader_since is not None
+
+    def release(self) -> None:
+        with self._mutex:
+            if self.leader_since is not None:
+                logger.info("Releasing scheduler leadership")
+            self._drop()
+            if self._lock_engine is not None:
+                self._lock_engine.dispose()
+                self._lock_engine = None
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "election": self.enabled,
+            "backend": self.backend,
+            "leader": self.is_leader,
+            "leader_since": self.leader_since.isoformat() if self.leader_since else None,
+            "pid": os.getpid(),
+        }
+
+    def _acquire(self) -> bool:
+        if self.backend == "postgres":
+            return self._acquire_advisory_lock()
+        return self._acquire_file_lock()
+
+    def _acquire_advisory_lock(self) -> bool:
+        if self._lock_engine is None:
+            # Own connection outside the request pool, held for as long as we lead
+            self._lock_engine = create_engine(self.engine.url, poolclass=NullPool)
+        try:
+            connection = self._lock_engine.connect()
+        except exc.SQLAlchemyError as e:
+            logger.warning(f"Leader election could not connect: {str(e)}")
+            return False
+        try:
+            acquired = connection.execute(
+                text("SELECT pg_try_advisory_lock(:key)"), {"key": self.lock_key}
+            ).scalar()
+            # Session-level lock survives the commit; don't sit idle in a transaction
+            connection.commit()
+        except exc.SQLAlchemyError as e:
+            logger.warning(f"Leader election failed: {str(e)}")
+            acquired = False
+        if acquired:
+            self._connection = connection
+        else:
+            connection.close()
+        return bool(acquired)
+
+    def _acquire_file_lock(self) -> bool:
+        if fcntl is None:
+            return True
+        fd = os.open(self.lock_file, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            os.close(fd)
+            return False
+        self._fd = fd
+        return True
+
+    def _still_held(self) -> bool:
+        if self._connection is None:
+            # File locks last as long as the descriptor
+            return True
+        try:
+            self._connection.execute(text("SELECT 1"))
+            self._connection.commit()
+            return True
+        except exc.SQLAlchemyError:
+            return False
+
+    def _drop(self) -> None:
+        self.leader_since = None
+        if self._connection is not None:
+            try:
+                self._connection.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": self.lock_key})
+                self._connection.commit()
+            except exc.SQLAlchemyError:
+                pass  # a dead connection has already released the lock
+            finally:
+                self._connection.close()
+                self._connection = None
+        if self._fd is not None:
+            if fcntl is not None:
+                fcntl.flock(self._fd, fcntl.LOCK_UN)
+            os.close(self._fd)
+            self._fd = None
+
+
+def create_leader_election(engine: Engine) -> LeaderElection:
+    return LeaderElection(
+        engine,
+        lock_key=settings.scheduler_lock_key,
+        lock_file=settings.scheduler_lock_file,
+        enabled=settings.scheduler_leader_election,
+    )
@@ -1,21 +1,43 @@
 from contextlib import asynccontextmanager
-from fastapi import FastAPI
-from fastapi.middleware.cors import CORSMiddleware
-from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse, Response
+from fastapi import FastAPI, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import Response
 import os
 
 from app.routers import auth, tasks, notifications, users
-from app.scheduler import start_scheduler
+from app.auth.cache import principal_cache
+from app.config import settings
+from app import database
+from app.database import async_engine
+from app.db_pool import pool_stats, warm_up, warm_up_async
+from app.metrics import REGISTRY, MetricsMiddleware
+from app.middleware import SecurityHeadersMiddleware
+from app.utils.password_hashing import password_hasher
+from app.utils.static_files import InMemoryPage, PrecompressedStaticFiles
+from app.reminder_timer import reminder_timer
+from app.reminder_catchup import reminder_catchup
+from app.scheduler import leader, start_scheduler, stop_scheduler
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Startup and shutdown events"""
     # Startup
+    if settings.db_pool_warmup:
+        # Connect before accepting traffic instead of in a storm on the first requests
+        for db_engine in [database.engine, *database.replica_engines]:
+            await run_in_threadpool(warm_up, db_engine, settings.db_pool_size)
+        if async_engine is not None:
+            await warm_up_async(async_engine, settings.db_pool_size)
+    password_hasher.start()
     start_scheduler()
     yield
-    # Shutdown - scheduler will stop automatically
+    # Shutdown
+    stop_scheduler()
+    password_hasher.shutdown()
+    if async_engine is not None:
+        await async_engine.dispose()
 
 
 app = FastAPI(
@@ -25,9 +47,13 @@ app = FastAPI(
     lifespan=lifespan
 )
 
-# CORS middleware - IMPORTANT: Add localhost:5173 for frontend development
+if settings.gzip_min_size:
+    # Already-encoded responses (precompressed static files) pass through untouched
+    app.add_middleware(GZipMiddleware, minimum_size=settings.gzip_min_size, compresslevel=settings.gzip_level)
+
+# CORS + security headers in one ASGI pass - IMPORTANT: Add localhost:5173 for frontend development
 app.add_middleware(
-    CORSMiddleware,
+    SecurityHeadersMiddleware,
     allow_origins=[
         "https://tasklytics.dev",
         "https://www.tasklytics.dev",
@@ -38,8 +64,13 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    # Lets the frontend read the DB/app latency split
+    expose_headers=["Server-Timing"],
 )
 
+# Outermost, so latency covers every other middleware
+app.add_middleware(MetricsMiddleware)
+
 
 @app.get("/", tags=["Root"])
 def api_root():
@@ -55,7 +86,25 @@ def api_root():
 @app.get("/health", tags=["Health"])
 def health_check():
     """Health check endpoint"""
-    return {"status": "healthy", "service": "task-tracker-api"}
+    return {
+        "status": "healthy",
+        "service": "task-tracker-api",
+        "principal_cache": principal_cache.stats(),
+        "password_hashing": password_hasher.stats(),
+        "scheduler": {**leader.stats(), "reminder_timer": reminder_timer.stats(),
+                      "reminder_catchup": reminder_catchup.stats()},
+        "db_pool": {
+            "primary": pool_stats(database.engine),
+            "replicas": [pool_stats(replica) for replica in database.replica_engines],
+            "async": pool_stats(async_engine.sync_engine) if async_engine is not None else None,
+        },
+    }
+
+
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    """Prometheus scrape endpoint (async so threadpool gauges read the live limiter)"""
+    return Response(REGISTRY.render(), media_type="text/plain; version=0.0.4; charset=utf-8")
 
 
 @app.get("/favicon.ico", include_in_schema=False)
@@ -66,13 +115,33 @@ async def favicon():
 
 # Serve React app static files (if needed)
 if os.path.exists("frontend/dist"):
-    app.mount("/static", StaticFiles(directory="frontend/dist"), name="static")
+    app.mount("/static", PrecompressedStaticFiles(directory="frontend/dist"), name="static")
+    index_page = InMemoryPage("frontend/dist/index.html")
 
 
     @app.get("/app", tags=["Frontend"])
-    def serve_react_app():
+    async def serve_react_app(request: Request):
         """Serve the React application"""
-        return FileResponse("frontend/dist/index.html")
+        return index_page.response(request)
+
+def include_async_routers(app: FastAPI) -> None:
+    """
+    Register the async handlers ahead of the sync routers.
+
+    The first matching route wins, so these take over the paths they cover
+    and the sync routers keep serving the rest (batch, import, export, ...).
+    They are left out of the schema, which already documents the same paths.
+    """
+    from app.routers import async_auth, async_notifications, async_tasks, async_users
+
+    app.include_router(async_auth.router, prefix="/auth", include_in_schema=False)
+    app.include_router(async_tasks.router, prefix="/tasks", include_in_schema=False)
+    app.include_router(async_notifications.router, prefix="/notifications", include_in_schema=False)
+    app.include_router(async_users.router, prefix="/users", include_in_schema=False)
+
+
+if settings.async_db:
+    include_async_routers(app)
 
 # Include API routers with proper prefixes
 app.include_router(
@@ -106,17 +175,6 @@ except ImportError:
     pass
 
 
-# Additional middleware for security headers
-@app.middleware("http")
-async def add_security_headers(request, call_next):
-    """Add security headers to all responses"""
-    response = await call_next(request)
-    response.headers["X-Content-Type-Options"] = "nosniff"
-    response.headers["X-Frame-Options"] = "DENY"
-    response.headers["X-XSS-Protection"] = "1; mode=block"
-    return response
-
-
 if __name__ == "__main__":
     import uvicorn
 
@@ -0,0 +1,292 @@
+"""In-process metrics in the Prometheus text exposition format
+
+Counters and fixed-bucket histograms are plain Python objects guarded by a
+lock, cheap enough to update on every request and every SQL statement.
+``/metrics`` renders them on demand; there is no background collector.
+
+The same SQL timing feeds the slow-query log and the ``Server-Timing``
+response header.
+"""
+
+import bisect
+import logging
+import re
+import threading
+import time
+from contextvars import ContextVar
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import anyio.to_thread
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+COUNT_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100, 500, 1000, 5000)
+
+LabelValues = Tuple[str, ...]
+
+
+def _format_labels(names: Sequence[str], values: LabelValues, extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_number(value: float) -> str:
+    return repr(float(value)) if value != int(value) else str(int(value))
+
+
+class Counter:
+    def __init__(self, name: str, help_text: str, labels: Sequence[str] = ()):
+        self.name, self.help_text, self.labels = name, help_text, tuple(labels)
+        self._values: Dict[LabelValues, float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, *label_values: str, amount: float = 1) -> None:
+        with self._lock:
+            self._values[label_values] = self._values.get(label_values, 0) + amount
+
+    def value(self, *label_values: str) -> float:
+        with self._lock:
+            return self._values.get(label_values, 0)
+
+    def render(self) -> Iterable[str]:
+        yield f"# HELP {self.name} {self.help_text}"
+        yield f"# TYPE {self.name} counter"
+        with self._lock:
+            items = sorted(self._values.items())
+        for label_values, value in items:
+            yield f"{self.name}{_format_labels(self.labels, label_values)} {_format_number(value)}"
+
+
+class Histogram:
+    def __init__(self, name: str, help_text: str, labels: Sequence[str] = (),
+                 buckets: Sequence[float] = LATENCY_BUCKETS):
+        self.name, self.help_text, self.labels = name, help_text, tuple(labels)
+        self.buckets = tuple(buckets)
+        # Per label set: [count per bucket..., +Inf count], sum
+        self._series: Dict[LabelValues, Tuple[List[int], List[float]]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, *label_values: str) -> None:
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(label_values)
+            if series is None:
+                series = self._series[label_values] = ([0] * (len(self.buckets) + 1), [0.0])
+            series[0][index] += 1
+            series[1][0] += value
+
+    def count(self, *label_values: str) -> int:
+        with self._lock:
+            series = self._series.get(label_values)
+            return sum(series[0]) if series else 0
+
+    def render(self) -> Iterable[str]:
+        yield f"# HELP {self.name} {self.help_text}"
+        yield f"# TYPE {self.name} histogram"
+        with self._lock:
+            items = sorted((labels, (list(counts), total[0])) for labels, (counts, total) in self._series.items())
+        for label_values, (counts, total) in items:
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += count
+                le = "+Inf" if bound == float("inf") else _format_number(bound)
+                labels = _format_labels(self.labels, label_values, 'le="' + le + '"')
+                yield f"{self.name}_bucket{labels} {cumulative}"
+            yield f"{self.name}_sum{_format_labels(self.labels, label_values)} {_format_number(total)}"
+            yield f"{self.name}_count{_format_labels(self.labels, label_values)} {cumulative}"
+
+
+class Gauge:
+    """A value read at scrape time from a callback"""
+
+    def __init__(self, name: str, help_text: str, read: Callable[[], float]):
+        self.name, self.help_text, self.read = name, help_text, read
+
+    def render(self) -> Iterable[str]:
+        yield f"# HELP {self.name} {self.help_text}"
+        yield f"# TYPE {self.name} gauge"
+        yield f"{self.name} {_format_number(self.read())}"
+
+
+class Registry:
+    def __init__(self):
+        self._metrics = []
+
+    def register(self, metric):
+        self._metrics.append(metric)
+        return metric
+
+    def render(self) -> str:
+        return "\n".join(line for metric in self._metrics for line in metric.render()) + "\n"
+
+
+REGISTRY = Registry()
+_in_flight = [0]
+# Set by the scheduler leader, see observe_reminder_backlog
+_reminder_backlog = {"pending": 0, "watermark": 0.0}
+
+http_requests = REGISTRY.register(Counter(
+    "http_requests_total", "HTTP requests by route template and status", ("method", "route", "status")))
+http_request_duration = REGISTRY.register(Histogram(
+    "http_request_duration_seconds", "HTTP request latency by route template", ("method", "route")))
+http_requests_in_flight = REGISTRY.register(Gauge(
+    "http_requests_in_flight", "HTTP requests currently being served", lambda: _in_flight[0]))
+db_queries_per_request = REGISTRY.register(Histogram(
+    "db_queries_per_request", "SQL statements executed per request", ("route",), COUNT_BUCKETS))
+db_time_per_request = REGISTRY.register(Histogram(
+    "db_query_seconds_per_request", "Total SQL time per request", ("route",)))
+scheduler_job_duration = REGISTRY.register(Histogram(
+    "scheduler_job_duration_seconds", "Scheduler job run time", ("job",)))
+scheduler_batch_size = REGISTRY.register(Histogram(
+    "scheduler_batch_size", "Items handled per scheduler run", ("job",), COUNT_BUCKETS))
+email_send_duration = REGISTRY.register(Histogram(
+    "email_send_duration_seconds", "SMTP send latency", ()))
+email_send_failures = REGISTRY.register(Counter(
+    "email_send_failures_total", "Emails that failed to send", ()))
+# Sync handlers share anyio's default thread limiter; read on the event loop
+threadpool_in_use = REGISTRY.register(Gauge(
+    "threadpool_threads_in_use", "Worker threads busy with sync handlers",
+    lambda: anyio.to_thread.current_default_thread_limiter().borrowed_tokens))
+threadpool_capacity = REGISTRY.register(Gauge(
+    "threadpool_threads_total", "Worker thread limit for sync handlers",
+    lambda: anyio.to_thread.current_default_thread_limiter().total_tokens))
+reminder_backlog = REGISTRY.register(Gauge(
+    "reminder_backlog", "Missed reminders still waiting to be caught up",
+    lambda: _reminder_backlog["pending"]))
+reminder_watermark = REGISTRY.register(Gauge(
+    "reminder_watermark_timestamp_seconds", "Unix time before which every reminder has been sent",
+    lambda: _reminder_backlog["watermark"]))
+
+UNMATCHED_ROUTE = "<unmatched>"
+BACKGROUND_ROUTE = "<background>"
+
+
+class RequestDbStats:
+    """SQL statements and time spent on them while serving one request"""
+
+    __slots__ = ("scope", "queries", "seconds")
+
+    def __init__(self, scope=None):
+        self.scope = scope
+        self.queries = 0
+        self.seconds = 0.0
+
+
+# Per-request SQL accounting. The middleware installs a fresh RequestDbStats;
+# sync handlers run in the threadpool with a copy of the context, which still
+# points at the same object.
+request_db_stats: ContextVar[Optional[RequestDbStats]] = ContextVar("request_db_stats", default=None)
+
+_LITERALS = re.compile(r"'(?:[^']|'')*'|\b\d+(?:\.\d+)?\b")
+_PLACEHOLDER_LISTS = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_BIND_PARAMS = re.compile(r"%\(\w+\)s|\$\d+|(?<!:):\w+|%s")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_sql(statement: str) -> str:
+    """Collapse a statement to its shape: literals, bind params and IN-lists become ?"""
+    statement = _BIND_PARAMS.sub("?", statement)
+    statement = _LITERALS.sub("?", statement)
+    statement = _WHITESPACE.sub(" ", statement).strip()
+    return _PLACEHOLDER_LISTS.sub("(?)", statement)
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _start_query_timer(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _stop_query_timer(conn, cursor, statement, parameters, context, executemany):
+    elapsed = time.perf_counter() - conn.info["query_start"].pop()
+    stats = request_db_stats.get()
+    if stats is not None:
+        stats.queries += 1
+        stats.seconds += elapsed
+    if settings.slow_query_ms and elapsed * 1000 >= settings.slow_query_ms:
+        route = route_template(stats.scope) if stats is not None and stats.scope else BACKGROUND_ROUTE
+        logger.warning(f"Slow query ({elapsed * 1000:.1f} ms) on {route}: {normalize_sql(statement)}")
+
+
+@event.listens_for(Engine, "handle_error")
+def _drop_query_timer(exception_context):
+    # A failed statement never reaches after_cursor_execute
+    connection = exception_context.connection
+    if connection is not None and connection.info.get("query_start"):
+        connection.info["query_start"].pop()
+
+
+def server_timing(db_seconds: float, total_seconds: float) -> bytes:
+    """``Server-Timing`` value splitting elapsed time into database and app time"""
+    app_seconds = max(total_seconds - db_seconds, 0.0)
+    return f"db;dur={db_seconds * 1000:.1f}, app;dur={app_seconds * 1000:.1f}".encode("latin-1")
+
+
+def route_template(scope) -> str:
+    """The matched route's path template, so ids don't explode label cardinality"""
+    route = scope.get("route")
+    return getattr(route, "path", None) or UNMATCHED_ROUTE
+
+
+class MetricsMiddleware:
+    """Pure ASGI middleware recording latency, status and SQL usage per route
+
+    When ``server_timing`` is on, the DB/app split up to the moment headers
+    go out is added to the response as ``Server-Timing``.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = [500]
+        db_stats = RequestDbStats(scope)
+        token = request_db_stats.set(db_stats)
+        start = time.perf_counter()
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                status_code[0] = message["status"]
+                if settings.server_timing:
+                    timing = server_timing(db_stats.seconds, time.perf_counter() - start)
+                    message["headers"] = [*message.get("headers", ()), (b"server-timing", timing)]
+            await send(message)
+
+        _in_flight[0] += 1
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            _in_flight[0] -= 1
+            request_db_stats.reset(token)
+            elapsed = time.perf_counter() - start
+            method, route = scope["method"], route_template(scope)
+            http_requests.inc(method, route, str(status_code[0]))
+            http_request_duration.observe(elapsed, method, route)
+            db_queries_per_request.observe(db_stats.queries, route)
+            db_time_per_request.observe(db_stats.seconds, route)
+
+
+def observe_job(job: str, duration: float, batch_size: int) -> None:
+    scheduler_job_duration.observe(duration, job)
+    scheduler_batch_size.observe(batch_size, job)
+
+
+def observe_reminder_backlog(pending: int, watermark: Optional[float]) -> None:
+    _reminder_backlog["pending"] = pending
+    if watermark is not None:
+        _reminder_backlog["watermark"] = watermark
@@ -0,0 +1,76 @@
+"""CORS and security headers in one pure ASGI middleware
+
+Replaces ``@app.middleware("http")``, which ran every request through
+Starlette's BaseHTTPMiddleware: an extra task and memory stream per request,
+and no backpressure for streaming responses. Headers are encoded once at
+startup and appended to ``http.response.start`` without parsing the
+response's own headers.
+"""
+
+from typing import List, Tuple
+
+from starlette.datastructures import Headers
+from starlette.middleware.cors import CORSMiddleware
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+RawHeaders = List[Tuple[bytes, bytes]]
+
+SECURITY_HEADERS = {
+    "X-Content-Type-Options": "nosniff",
+    "X-Frame-Options": "DENY",
+    "X-XSS-Protection": "1; mode=block",
+}
+
+
+def encode_headers(headers) -> RawHeaders:
+    return [(name.lower().encode("latin-1"), value.encode("latin-1")) for name, value in headers.items()]
+
+
+class SecurityHeadersMiddleware(CORSMiddleware):
+    """CORSMiddleware that also sets SECURITY_HEADERS, with a single send wrapper
+
+    Takes the same arguments as CORSMiddleware and keeps its origin rules:
+    preflights are answered here, and simple requests from an allowed
+    origin get the origin echoed back with ``Vary: Origin``.
+    """
+
+    def __init__(self, app: ASGIApp, security_headers=SECURITY_HEADERS, **cors_options):
+        super().__init__(app, **cors_options)
+        self.security_headers = encode_headers(security_headers)
+        self.cors_headers = encode_headers(self.simple_headers)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_headers = Headers(scope=scope)
+        origin = request_headers.get("origin")
+
+        if origin is not None and scope["method"] == "OPTIONS" \
+                and "access-control-request-method" in request_headers:
+            response = self.preflight_response(request_headers=request_headers)
+            response.raw_headers.extend(self.security_headers)
+            await response(scope, receive, send)
+            return
+
+        extra_headers = self.security_headers
+        if origin is not None:
+            extra_headers = extra_headers + self.cors_headers + self.origin_headers(origin, request_headers)
+
+        async def send_with_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message["headers"] = [*message.get("headers", ()), *extra_headers]
+            await send(message)
+
+        await self.app(scope, receive, send_with_headers)
+
+    def origin_headers(self, origin: str, request_headers: Headers) -> RawHeaders:
+        """Per-request half of CORSMiddleware.send: echo allowed origins back"""
+        if self.allow_all_origins and "cookie" not in request_headers:
+            # "*" is already part of cors_headers
+            return []
+        if self.allow_all_origins or self.is_allowed_origin(origin=origin):
+            return [(b"access-control-allow-origin", origin.encode("latin-1")), (b"vary", b"Origin")]
+        return []
+
@@ -1,4 +1,4 @@
-from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Integer, String, Text, func
+from sqlalchemy import JSON, Boolean, Column, DateTime, ForeignKey, Index, Integer, String, Text, func, text
 from .database import Base
 from datetime import datetime, timezone
 from sqlalchemy.orm import sessionmaker, relationship
@@ -7,17 +7,34 @@ from pydantic import BaseModel
 
 class Task(Base):
     __tablename__ = "tasks"
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     title = Column(String, index=True, nullable=False)
     description = Column(String, nullable=True)
-    due_at = Column(DateTime, nullable=False, index=True)
-    user_email = Column(String, nullable=False, index=True)
+    due_at = Column(DateTime, nullable=False)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    # Owner's email, kept for API compatibility and reminder emails; ownership is user_id
+    user_email = Column(String, nullable=False)
     reminded = Column(Boolean, default=False)
+    # Minutes before due_at to send reminders; NULL means settings.default_reminder_minutes
+    reminder_offsets = Column(JSON(none_as_null=True), nullable=True)
+    # Next reminder to send (see app.reminders); NULL when none is pending
+    remind_at = Column(DateTime, nullable=True)
     created = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc))
     updated_at = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), onupdate=datetime.now(timezone.utc))
 
     notifications = relationship("Notification", back_populates="task", cascade="all, delete-orphan")
 
+    __table_args__ = (
+        # Owner lookups, upcoming/overdue/stats ranges and pagination
+        Index("ix_tasks_user_id_due_at", "user_id", "due_at"),
+        # Scheduler scan: only tasks with a reminder pending
+        Index(
+            "ix_tasks_remind_at_pending", "remind_at",
+            postgresql_where=text("remind_at IS NOT NULL"),
+            sqlite_where=text("remind_at IS NOT NULL"),
+        ),
+    )
+
 
 class Notification(Base):
     __tablename__ = "notifications"
@@ -41,6 +58,38 @@ class User(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
 
+class UserTaskCounter(Base):
+    __tablename__ = "user_task_counters"
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    total_tasks = Column(Integer, nullable=False, default=0)
+
+
+class UserTaskDueBucket(Base):
+    """Per-user histogram of task due times, one row per UTC hour"""
+    __tablename__ = "user_task_due_buckets"
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    bucket_start = Column(DateTime, primary_key=True)
+    task_count = Column(Integer, nullable=False, default=0)
+
+
+class UserLastWrite(Base):
+    """When each user last committed a write, for read-your-writes routing"""
+    __tablename__ = "user_last_writes"
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    written_at = Column(DateTime, nullable=False)
+
+
+class SchedulerState(Base):
+    """Progress of a scheduler job that must survive restarts, one row per job"""
+    __tablename__ = "scheduler_state"
+    name = Column(String, primary_key=True)
+    # Everything the job handles before this time has been handled
+    watermark = Column(DateTime, nullable=False)
+    # Set while the leader catches up on a backlog up to this time
+    catchup_until = Column(DateTime, nullable=True)
+    updated_at = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), onupdate=datetime.now(timezone.utc))
+
+
 if __name__ == "__main__":
     from.database import engine
     Base.metadata.create_all(bind=engine)
\ No newline at end of file
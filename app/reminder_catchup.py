@@ -0,0 +1,120 @@
+"""Catch-up for reminders missed while no scheduler was running
+
+While the service is down (a deploy, a free-tier sleep) due reminders pile
+up with ``remind_at`` in the past. When a process becomes scheduler leader
+it takes everything due at that moment as its backlog and drains it oldest
+first, ``reminder_catchup_batch_size`` reminders every
+``reminder_catchup_interval_seconds``, so a long outage doesn't turn into a
+burst of thousands of emails.
+
+The ``reminders`` row of ``scheduler_state`` is shared by all workers:
+
+- ``catchup_until`` is the end of the backlog while it is being drained.
+  Regular claims (any worker's reminder timer, the leader's scan) only take
+  reminders after it, so anything coming due now is still sent on time.
+- ``watermark``: every reminder before it has been claimed. Each claim
+  advances it in the same transaction, so a restart mid catch-up knows
+  exactly how far the last committed batch got.
+"""
+
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional, Tuple
+
+from sqlalchemy import func, update
+from sqlalchemy.orm import Session
+
+from app.metrics import observe_reminder_backlog
+from app.models import SchedulerState, Task
+
+STATE = "reminders"
+
+
+def read_state(db: Session) -> Optional[SchedulerState]:
+    return db.get(SchedulerState, STATE)
+
+
+def oldest_pending(db: Session, until: datetime) -> Optional[datetime]:
+    return db.query(func.min(Task.remind_at)).filter(Task.remind_at <= until).scalar()
+
+
+def advance_watermark(db: Session, now: datetime) -> None:
+    """After a claim: everything before the oldest reminder still due has been sent"""
+    watermark = oldest_pending(db, now) or now
+    db.execute(
+        update(SchedulerState)
+        .where(SchedulerState.name == STATE, SchedulerState.watermark < watermark)
+        .values(watermark=watermark)
+    )
+
+
+def begin_catch_up(db: Session, now: datetime) -> Tuple[int, datetime]:
+    """Take everything due at now as the backlog; returns its size and the watermark"""
+    pending = db.query(func.count(Task.id)).filter(Task.remind_at <= now).scalar()
+    state = read_state(db)
+    if state is None:
+        state = SchedulerState(name=STATE, watermark=oldest_pending(db, now) or now)
+        db.add(state)
+    state.catchup_until = now if pending else None
+    db.commit()
+    return pending, state.watermark
+
+
+def end_catch_up(db: Session) -> None:
+    db.execute(update(SchedulerState).where(SchedulerState.name == STATE).values(catchup_until=None))
+    db.commit()
+
+
+def unix_time(value: Optional[datetime]) -> Optional[float]:
+    return value.replace(tzinfo=timezone.utc).timestamp() if value is not None else None
+
+
+class ReminderCatchUp:
+    """The leader's view of the catch-up, for /health and /metrics"""
+
+    def __init__(self):
+        # When this leadership term checked for a backlog; None until it has
+        self.checked_at: Optional[datetime] = None
+        self.cutoff: Optional[datetime] = None
+        self.pending = 0
+        self.sent = 0
+        self.watermark: Optional[datetime] = None
+
+    @property
+    def active(self) -> bool:
+        return self.cutoff is not None
+
+    def begin(self, now: datetime, pending: int, watermark: datetime) -> None:
+        self.checked_at, self.sent = now, 0
+        self.cutoff = now if pending else None
+        self.observe(pending, watermark)
+
+    def progress(self, claimed: int, watermark: Optional[datetime]) -> None:
+        self.sent += claimed
+        self.observe(max(self.pending - claimed, 0), watermark)
+
+    def finish(self) -> None:
+        self.cutoff = None
+        self.observe(0, None)
+
+    def reset(self) -> None:
+        """Check for a backlog again on the next scan (new leadership term, or after an error)"""
+        self.checked_at = None
+        self.finish()
+
+    def observe(self, pending: int, watermark: Optional[datetime]) -> None:
+        self.pending = pending
+        if watermark is not None:
+            self.watermark = watermark
+        observe_reminder_backlog(pending, unix_time(watermark))
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "active": self.active,
+            "pending": self.pending,
+            "sent": self.sent,
+            "cutoff": self.cutoff.isoformat() if self.cutoff else None,
+            "watermark": self.watermark.isoformat() if self.watermark else None,
+        }
+
+
+reminder_catchup = ReminderCatchUp()
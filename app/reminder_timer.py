@@ -0,0 +1,146 @@
+"""In-process timer that wakes the scheduler exactly when a reminder is due
+
+A min-heap of (remind_at, task_id) holds the reminders of the next window.
+A single loop timer is armed for the top entry; when it fires the
+``on_due`` callback claims everything due (see ``claim_reminder_batch``).
+The leader reloads the window from the database on every reconciliation
+scan, and routers update the heap in place as tasks are created, moved or
+deleted. Deleted or moved tasks leave stale heap entries behind that are
+skipped when they surface.
+
+Each worker only knows about the changes it served itself, which is enough:
+claiming is safe across processes, and the scan catches anything else.
+"""
+
+import asyncio
+import heapq
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+def as_naive_utc(value: datetime) -> datetime:
+    """Task times are stored as naive UTC; clients may send aware datetimes"""
+    if value.tzinfo is not None:
+        return value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+class ReminderTimer:
+    def __init__(self):
+        self.window = timedelta(hours=1)
+        self._heap: List[Tuple[datetime, int]] = []
+        # Current fire time per task; heap entries that don't match are stale
+        self._fire_at: Dict[int, datetime] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._on_due: Optional[Callable[[], Awaitable[int]]] = None
+        self._handle: Optional[asyncio.TimerHandle] = None
+        self._firing: Optional[asyncio.Task] = None
+        self.fired = 0
+
+    @property
+    def running(self) -> bool:
+        return self._loop is not None
+
+    def start(self, on_due: Callable[[], Awaitable[int]], window: timedelta) -> None:
+        """Begin arming timers on the running loop; must be called from it"""
+        self._loop = asyncio.get_running_loop()
+        self._on_due, self.window = on_due, window
+        self._rearm()
+
+    def stop(self) -> None:
+        if self._handle is not None:
+            self._handle.cancel()
+        self._loop, self._handle = None, None
+        self._heap.clear()
+        self._fire_at.clear()
+
+    # Thread-safe entry points for routers (sync handlers run in the threadpool)
+
+    def schedule(self, task_id: int, remind_at: Optional[datetime]) -> None:
+        """Arm (or, with remind_at None, disarm) a task's next reminder"""
+        self.schedule_many([(task_id, remind_at)])
+
+    def schedule_many(self, tasks: Iterable[Tuple[int, Optional[datetime]]]) -> None:
+        tasks = [(task_id, remind_at and as_naive_utc(remind_at)) for task_id, remind_at in tasks]
+        if self._loop is not None and tasks:
+            self._loop.call_soon_threadsafe(self._schedule_many, tasks)
+
+    def cancel(self, *task_ids: int) -> None:
+        if self._loop is not None and task_ids:
+            self._loop.call_soon_threadsafe(self._cancel, task_ids)
+
+    def load(self, tasks: Iterable[Tuple[int, datetime]]) -> None:
+        """Replace the heap with a freshly scanned window (loop thread only)"""
+        self._heap.clear()
+        self._fire_at.clear()
+        self._schedule_many([(task_id, as_naive_utc(remind_at)) for task_id, remind_at in tasks])
+
+    def stats(self) -> Dict[str, object]:
+        next_fire = self._peek()
+        return {
+            "running": self.running,
+            "pending": len(self._fire_at),
+            "next_fire_at": next_fire.isoformat() if next_fire else None,
+            "fired": self.fired,
+        }
+
+    # Loop-thread internals
+
+    def _schedule_many(self, tasks: List[Tuple[int, Optional[datetime]]]) -> None:
+        horizon = datetime.utcnow() + self.window
+        for task_id, fire_at in tasks:
+            if fire_at is None or fire_at > horizon:
+                # Beyond this window: the next scan loads it
+                self._fire_at.pop(task_id, None)
+                continue
+            self._fire_at[task_id] = fire_at
+            heapq.heappush(self._heap, (fire_at, task_id))
+        self._rearm()
+
+    def _cancel(self, task_ids) -> None:
+        for task_id in task_ids:
+            self._fire_at.pop(task_id, None)
+        self._rearm()
+
+    def _peek(self) -> Optional[datetime]:
+        while self._heap:
+            fire_at, task_id = self._heap[0]
+            if self._fire_at.get(task_id) == fire_at:
+                return fire_at
+            heapq.heappop(self._heap)
+        return None
+
+    def _rearm(self) -> None:
+        if self._loop is None or self._firing is not None:
+            return
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+        fire_at = self._peek()
+        if fire_at is not None:
+            delay = max((fire_at - datetime.utcnow()).total_seconds(), 0.0)
+            self._handle = self._loop.call_later(delay, self._fire)
+
+    def _fire(self) -> None:
+        self._handle = None
+        self._firing = self._loop.create_task(self._run_due())
+
+    async def _run_due(self) -> None:
+        now = datetime.utcnow()
+        while (fire_at := self._peek()) is not None and fire_at <= now:
+            _, task_id = heapq.heappop(self._heap)
+            del self._fire_at[task_id]
+        try:
+            self.fired += 1
+            await self._on_due()
+        except Exception as e:
+            logger.error(f"Error in reminder timer: {str(e)}")
+        finally:
+            self._firing = None
+            self._rearm()
+
+
+reminder_timer = ReminderTimer()
@@ -0,0 +1,64 @@
+"""
+Per-task reminder schedule, stored as Task.remind_at.
+
+A task is reminded ``reminder_offsets`` minutes before it is due (or
+settings.default_reminder_minutes when it has none). ``remind_at`` holds
+the earliest reminder not yet sent and is NULL when nothing is pending, so
+the scheduler only has to scan ``remind_at <= now``. Every write that
+changes due_at or the offsets recomputes it here.
+"""
+
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+
+from app.config import settings
+from app.reminder_timer import as_naive_utc
+
+
+def reminder_times(due_at: datetime, offsets: Optional[List[int]]) -> List[datetime]:
+    if offsets is None:
+        offsets = settings.default_reminder_minutes
+    due_at = as_naive_utc(due_at)
+    return sorted(due_at - timedelta(minutes=minutes) for minutes in set(offsets))
+
+
+def remind_at_after(due_at: datetime, offsets: Optional[List[int]], now: datetime) -> Optional[datetime]:
+    """The first reminder strictly after now, if any"""
+    return next((at for at in reminder_times(due_at, offsets) if at > now), None)
+
+
+def reminder_schedule(due_at: datetime, offsets: Optional[List[int]],
+                      now: Optional[datetime] = None) -> Dict[str, Any]:
+    """
+    remind_at/reminded for a task whose due time or offsets were just set.
+
+    Lead times that already passed collapse into one immediate reminder
+    while the task is still upcoming; past-due tasks get none.
+    """
+    now = now or datetime.utcnow()
+    remind_at = remind_at_after(due_at, offsets, now)
+    if remind_at is None and as_naive_utc(due_at) >= now and reminder_times(due_at, offsets):
+        remind_at = now
+    return {"remind_at": remind_at, "reminded": False}
+
+
+def _offset_set(offsets: Optional[List[int]]) -> Optional[set]:
+    return None if offsets is None else set(offsets)
+
+
+def reminder_changes(update: Dict[str, Any], due_at: datetime, offsets: Optional[List[int]]) -> Dict[str, Any]:
+    """
+    Extra column values for a task update, given the task's current due_at
+    and offsets. Moving a task or changing its lead times re-arms its
+    reminders; so does explicitly setting reminded back to false, while
+    reminded=true cancels them. Clients resend due_at on every edit, so only
+    a value that differs from the stored one counts as a move.
+    """
+    if update.get("reminded") is True:
+        return {"remind_at": None}
+    new_due_at = as_naive_utc(update.get("due_at", due_at))
+    new_offsets = update.get("reminder_offsets", offsets)
+    moved = new_due_at != as_naive_utc(due_at) or _offset_set(new_offsets) != _offset_set(offsets)
+    if moved or update.get("reminded") is False:
+        return reminder_schedule(new_due_at, new_offsets)
+    return {}
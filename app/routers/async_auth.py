@@ -0,0 +1,132 @@
+"""Async versions of the auth routes that touch the database, served when ASYNC_DB is enabled"""
+
+from datetime import timedelta
+
+from fastapi import APIRouter, BackgroundTasks, Body, Depends, HTTPException, status
+from fastapi.security import OAuth2PasswordRequestForm
+from jose import JWTError, jwt
+from pydantic import EmailStr
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.auth.dependencies import access_token_claims
+from app.dependencies import get_async_db
+from app.models import User
+from app.routers.auth import (
+    ACCESS_TOKEN_EXPIRE_MINUTES, ALGORITHM, SECRET_KEY, create_access_token, run_password_job,
+)
+from app.schemas import ResetPasswordRequest, Token, UserCreate
+from app.utils.email_utils import send_password_reset_email
+from app.utils.password_hashing import password_hasher
+
+router = APIRouter()
+
+
+async def get_user_by_email(db: AsyncSession, email: str) -> User | None:
+    """Get user by email address"""
+    return (await db.execute(select(User).where(User.email == email))).scalars().first()
+
+
+@router.post("/token", response_model=Token)
+async def login_for_access_token(
+        form_data: OAuth2PasswordRequestForm = Depends(),
+        db: AsyncSession = Depends(get_async_db)
+):
+    """Authenticate user and return access token"""
+    user = await get_user_by_email(db, form_data.username)
+    if user and not await run_password_job(
+            password_hasher.verify(form_data.password, user.hashed_password)
+    ):
+        user = None
+    if not user:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Incorrect email or password",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+    access_token = create_access_token(
+        data=access_token_claims(user), expires_delta=timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
+    )
+    return {"access_token": access_token, "token_type": "bearer"}
+
+
+@router.post("/register", status_code=status.HTTP_201_CREATED)
+async def register_user(user: UserCreate, db: AsyncSession = Depends(get_async_db)):
+    """Register a new user"""
+    if await get_user_by_email(db, user.email):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Email already registered"
+        )
+
+    db_user = User(
+        first_name=user.first_name,
+        last_name=user.last_name,
+        email=user.email,
+        hashed_password=await run_password_job(password_hasher.hash(user.password)),
+        age=user.age,
+    )
+    db.add(db_user)
+    await db.commit()
+    await db.refresh(db_user)
+
+    return {
+        "message": "User created successfully",
+        "user_id": db_user.id,
+        "email": db_user.email
+    }
+
+
+@router.post("/forgot-password")
+async def forgot_password(
+        background_tasks: BackgroundTasks,
+        email: EmailStr = Body(..., embed=True),
+        db: AsyncSession = Depends(get_async_db)
+):
+    """Send password reset email"""
+    user = await get_user_by_email(db, email)
+    if user:
+        reset_token = create_access_token(
+            data={"sub": user.email, "type": "password_reset"},
+            expires_delta=timedelta(hours=1)
+        )
+        background_tasks.add_task(
+            send_password_reset_email,
+            email_to=user.email,
+            reset_token=reset_token,
+            user_name=user.first_name
+        )
+
+    # Always return the same message for security
+    return {"message": "If that email is registered, a password reset link has been sent."}
+
+
+@router.post("/reset-password")
+async def reset_password(data: ResetPasswordRequest, db: AsyncSession = Depends(get_async_db)):
+    """Reset user password using reset token"""
+    try:
+        payload = jwt.decode(data.token, SECRET_KEY, algorithms=[ALGORITHM])
+        email: str = payload.get("sub")
+        if not email or payload.get("type") != "password_reset":
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Invalid reset token"
+            )
+    except JWTError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid or expired reset token"
+        )
+
+    user = await get_user_by_email(db, email)
+    if not user:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="User not found"
+        )
+
+    user.hashed_password = await run_password_job(password_hasher.hash(data.new_password))
+    await db.commit()
+
+    return {"message": "Password reset successful"}
@@ -0,0 +1,134 @@
+"""Async versions of the notification routes, served when ASYNC_DB is enabled"""
+
+from typing import List, Optional, Union
+
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.auth.dependencies import get_current_active_user_async
+from app.dependencies import get_async_db
+from app.models import Notification, Task, User
+from app.routers.notifications import FIELDS_QUERY
+from app.schemas import NotificationCreate, NotificationOut, NotificationPage
+from app.utils.fast_json import (
+    item_response, list_response, page_response, parse_fields, query_entities, result_items,
+)
+from app.utils.pagination import LIMIT_QUERY, SKIP_QUERY, keyset_page
+
+router = APIRouter()
+
+
+async def owned_notification(db: AsyncSession, notification_id: int, user_id: int, entities=(Notification,)):
+    result = await db.execute(
+        select(*entities)
+        .join(Notification.task)
+        .where(Notification.id == notification_id, Task.user_id == user_id)
+    )
+    found = result_items(result, list(entities))
+    if not found:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Notification not found"
+        )
+    return found[0]
+
+
+@router.get("/", response_model=Union[List[NotificationOut], NotificationPage])
+async def list_user_notifications(
+        skip: int = SKIP_QUERY,
+        limit: int = LIMIT_QUERY,
+        cursor: Optional[str] = None,
+        fields: Optional[str] = FIELDS_QUERY,
+        db: AsyncSession = Depends(get_async_db),
+        current_user: User = Depends(get_current_active_user_async)
+):
+    """Get notifications for the current user's tasks, newest first"""
+    selected = parse_fields(NotificationOut, fields)
+    entities = query_entities(
+        Notification, NotificationOut, selected, extra=(Notification.created_at, Notification.id)
+    )
+
+    if cursor is not None:
+        notifications, next_cursor = await db.run_sync(lambda session: keyset_page(
+            session.query(*entities).join(Notification.task).filter(Task.user_id == current_user.id),
+            Notification.created_at, Notification.id, cursor, limit, descending=True,
+        ))
+        return page_response(notifications, next_cursor, selected)
+
+    result = await db.execute(
+        select(*entities)
+        .join(Notification.task)
+        .where(Task.user_id == current_user.id)
+        .order_by(Notification.created_at.desc())
+        .offset(skip)
+        .limit(limit)
+    )
+    return list_response(result_items(result, entities), selected)
+
+
+@router.get("/{notification_id:int}", response_model=NotificationOut)
+async def get_notification(
+        notification_id: int,
+        fields: Optional[str] = FIELDS_QUERY,
+        db: AsyncSession = Depends(get_async_db),
+        current_user: User = Depends(get_current_active_user_async)
+):
+    """Get a specific notification if it belongs to the current user"""
+    selected = parse_fields(NotificationOut, fields)
+    if selected is None:
+        return await owned_notification(db, notification_id, current_user.id)
+
+    entities = query_entities(Notification, NotificationOut, selected)
+    notification = await owned_notification(db, notification_id, current_user.id, entities)
+    return item_response(notification, selected)
+
+
+@router.post("/", response_model=NotificationOut, status_code=status.HTTP_201_CREATED)
+async def create_notification(
+        notification: NotificationCreate,
+        db: AsyncSession = Depends(get_async_db),
+        current_user: User = Depends(get_current_active_user_async)
+):
+    """Create a new notification (admin/system use)"""
+    task_id = (await db.execute(
+        select(Task.id).where(Task.id == notification.task_id, Task.user_id == current_user.id)
+    )).scalar()
+    if task_id is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Task not found"
+        )
+
+    db_notification = Notification(task_id=task_id, message=notification.message)
+    db.add(db_notification)
+    await db.commit()
+    await db.refresh(db_notification)
+    return db_notification
+
+
+@router.delete("/{notification_id:int}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_notification(
+        notification_id: int,
+        db: AsyncSession = Depends(get_async_db),
+        current_user: User = Depends(get_current_active_user_async)
+):
+    """Delete a notification if it belongs to the current user"""
+    notification = await owned_notification(db, notification_id, current_user.id)
+    await db.delete(notification)
+    await db.commit()
+    return None
+
+
+@router.get("/unread/count")
+async def get_unread_count(
+        db: AsyncSession = Depends(get_async_db),
+        current_user: User = Depends(get_current_active_user_async)
+):
+    """Get count of unread notifications for the current user"""
+    count = (await db.execute(
+        select(func.count(Notification.id))
+        .join(Notification.task)
+        .where(Task.user_id == current_user.id)
+    )).scalar_one()
+    return {"unread_count": count}
@@ -0,0 +1,222 @@
+"""Async versions of the task routes, served when ASYNC_DB is enabled
+
+Registered ahead of app.routers.tasks so these handlers win for the paths
+they cover; batch, import and export stay on the sync router.
+"""
+
+from datetime import datetime, timedelta
+from typing import List, Optional, Union
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.auth.dependencies import get_current_active_user_async
+from app.dependencies import get_async_db
+from app.models import Task, User
+from app.reminder_timer import reminder_timer
+from app.reminders import reminder_changes, reminder_schedule
+from app.routers.tasks import FIELDS_QUERY, compute_task_stats
+from app.schemas import TaskCreate, TaskOut, TaskPage, TaskUpdate
+from app.task_counters import record_task_changes
+from app.utils.fast_json import (
+    item_response, list_response, page_response, parse_fields, query_entities, result_items,
+)
+from app.utils.pagination import LIMIT_QUERY, SKIP_QUERY, keyset_page
+
+router = APIRouter()
+
+
+async def owned_task(db: AsyncSession, task_id: int, user_id: int) -> Task:
+    task = (await db.execute(
+        select(Task).where(Task.id == task_id, Task.user_id == user_id)
+    )).scalars().first()
+    if not task:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Task not found"
+        )
+    return task
+
+
+@router.post("/", response_model=TaskOut, status_code=status.HTTP_201_CREATED)
+async def create_task(
+        task: TaskCreate,
+        db: AsyncSession = Depends(get_async_db),
+        current_user: User = Depends(get_current_active_user_async)
+):
+    """Create a new task"""
+    db_task = Task(
+        title=task.title,
+        description=task.description,
+        due_at=task.due_at,
+        user_id=current_user.id,
+        user_email=current_user.email,
+        reminder_offsets=task.reminder_offsets,
+        **reminder_schedule(task.due_at, task.reminder_offsets)
+    )
+    db.add(db_task)
+    await db.run_sync(record_task_changes, current_user.id, added=[db_task.due_at])
+    await db.commit()
+    await db.refresh(db_task)
+    reminder_timer.schedule(db_task.id, db_task.remind_at)
+    return db_task
+
+
+@router.get("/", response_model=Union[List[TaskOut], TaskPage])
+async def get_tasks(
+        skip: int = SKIP_QUERY,
+        limit: int = LIMIT_QUERY,
+        cursor: Optional[str] = None,
+        fields: Optional[str] = FIELDS_QUERY,
+        db: AsyncSession = Depends(get_async_db),
+        current_user: User = Depends(get_current_active_user_async)
+):
+    """Get tasks for the current user (see the sync route for parameters)"""
+    selected = parse_fields(TaskOut, fields)
+    entities = query_entities(Task, TaskOut, selected, extra=(Task.due_at, Task.id))
+
+    if cursor is not None:
+        # keyset_page is written against the sync Query API
+        tasks, next_cursor = await db.run_sync(lambda session: keyset_page(
+            session.query(*entities).filter(Task.user_id == current_user.id),
+            Task.due_at, Task.id, cursor, limit,
+        ))
+        return page_response(tasks, next_cursor, selected)
+
+    result = await db.execute(
+        select(*entities).where(Task.user_id == current_user.id).offset(skip).limit(limit)
+    )
+    return list_response(result_items(result, entities), selected)
+
+
+@router.get("/upcoming", response_model=List[TaskOut])
+async def get_upcoming_tasks(
+        hours: int = 24,
+        fields: Optional[str] = FIELDS_QUERY,
+        db: AsyncSession = Depends(get_async_db),
+        current_user: User = Depends(get_current_active_user_async)
+):
+    """Get tasks due in the next X hours"""
+    now = datetime.utcnow()
+    selected = parse_fields(TaskOut, fields)
+    entities = query_entities(Task, TaskOut, selected)
+
+    result = await db.execute(
+        select(*entities).where(
+            Task.user_id == current_user.id,
+            Task.due_at >= now,
+            Task.due_at <= now + timedelta(hours=hours)
+        ).order_by(Task.due_at)
+    )
+    return list_response(result_items(result, entities), selected)
+
+
+@router.get("/overdue", response_model=List[TaskOut])
+async def get_overdue_tasks(
+        fields: Optional[str] = FIELDS_QUERY,
+        db: AsyncSession = Depends(get_async_db),
+        current_user: User = Depends(get_current_active_user_async)
+):
+    """Get overdue tasks"""
+    now = datetime.utcnow()
+    selected = parse_fields(TaskOut, fields)
+    entities = query_entities(Task, TaskOut, selected)
+
+    result = await db.execute(
+        select(*entities).where(
+            Task.user_id == current_user.id,
+            Task.due_at < now
+        ).order_by(Task.due_at)
+    )
+    return list_response(result_items(result, entities), selected)
+
+
+@router.get("/stats")
+async def get_task_stats(
+        window_hours: int = Query(24, ge=1, le=24 * 365),
+        db: AsyncSession = Depends(get_async_db),
+        current_user: User = Depends(get_current_active_user_async)
+):
+    """Get task statistics for the current user"""
+    return await db.run_sync(compute_task_stats, current_user.id, window_hours)
+
+
+# ``:int`` keeps these from shadowing the sync router's /export, /batch, ...
+@router.get("/{task_id:int}", response_model=TaskOut)
+async def get_task(
+        task_id: int,
+        fields: Optional[str] = FIELDS_QUERY,
+        db: AsyncSession = Depends(get_async_db),
+        current_user: User = Depends(get_current_active_user_async)
+):
+    """Get a specific task"""
+    selected = parse_fields(TaskOut, fields)
+    if selected is None:
+        return await owned_task(db, task_id, current_user.id)
+
+    task = (await db.execute(
+        select(*query_entities(Task, TaskOut, selected))
+        .where(Task.id == task_id, Task.user_id == current_user.id)
+    )).first()
+    if not task:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Task not found"
+        )
+    return item_response(task, selected)
+
+
+@router.put("/{task_id:int}", response_model=TaskOut)
+async def update_task(
+        task_id: int,
+        task_update: TaskUpdate,
+        db: AsyncSession = Depends(get_async_db),
+        current_user: User = Depends(get_current_active_user_async)
+):
+    """Update a task"""
+    db_task = await owned_task(db, task_id, current_user.id)
+    old_due_at, old_owner_email = db_task.due_at, db_task.user_email
+
+    update_data = task_update.model_dump(exclude_unset=True)
+    update_data.update(reminder_changes(update_data, db_task.due_at, db_task.reminder_offsets))
+    for field, value in update_data.items():
+        setattr(db_task, field, value)
+
+    if db_task.user_email != old_owner_email:
+        # Task handed to another user: move ownership and counters
+        new_owner_id = (await db.execute(
+            select(User.id).where(User.email == db_task.user_email)
+        )).scalar()
+        if new_owner_id is None:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="No user with that email"
+            )
+        db_task.user_id = new_owner_id
+        await db.run_sync(record_task_changes, current_user.id, removed=[old_due_at])
+        await db.run_sync(record_task_changes, new_owner_id, added=[db_task.due_at])
+    elif db_task.due_at != old_due_at:
+        await db.run_sync(record_task_changes, current_user.id, added=[db_task.due_at], removed=[old_due_at])
+
+    db_task.updated_at = datetime.utcnow()
+    await db.commit()
+    await db.refresh(db_task)
+    if "remind_at" in update_data:
+        reminder_timer.schedule(db_task.id, db_task.remind_at)
+    return db_task
+
+
+@router.delete("/{task_id:int}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_task(
+        task_id: int,
+        db: AsyncSession = Depends(get_async_db),
+        current_user: User = Depends(get_current_active_user_async)
+):
+    """Delete a task"""
+    db_task = await owned_task(db, task_id, current_user.id)
+    await db.delete(db_task)
+    await db.run_sync(record_task_changes, current_user.id, removed=[db_task.due_at])
+    await db.commit()
+    reminder_timer.cancel(task_id)
+    return None
@@ -0,0 +1,95 @@
+"""Async versions of the user routes, served when ASYNC_DB is enabled"""
+
+from typing import List
+
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.auth.cache import principal_cache, revoked_principals
+from app.auth.dependencies import get_current_active_user_async, get_current_db_user_async
+from app.dependencies import get_async_db
+from app.models import User
+from app.schemas import UserOut, UserRead
+from app.utils.pagination import LIMIT_QUERY, SKIP_QUERY
+
+router = APIRouter()
+
+
+@router.get("/me", response_model=UserOut)
+async def get_current_user_profile(current_user: User = Depends(get_current_db_user_async)):
+    """Get current user's profile"""
+    return current_user
+
+
+@router.put("/me", response_model=UserOut)
+async def update_current_user_profile(
+        updates: dict,
+        current_user: User = Depends(get_current_db_user_async),
+        db: AsyncSession = Depends(get_async_db)
+):
+    """Update current user's profile (non-sensitive fields only)"""
+    allowed_fields = {'first_name', 'last_name', 'age'}
+
+    for field, value in updates.items():
+        if field in allowed_fields:
+            setattr(current_user, field, value)
+
+    await db.commit()
+    principal_cache.invalidate(current_user.email)
+    await db.refresh(current_user)
+    return current_user
+
+
+@router.get("/{user_id:int}", response_model=UserRead)
+async def get_user_profile(
+        user_id: int,
+        db: AsyncSession = Depends(get_async_db),
+        current_user: User = Depends(get_current_active_user_async)
+):
+    """Get another user's public profile (limited info)"""
+    if user_id == current_user.id and isinstance(current_user, User):
+        return current_user
+
+    user = (await db.execute(
+        select(User).where(User.id == user_id, User.is_active == True)
+    )).scalars().first()
+    if not user:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="User not found"
+        )
+
+    return {
+        "id": user.id,
+        "first_name": user.first_name,
+        "last_name": user.last_name,
+        "email": user.email
+    }
+
+
+@router.delete("/me", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_current_user_account(
+        current_user: User = Depends(get_current_db_user_async),
+        db: AsyncSession = Depends(get_async_db)
+):
+    """Deactivate current user's account (soft delete)"""
+    current_user.is_active = False
+    await db.commit()
+    principal_cache.invalidate(current_user.email)
+    revoked_principals.add(current_user.id)
+    return None
+
+
+@router.get("/", response_model=List[UserRead])
+async def list_all_users(
+        skip: int = SKIP_QUERY,
+        limit: int = LIMIT_QUERY,
+        db: AsyncSession = Depends(get_async_db),
+        current_user: User = Depends(get_current_active_user_async)
+):
+    """List all users (admin only - implement role checking)"""
+    result = await db.execute(
+        select(User).where(User.is_active == True).offset(skip).limit(limit)
+    )
+    return result.scalars().all()
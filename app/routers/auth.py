@@ -1,14 +1,16 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Body, BackgroundTasks, Request
+from fastapi.concurrency import run_in_threadpool
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
 from sqlalchemy.orm import Session
-from passlib.context import CryptContext
 from jose import jwt, JWTError
 from pydantic import EmailStr
 
 from app.models import User
+from app.auth.dependencies import access_token_claims
 from app.dependencies import get_db
 from app.schemas import Token, TokenData, UserCreate, ResetPasswordRequest, UserOut
 from app.utils.email_utils import send_password_reset_email
+from app.utils.password_hashing import PasswordHasherBusy, hash_password, password_hasher, verify_password
 from app.config import settings
 
 from datetime import datetime, timedelta
@@ -16,25 +18,14 @@ from datetime import datetime, timedelta
 # Use Pydantic settings instead of os.getenv
 SECRET_KEY = str(settings.jwt_secret.get_secret_value())
 ALGORITHM = "HS256"
-ACCESS_TOKEN_EXPIRE_MINUTES = 30  # Increased from 15 minutes
+ACCESS_TOKEN_EXPIRE_MINUTES = settings.access_token_expire_minutes
 
 router = APIRouter()
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/token")
 
 
 # 🔐 Helper functions (keep these for now to avoid breaking changes)
-def verify_password(plain: str, hashed: str) -> bool:
-    """Verify a plain password against its hash"""
-    return pwd_context.verify(plain, hashed)
-
-
-def hash_password(password: str) -> str:
-    """Hash a password using bcrypt"""
-    return pwd_context.hash(password)
-
-
 def get_user_by_email(db: Session, email: str) -> User | None:
     """Get user by email address"""
     return db.query(User).filter(User.email == email).first()
@@ -83,15 +74,31 @@ def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(
     return user
 
 
+async def run_password_job(job):
+    """Await a password hashing job, answering 503 when the pool is saturated"""
+    try:
+        return await job
+    except PasswordHasherBusy:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Too many authentication requests, please retry shortly",
+            headers={"Retry-After": "1"},
+        )
+
+
 # 🧠 Auth Routes (keep your existing routes exactly as they are)
 
 @router.post("/token", response_model=Token)
-def login_for_access_token(
+async def login_for_access_token(
         form_data: OAuth2PasswordRequestForm = Depends(),
         db: Session = Depends(get_db)
 ):
     """Authenticate user and return access token"""
-    user = authenticate_user(db, form_data.username, form_data.password)
+    user = await run_in_threadpool(get_user_by_email, db, form_data.username)
+    if user and not await run_password_job(
+            password_hasher.verify(form_data.password, user.hashed_password)
+    ):
+        user = None
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -101,7 +108,7 @@ def login_for_access_token(
 
     access_token_expires = timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
     access_token = create_access_token(
-        data={"sub": user.email}, expires_delta=access_token_expires
+        data=access_token_claims(user), expires_delta=access_token_expires
     )
     return {"access_token": access_token, "token_type": "bearer"}
 
@@ -113,10 +120,10 @@ def read_users_me(current_user: User = Depends(get_current_user)):
 
 
 @router.post("/register", status_code=status.HTTP_201_CREATED)
-def register_user(user: UserCreate, db: Session = Depends(get_db)):
+async def register_user(user: UserCreate, db: Session = Depends(get_db)):
     """Register a new user"""
     # Check if user already exists
-    existing_user = get_user_by_email(db, user.email)
+    existing_user = await run_in_threadpool(get_user_by_email, db, user.email)
     if existing_user:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -124,7 +131,7 @@ def register_user(user: UserCreate, db: Session = Depends(get_db)):
         )
 
     # Create new user
-    hashed_password = hash_password(user.password)
+    hashed_password = await run_password_job(password_hasher.hash(user.password))
     db_user = User(
         first_name=user.first_name,
         last_name=user.last_name,
@@ -133,9 +140,12 @@ def register_user(user: UserCreate, db: Session = Depends(get_db)):
         age=user.age,
     )
 
-    db.add(db_user)
-    db.commit()
-    db.refresh(db_user)
+    def save_user():
+        db.add(db_user)
+        db.commit()
+        db.refresh(db_user)
+
+    await run_in_threadpool(save_user)
 
     return {
         "message": "User created successfully",
@@ -173,7 +183,7 @@ async def forgot_password(
 
 
 @router.post("/reset-password")
-def reset_password(data: ResetPasswordRequest, db: Session = Depends(get_db)):
+async def reset_password(data: ResetPasswordRequest, db: Session = Depends(get_db)):
     """Reset user password using reset token"""
     try:
         payload = jwt.decode(data.token, SECRET_KEY, algorithms=[ALGORITHM])
@@ -192,7 +202,7 @@ def reset_password(data: ResetPasswordRequest, db: Session = Depends(get_db)):
             detail="Invalid or expired reset token"
         )
 
-    user = get_user_by_email(db, email)
+    user = await run_in_threadpool(get_user_by_email, db, email)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -200,8 +210,8 @@ def reset_password(data: ResetPasswordRequest, db: Session = Depends(get_db)):
         )
 
     # Update password
-    user.hashed_password = hash_password(data.new_password)
-    db.commit()
+    user.hashed_password = await run_password_job(password_hasher.hash(data.new_password))
+    await run_in_threadpool(db.commit)
 
     return {"message": "Password reset successful"}
 
@@ -211,6 +221,6 @@ def refresh_token(current_user: User = Depends(get_current_user)):
     """Refresh access token"""
     access_token_expires = timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
     access_token = create_access_token(
-        data={"sub": current_user.email}, expires_delta=access_token_expires
+        data=access_token_claims(current_user), expires_delta=access_token_expires
     )
     return {"access_token": access_token, "token_type": "bearer"}
\ No newline at end of file
@@ -1,49 +1,77 @@
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status
+from typing import List, Optional, Union
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.orm import Session
 
 from app.dependencies import get_db
-from app.models import Notification, User
-from app.schemas import NotificationOut, NotificationCreate
-from app.auth.dependencies import get_current_active_user
+from app.models import Notification, Task, User
+from app.schemas import NotificationOut, NotificationCreate, NotificationPage
+from app.auth.dependencies import get_current_active_user, get_read_db
+from app.utils.fast_json import item_response, list_response, page_response, parse_fields, query_entities
+from app.utils.pagination import LIMIT_QUERY, SKIP_QUERY, keyset_page
 
 router = APIRouter()
 
+FIELDS_QUERY = Query(None, description="Comma-separated NotificationOut fields to return, e.g. id,message")
 
-@router.get("/", response_model=List[NotificationOut])
+
+@router.get("/", response_model=Union[List[NotificationOut], NotificationPage])
 def list_user_notifications(
-        skip: int = 0,
-        limit: int = 100,
-        db: Session = Depends(get_db),
+        skip: int = SKIP_QUERY,
+        limit: int = LIMIT_QUERY,
+        cursor: Optional[str] = None,
+        fields: Optional[str] = FIELDS_QUERY,
+        db: Session = Depends(get_read_db),
         current_user: User = Depends(get_current_active_user)
 ):
-    """Get notifications for the current user's tasks"""
+    """
+    Get notifications for the current user's tasks, newest first.
+
+    Pass ``cursor`` (empty for the first page) for keyset paging on
+    (created_at, id); without it the legacy skip/limit list is returned.
+    ``fields`` limits the columns selected and returned.
+    """
+    selected = parse_fields(NotificationOut, fields)
     # Join with tasks to filter by user
-    notifications = (
-        db.query(Notification)
+    query = (
+        db.query(*query_entities(
+            Notification, NotificationOut, selected, extra=(Notification.created_at, Notification.id)
+        ))
         .join(Notification.task)
-        .filter(Notification.task.has(user_email=current_user.email))
+        .filter(Task.user_id == current_user.id)
+    )
+
+    if cursor is not None:
+        notifications, next_cursor = keyset_page(
+            query, Notification.created_at, Notification.id, cursor, limit, descending=True
+        )
+        return page_response(notifications, next_cursor, selected)
+
+    notifications = (
+        query
         .order_by(Notification.created_at.desc())
         .offset(skip)
         .limit(limit)
         .all()
     )
-    return notifications
+    return list_response(notifications, selected)
 
 
 @router.get("/{notification_id}", response_model=NotificationOut)
 def get_notification(
         notification_id: int,
+        fields: Optional[str] = FIELDS_QUERY,
         db: Session = Depends(get_db),
         current_user: User = Depends(get_current_active_user)
 ):
     """Get a specific notification if it belongs to the current user"""
+    selected = parse_fields(NotificationOut, fields)
+    entities = [Notification] if selected is None else query_entities(Notification, NotificationOut, selected)
     notification = (
-        db.query(Notification)
+        db.query(*entities)
         .join(Notification.task)
         .filter(
             Notification.id == notification_id,
-            Notification.task.has(user_email=current_user.email)
+            Task.user_id == current_user.id
         )
         .first()
     )
@@ -53,6 +81,8 @@ def get_notification(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Notification not found"
         )
+    if selected is not None:
+        return item_response(notification, selected)
     return notification
 
 
@@ -64,10 +94,9 @@ def create_notification(
 ):
     """Create a new notification (admin/system use)"""
     # Verify the task belongs to the current user
-    from app.models import Task
     task = db.query(Task).filter(
         Task.id == notification.task_id,
-        Task.user_email == current_user.email
+        Task.user_id == current_user.id
     ).first()
 
     if not task:
@@ -98,7 +127,7 @@ def delete_notification(
         .join(Notification.task)
         .filter(
             Notification.id == notification_id,
-            Notification.task.has(user_email=current_user.email)
+            Task.user_id == current_user.id
         )
         .first()
     )
@@ -125,7 +154,7 @@ def get_unread_count(
     count = (
         db.query(Notification)
         .join(Notification.task)
-        .filter(Notification.task.has(user_email=current_user.email))
+        .filter(Task.user_id == current_user.id)
         .count()
     )
     return {"unread_count": count}
\ No newline at end of file
@@ -1,15 +1,30 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, File, HTTPException, Query, UploadFile, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy import and_, case, delete, func, insert, select, update
 from sqlalchemy.orm import Session
-from typing import List
-from datetime import datetime, timedelta
+from typing import List, Optional, Union
+from datetime import datetime, timedelta, timezone
 
+from app.config import settings
 from app.dependencies import get_db
-from app.models import Task, User
-from app.schemas import TaskCreate, TaskOut, TaskUpdate
-from app.auth.dependencies import get_current_active_user
+from app.models import Notification, Task, User
+from app.reminder_timer import reminder_timer
+from app.reminders import reminder_changes, reminder_schedule
+from app.schemas import (
+    TaskBatchCreate, TaskBatchDelete, TaskBatchResult, TaskBatchUpdate,
+    TaskCreate, TaskImportResult, TaskOut, TaskPage, TaskUpdate,
+)
+from app.auth.dependencies import get_current_active_user, get_read_db
+from app.utils.fast_json import item_response, list_response, page_response, parse_fields, query_entities
+from app.utils.pagination import LIMIT_QUERY, SKIP_QUERY, keyset_page
+from app.utils.task_export import MEDIA_TYPES, stream_tasks
+from app.utils.task_import import import_tasks, imported_reminders
+from app.task_counters import read_task_stats, record_task_changes
 
 router = APIRouter()
 
+FIELDS_QUERY = Query(None, description="Comma-separated TaskOut fields to return, e.g. id,title,due_at")
+
 
 @router.post("/", response_model=TaskOut, status_code=status.HTTP_201_CREATED)
 def create_task(
@@ -22,104 +37,336 @@ def create_task(
         title=task.title,
         description=task.description,
         due_at=task.due_at,
-        user_email=current_user.email
+        user_id=current_user.id,
+        user_email=current_user.email,
+        reminder_offsets=task.reminder_offsets,
+        **reminder_schedule(task.due_at, task.reminder_offsets)
     )
     db.add(db_task)
+    record_task_changes(db, current_user.id, added=[db_task.due_at])
     db.commit()
     db.refresh(db_task)
+    reminder_timer.schedule(db_task.id, db_task.remind_at)
     return db_task
 
 
-@router.get("/", response_model=List[TaskOut])
+@router.get("/", response_model=Union[List[TaskOut], TaskPage])
 def get_tasks(
-        skip: int = 0,
-        limit: int = 100,
-        db: Session = Depends(get_db),
+        skip: int = SKIP_QUERY,
+        limit: int = LIMIT_QUERY,
+        cursor: Optional[str] = None,
+        fields: Optional[str] = FIELDS_QUERY,
+        db: Session = Depends(get_read_db),
         current_user: User = Depends(get_current_active_user)
 ):
-    """Get tasks for the current user"""
-    tasks = db.query(Task).filter(
-        Task.user_email == current_user.email
-    ).offset(skip).limit(limit).all()
-    return tasks
+    """
+    Get tasks for the current user.
+
+    Pass ``cursor`` (empty for the first page) to page by (due_at, id) and get
+    ``{"items": [...], "next_cursor": ...}`` back; without it the legacy
+    skip/limit list is returned. ``fields`` limits the columns selected and
+    returned.
+    """
+    selected = parse_fields(TaskOut, fields)
+    query = db.query(
+        *query_entities(Task, TaskOut, selected, extra=(Task.due_at, Task.id))
+    ).filter(Task.user_id == current_user.id)
+
+    if cursor is not None:
+        tasks, next_cursor = keyset_page(query, Task.due_at, Task.id, cursor, limit)
+        return page_response(tasks, next_cursor, selected)
+
+    tasks = query.offset(skip).limit(limit).all()
+    return list_response(tasks, selected)
 
 
 # FIXED: Move this endpoint BEFORE the /{task_id} endpoint to avoid conflicts
 @router.get("/upcoming", response_model=List[TaskOut])
 def get_upcoming_tasks(
         hours: int = 24,
-        db: Session = Depends(get_db),
+        fields: Optional[str] = FIELDS_QUERY,
+        db: Session = Depends(get_read_db),
         current_user: User = Depends(get_current_active_user)
 ):
     """Get tasks due in the next X hours"""
     now = datetime.utcnow()
     future = now + timedelta(hours=hours)
 
-    tasks = db.query(Task).filter(
-        Task.user_email == current_user.email,
+    selected = parse_fields(TaskOut, fields)
+    tasks = db.query(*query_entities(Task, TaskOut, selected)).filter(
+        Task.user_id == current_user.id,
         Task.due_at >= now,
         Task.due_at <= future
     ).order_by(Task.due_at).all()
 
-    return tasks
+    return list_response(tasks, selected)
 
 
 @router.get("/overdue", response_model=List[TaskOut])
 def get_overdue_tasks(
-        db: Session = Depends(get_db),
+        fields: Optional[str] = FIELDS_QUERY,
+        db: Session = Depends(get_read_db),
         current_user: User = Depends(get_current_active_user)
 ):
     """Get overdue tasks"""
     now = datetime.utcnow()
 
-    tasks = db.query(Task).filter(
-        Task.user_email == current_user.email,
+    selected = parse_fields(TaskOut, fields)
+    tasks = db.query(*query_entities(Task, TaskOut, selected)).filter(
+        Task.user_id == current_user.id,
         Task.due_at < now
     ).order_by(Task.due_at).all()
 
-    return tasks
+    return list_response(tasks, selected)
+
+
+def task_stat_buckets(now: datetime, window_hours: int) -> dict:
+    """Named predicates counted by /stats; add a bucket here to expose it"""
+    return {
+        "overdue_tasks": Task.due_at < now,
+        "upcoming_tasks": and_(Task.due_at >= now, Task.due_at <= now + timedelta(hours=window_hours)),
+    }
+
+
+def compute_task_stats(db: Session, user_id: int, window_hours: int) -> dict:
+    """Totals for /stats: from the maintained counters, else one aggregate query"""
+    now = datetime.utcnow()
+
+    # Maintained counters make this independent of how many tasks the user has
+    stats = read_task_stats(db, user_id, now, window_hours)
+    if stats is not None:
+        stats["window_hours"] = window_hours
+        return stats
+
+    # Not counted yet (pre-existing data awaiting reconciliation): one aggregate query
+    buckets = task_stat_buckets(now, window_hours)
+
+    row = db.query(
+        func.count(Task.id).label("total_tasks"),
+        *[
+            func.coalesce(func.sum(case((predicate, 1), else_=0)), 0).label(name)
+            for name, predicate in buckets.items()
+        ]
+    ).filter(
+        Task.user_id == user_id
+    ).one()
+
+    stats = dict(row._mapping)
+    stats["window_hours"] = window_hours
+    return stats
 
 
 @router.get("/stats")
 def get_task_stats(
-        db: Session = Depends(get_db),
+        window_hours: int = Query(24, ge=1, le=24 * 365),
+        db: Session = Depends(get_read_db),
         current_user: User = Depends(get_current_active_user)
 ):
     """Get task statistics for the current user"""
-    now = datetime.utcnow()
+    return compute_task_stats(db, current_user.id, window_hours)
 
-    total_tasks = db.query(Task).filter(
-        Task.user_email == current_user.email
-    ).count()
 
-    overdue_tasks = db.query(Task).filter(
-        Task.user_email == current_user.email,
-        Task.due_at < now
-    ).count()
+@router.get("/export")
+def export_tasks(
+        format: str = Query("ndjson", pattern="^(ndjson|csv)$"),
+        db: Session = Depends(get_db),
+        current_user: User = Depends(get_current_active_user)
+):
+    """Stream all of the current user's tasks as NDJSON or CSV"""
+    return StreamingResponse(
+        stream_tasks(db.get_bind(), current_user.id, format),
+        media_type=MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="tasks.{format}"'},
+    )
 
-    upcoming_tasks = db.query(Task).filter(
-        Task.user_email == current_user.email,
-        Task.due_at >= now,
-        Task.due_at <= now + timedelta(hours=24)
-    ).count()
 
-    return {
-        "total_tasks": total_tasks,
-        "overdue_tasks": overdue_tasks,
-        "upcoming_tasks": upcoming_tasks
+@router.post("/import", response_model=TaskImportResult)
+def import_tasks_upload(
+        file: UploadFile = File(...),
+        format: Optional[str] = Query(None, pattern="^(ndjson|csv)$"),
+        db: Session = Depends(get_db),
+        current_user: User = Depends(get_current_active_user)
+):
+    """
+    Import tasks from a CSV (with a header row) or NDJSON upload.
+
+    The format defaults to the file extension. Valid rows are loaded and
+    invalid ones listed in ``errors`` by row number (the first
+    TASK_IMPORT_MAX_ERRORS of them; ``failed`` counts all).
+    """
+    if format is None:
+        format = "csv" if (file.filename or "").lower().endswith(".csv") else "ndjson"
+
+    started = datetime.now(timezone.utc)
+    try:
+        result = import_tasks(
+            db, current_user.id, current_user.email, file.file, format,
+            chunk_size=settings.task_import_chunk_size, max_errors=settings.task_import_max_errors,
+        )
+    except UnicodeDecodeError:
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="File must be UTF-8 encoded"
+        )
+    db.commit()
+
+    if reminder_timer.running:
+        # Reminders due before the next scan would otherwise go out late
+        reminder_timer.schedule_many(imported_reminders(
+            db, current_user.id, started, datetime.utcnow() + reminder_timer.window
+        ))
+    return result
+
+
+# Batch endpoints: each request is one transaction with a few multi-row statements
+def check_batch_size(count: int):
+    if count > settings.task_batch_max_items:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"A batch may contain at most {settings.task_batch_max_items} items"
+        )
+
+
+@router.post("/batch", response_model=TaskBatchResult, status_code=status.HTTP_201_CREATED)
+def create_tasks_batch(
+        batch: TaskBatchCreate,
+        db: Session = Depends(get_db),
+        current_user: User = Depends(get_current_active_user)
+):
+    """Create many tasks with a single multi-row INSERT ... RETURNING"""
+    check_batch_size(len(batch.tasks))
+    if not batch.tasks:
+        return {"results": []}
+
+    now = datetime.now(timezone.utc)
+    rows = [
+        {
+            "title": task.title,
+            "description": task.description,
+            "due_at": task.due_at,
+            "user_id": current_user.id,
+            "user_email": current_user.email,
+            "reminder_offsets": task.reminder_offsets,
+            **reminder_schedule(task.due_at, task.reminder_offsets),
+            "created": now,
+            "updated_at": now,
+        }
+        for task in batch.tasks
+    ]
+    created = db.scalars(insert(Task).returning(Task, sort_by_parameter_order=True), rows).all()
+    record_task_changes(db, current_user.id, added=[task.due_at for task in created])
+
+    # Serialise before commit expires the freshly returned rows
+    results = [
+        {"index": i, "id": task.id, "status": "created", "task": TaskOut.model_validate(task)}
+        for i, task in enumerate(created)
+    ]
+    db.commit()
+    reminder_timer.schedule_many((result["id"], result["task"].remind_at) for result in results)
+    return {"results": results}
+
+
+@router.put("/batch", response_model=TaskBatchResult)
+def update_tasks_batch(
+        batch: TaskBatchUpdate,
+        db: Session = Depends(get_db),
+        current_user: User = Depends(get_current_active_user)
+):
+    """Update many of the current user's tasks; ids they don't own are reported as not_found"""
+    check_batch_size(len(batch.tasks))
+    ids = [item.id for item in batch.tasks]
+    owned = {
+        task_id: (due_at, offsets)
+        for task_id, due_at, offsets in db.execute(
+            select(Task.id, Task.due_at, Task.reminder_offsets)
+            .where(Task.id.in_(ids), Task.user_id == current_user.id)
+        ).all()
     }
 
+    now = datetime.utcnow()
+    params, added, removed = [], [], []
+    for item in batch.tasks:
+        if item.id not in owned:
+            continue
+        values = item.model_dump(exclude_unset=True)
+        values.update(reminder_changes(values, *owned[item.id]))
+        values["updated_at"] = now
+        params.append(values)
+        if "due_at" in values:
+            removed.append(owned[item.id][0])
+            added.append(values["due_at"])
+
+    if params:
+        # Ownership was checked above; the extra WHERE keeps the UPDATE itself scoped
+        db.execute(
+            update(Task).where(Task.user_id == current_user.id),
+            params,
+            execution_options={"synchronize_session": None},
+        )
+        record_task_changes(db, current_user.id, added=added, removed=removed)
+
+    updated = {
+        task.id: TaskOut.model_validate(task)
+        for task in db.scalars(
+            select(Task).where(Task.id.in_(list(owned))).execution_options(populate_existing=True)
+        ).all()
+    } if owned else {}
+    db.commit()
+    reminder_timer.schedule_many(
+        (values["id"], values["remind_at"]) for values in params if "remind_at" in values
+    )
+
+    return {"results": [
+        {"index": i, "id": item.id, "status": "updated", "task": updated[item.id]}
+        if item.id in updated else
+        {"index": i, "id": item.id, "status": "not_found"}
+        for i, item in enumerate(batch.tasks)
+    ]}
+
+
+@router.post("/batch/delete", response_model=TaskBatchResult)
+def delete_tasks_batch(
+        batch: TaskBatchDelete,
+        db: Session = Depends(get_db),
+        current_user: User = Depends(get_current_active_user)
+):
+    """Delete many of the current user's tasks with one DELETE ... RETURNING"""
+    check_batch_size(len(batch.ids))
+    if not batch.ids:
+        return {"results": []}
+
+    owned = select(Task.id).where(Task.id.in_(batch.ids), Task.user_id == current_user.id)
+    # Bulk deletes bypass ORM cascades; clear notifications explicitly
+    db.execute(delete(Notification).where(Notification.task_id.in_(owned)))
+    deleted = dict(db.execute(
+        delete(Task)
+        .where(Task.id.in_(batch.ids), Task.user_id == current_user.id)
+        .returning(Task.id, Task.due_at)
+    ).all())
+    record_task_changes(db, current_user.id, removed=list(deleted.values()))
+    db.commit()
+    reminder_timer.cancel(*deleted)
+
+    return {"results": [
+        {"index": i, "id": task_id, "status": "deleted" if task_id in deleted else "not_found"}
+        for i, task_id in enumerate(batch.ids)
+    ]}
+
 
 @router.get("/{task_id}", response_model=TaskOut)
 def get_task(
         task_id: int,
+        fields: Optional[str] = FIELDS_QUERY,
         db: Session = Depends(get_db),
         current_user: User = Depends(get_current_active_user)
 ):
     """Get a specific task"""
-    task = db.query(Task).filter(
+    selected = parse_fields(TaskOut, fields)
+    entities = [Task] if selected is None else query_entities(Task, TaskOut, selected)
+    task = db.query(*entities).filter(
         Task.id == task_id,
-        Task.user_email == current_user.email
+        Task.user_id == current_user.id
     ).first()
 
     if not task:
@@ -127,6 +374,8 @@ def get_task(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Task not found"
         )
+    if selected is not None:
+        return item_response(task, selected)
     return task
 
 
@@ -140,7 +389,7 @@ def update_task(
     """Update a task"""
     db_task = db.query(Task).filter(
         Task.id == task_id,
-        Task.user_email == current_user.email
+        Task.user_id == current_user.id
     ).first()
 
     if not db_task:
@@ -149,14 +398,33 @@ def update_task(
             detail="Task not found"
         )
 
-    # Update fields
+    old_due_at, old_owner_email = db_task.due_at, db_task.user_email
+
+    # Update fields, re-arming reminders when the due time or lead times change
     update_data = task_update.model_dump(exclude_unset=True)
+    update_data.update(reminder_changes(update_data, db_task.due_at, db_task.reminder_offsets))
     for field, value in update_data.items():
         setattr(db_task, field, value)
 
+    if db_task.user_email != old_owner_email:
+        # Task handed to another user: move ownership and counters
+        new_owner_id = db.query(User.id).filter(User.email == db_task.user_email).scalar()
+        if new_owner_id is None:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="No user with that email"
+            )
+        db_task.user_id = new_owner_id
+        record_task_changes(db, current_user.id, removed=[old_due_at])
+        record_task_changes(db, new_owner_id, added=[db_task.due_at])
+    elif db_task.due_at != old_due_at:
+        record_task_changes(db, current_user.id, added=[db_task.due_at], removed=[old_due_at])
+
     db_task.updated_at = datetime.utcnow()
     db.commit()
     db.refresh(db_task)
+    if "remind_at" in update_data:
+        reminder_timer.schedule(db_task.id, db_task.remind_at)
     return db_task
 
 
@@ -169,7 +437,7 @@ def delete_task(
     """Delete a task"""
     db_task = db.query(Task).filter(
         Task.id == task_id,
-        Task.user_email == current_user.email
+        Task.user_id == current_user.id
     ).first()
 
     if not db_task:
@@ -179,5 +447,7 @@ def delete_task(
         )
 
     db.delete(db_task)
+    record_task_changes(db, current_user.id, removed=[db_task.due_at])
     db.commit()
+    reminder_timer.cancel(task_id)
     return None
\ No newline at end of file
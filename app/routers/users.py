@@ -5,13 +5,15 @@ from typing import List
 from app.dependencies import get_db
 from app.models import User
 from app.schemas import UserOut, UserRead
-from app.auth.dependencies import get_current_active_user
+from app.auth.dependencies import get_current_active_user, get_current_db_user
+from app.auth.cache import principal_cache, revoked_principals
+from app.utils.pagination import LIMIT_QUERY, SKIP_QUERY
 
 router = APIRouter()
 
 
 @router.get("/me", response_model=UserOut)
-def get_current_user_profile(current_user: User = Depends(get_current_active_user)):
+def get_current_user_profile(current_user: User = Depends(get_current_db_user)):
     """Get current user's profile"""
     return current_user
 
@@ -19,7 +21,7 @@ def get_current_user_profile(current_user: User = Depends(get_current_active_use
 @router.put("/me", response_model=UserOut)
 def update_current_user_profile(
         updates: dict,
-        current_user: User = Depends(get_current_active_user),
+        current_user: User = Depends(get_current_db_user),
         db: Session = Depends(get_db)
 ):
     """Update current user's profile (non-sensitive fields only)"""
@@ -31,6 +33,7 @@ def update_current_user_profile(
             setattr(current_user, field, value)
 
     db.commit()
+    principal_cache.invalidate(current_user.email)
     db.refresh(current_user)
     return current_user
 
@@ -43,7 +46,7 @@ def get_user_profile(
 ):
     """Get another user's public profile (limited info)"""
     # Users can only see their own profile or limited info of others
-    if user_id == current_user.id:
+    if user_id == current_user.id and isinstance(current_user, User):
         return current_user
 
     user = db.query(User).filter(User.id == user_id, User.is_active == True).first()
@@ -64,21 +67,23 @@ def get_user_profile(
 
 @router.delete("/me", status_code=status.HTTP_204_NO_CONTENT)
 def delete_current_user_account(
-        current_user: User = Depends(get_current_active_user),
+        current_user: User = Depends(get_current_db_user),
         db: Session = Depends(get_db)
 ):
     """Deactivate current user's account (soft delete)"""
     # Soft delete - set is_active to False instead of actually deleting
     current_user.is_active = False
     db.commit()
+    principal_cache.invalidate(current_user.email)
+    revoked_principals.add(current_user.id)
     return None
 
 
 # Admin endpoints (would need admin role checking)
 @router.get("/", response_model=List[UserRead])
 def list_all_users(
-        skip: int = 0,
-        limit: int = 100,
+        skip: int = SKIP_QUERY,
+        limit: int = LIMIT_QUERY,
         db: Session = Depends(get_db),
         current_user: User = Depends(get_current_active_user)
 ):
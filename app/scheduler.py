@@ -2,10 +2,22 @@ import asyncio
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from datetime import datetime, timedelta
 import logging
+import time
 
+from typing import List, Optional
+
+from sqlalchemy import insert, select, update
+from sqlalchemy.engine import Row
 from sqlalchemy.orm import Session
-from .database import SessionLocal
-from .models import Task, Notification
+from .config import settings
+from .database import SessionLocal, engine
+from .leader import create_leader_election
+from .reminder_catchup import advance_watermark, begin_catch_up, end_catch_up, read_state, reminder_catchup
+from .reminder_timer import reminder_timer
+from .reminders import remind_at_after
+from .metrics import observe_job
+from .models import Task, Notification, User
+from .task_counters import reconcile_task_counters
 from .utils.email_utils import send_task_reminder_email
 
 # Set up logging
@@ -14,65 +26,281 @@ logger = logging.getLogger(__name__)
 
 sched = AsyncIOScheduler()
 
+leader = create_leader_election(engine)
+# Reminder emails in flight; asyncio only keeps weak references to tasks
+pending_emails = set()
+catch_up_task: Optional[asyncio.Task] = None
+
 
 def start_scheduler():
-    sched.add_job(send_due_reminders, 'interval', minutes=1)
+    # Bind to the current loop so the app can be started more than once per process (tests)
+    sched.configure(event_loop=asyncio.get_running_loop())
+    if leader.enabled:
+        sched.add_job(elect_leader, 'interval', seconds=settings.leader_check_seconds, id="elect_leader",
+                      replace_existing=True, next_run_time=datetime.now())
+    scan = {"minutes": 1}
+    if settings.reminder_timer:
+        # The timer sends reminders on time; the scan is a safety net that also
+        # refills it, so run the first one right away
+        scan = {"minutes": settings.reminder_scan_minutes, "next_run_time": datetime.now()}
+        reminder_timer.start(process_due_reminders, timedelta(minutes=2 * scan["minutes"]))
+    sched.add_job(send_due_reminders, 'interval', id="send_due_reminders", replace_existing=True, **scan)
+    sched.add_job(reconcile_counters, 'interval', hours=1, id="reconcile_counters", replace_existing=True)
     sched.start()
-    logger.info("Scheduler started - checking for due reminders every minute")
+    logger.info(f"Scheduler started - scanning for due reminders every {scan['minutes']} minutes")
+
+
+def stop_scheduler():
+    if sched.running:
+        sched.shutdown(wait=False)
+    stop_catch_up()
+    reminder_timer.stop()
+    # Hand over right away instead of after the followers' next check
+    leader.release()
+
+
+async def elect_leader():
+    was_leader = leader.is_leader
+    await asyncio.get_running_loop().run_in_executor(None, leader.check)
+    if was_leader and not leader.is_leader:
+        # The next leader takes over the backlog
+        stop_catch_up()
+    if leader.is_leader and not was_leader:
+        # Catch up and load the reminder timer now rather than at the next scan
+        await send_due_reminders()
+
+
+def due_reminders_query(db: Session, now: datetime, after: Optional[datetime] = None):
+    """Ids of tasks with a reminder due: a range scan of the pending remind_at index"""
+    query = db.query(Task.id).filter(Task.remind_at <= now)
+    if after is not None:
+        query = query.filter(Task.remind_at > after)
+    return query
+
+
+def claim_reminder_batch(db: Session, now: datetime, limit: int, after: Optional[datetime] = None) -> List[Row]:
+    """
+    Claim up to ``limit`` reminders due by ``now`` (and after ``after``, if
+    given) in one statement and return their tasks.
+
+    On PostgreSQL the candidate rows are locked with SKIP LOCKED, so several
+    workers running this concurrently claim disjoint batches instead of
+    waiting on (or double-sending) each other's rows. The outer
+    ``remind_at <= now`` is re-checked after any lock wait. Tasks with a
+    later lead time still to come are re-armed for it, and the reminders
+    watermark moves up in the same transaction.
+    """
+    candidates = (
+        due_reminders_query(db, now, after)
+        .order_by(Task.remind_at)
+        .limit(limit)
+        .with_for_update(skip_locked=True)
+        .subquery()
+    )
+    def owner(column):
+        return select(column).where(User.id == Task.user_id).scalar_subquery()
+
+    claimed = db.execute(
+        update(Task)
+        .where(Task.id.in_(select(candidates.c.id)), Task.remind_at <= now)
+        .values(reminded=True, remind_at=None)
+        .returning(
+            Task.id, Task.title, Task.description, Task.due_at, Task.reminder_offsets,
+            owner(User.email).label("owner_email"), owner(User.first_name).label("owner_name"),
+        )
+        .execution_options(synchronize_session=False)
+    ).all()
+    rearmed = [
+        {"id": task.id, "remind_at": remind_at}
+        for task in claimed
+        if (remind_at := remind_at_after(task.due_at, task.reminder_offsets, now)) is not None
+    ]
+    if rearmed:
+        db.execute(update(Task), rearmed, execution_options={"synchronize_session": None})
+    if claimed:
+        db.execute(insert(Notification), [
+            {
+                "task_id": task.id,
+                "message": f"Task '{task.title}' due at {task.due_at.strftime('%Y-%m-%d %H:%M')}.",
+            }
+            for task in claimed
+        ])
+    advance_watermark(db, now)
+    db.commit()
+    return claimed
+
+
+def schedule_reminder_email(task: Row) -> None:
+    """Queue the reminder email on the event loop, keeping a reference until it finishes"""
+    email = asyncio.create_task(send_task_reminder_email(
+        email_to=task.owner_email,
+        task_title=task.title,
+        task_description=task.description,
+        due_at=task.due_at.strftime('%Y-%m-%d %H:%M UTC'),
+        user_name=task.owner_name
+    ))
+    pending_emails.add(email)
+    email.add_done_callback(pending_emails.discard)
+
+
+def send_claimed_reminders(batch: List[Row], now: datetime) -> None:
+    for task in batch:
+        schedule_reminder_email(task)
+    # Arm the next lead time of tasks that have more than one
+    reminder_timer.schedule_many(
+        (task.id, remind_at_after(task.due_at, task.reminder_offsets, now)) for task in batch
+    )
+
+
+def upcoming_reminders(db: Session, now: datetime, until: datetime) -> List[Row]:
+    """(id, remind_at) of reminders due after now and up to until, to load the timer"""
+    return db.query(Task.id, Task.remind_at).filter(Task.remind_at > now, Task.remind_at <= until).all()
 
 
 async def send_due_reminders():
-    def db_work():
+    """Scheduled scan (leader only): send anything due, then reload the reminder timer"""
+    if not leader.is_leader:
+        return
+
+    if reminder_catchup.checked_at is None:
+        await start_catch_up()
+    await process_due_reminders()
+
+    if reminder_timer.running:
+        def load_window(now: datetime) -> List[Row]:
+            db: Session = SessionLocal()
+            try:
+                return upcoming_reminders(db, now, now + reminder_timer.window)
+            finally:
+                db.close()
+
+        try:
+            upcoming = await asyncio.get_running_loop().run_in_executor(None, load_window, datetime.utcnow())
+            reminder_timer.load(upcoming)
+        except Exception as e:
+            logger.error(f"Error loading reminder timer: {str(e)}")
+
+
+async def process_due_reminders() -> int:
+    """Claim due tasks in batches, bulk-insert their notifications and queue the emails"""
+    def claim_batch(now: datetime) -> List[Row]:
+        db: Session = SessionLocal()
+        try:
+            # Leave a backlog being caught up to the leader's rate-limited drain
+            state = read_state(db)
+            after = state.catchup_until if state is not None else None
+            return claim_reminder_batch(db, now, settings.reminder_batch_size, after)
+        finally:
+            db.close()
+
+    start = time.perf_counter()
+    loop = asyncio.get_running_loop()
+    now = datetime.utcnow()
+    total = 0
+    try:
+        while True:
+            batch = await loop.run_in_executor(None, claim_batch, now)
+            # Emails go out while the next batch is being claimed
+            send_claimed_reminders(batch, now)
+            total += len(batch)
+            if len(batch) < settings.reminder_batch_size:
+                break
+    except Exception as e:
+        logger.error(f"Error in send_due_reminders: {str(e)}")
+
+    if total:
+        logger.info(f"Claimed {total} tasks requiring reminders")
+    observe_job("send_due_reminders", time.perf_counter() - start, total)
+    return total
+
+
+async def start_catch_up() -> None:
+    """First scan of a leadership term: drain whatever came due while no leader ran"""
+    global catch_up_task
+
+    def check(now: datetime):
         db: Session = SessionLocal()
         try:
-            now = datetime.utcnow()
-            # Check for tasks due in the next 5 minutes
-            soon = now + timedelta(minutes=5)
-
-            tasks = (
-                db.query(Task)
-                .filter(
-                    Task.due_at <= soon,
-                    Task.due_at >= now,
-                    Task.reminded == False
-                )
-                .all()
-            )
-
-            logger.info(f"Found {len(tasks)} tasks requiring reminders")
-
-            for task in tasks:
-                try:
-                    # Create record of notification first
-                    notif = Notification(
-                        task_id=task.id,
-                        message=f"Task '{task.title}' due at {task.due_at.strftime('%Y-%m-%d %H:%M')}.",
-                    )
-                    db.add(notif)
-
-                    # Mark task as reminded
-                    task.reminded = True
-                    db.commit()
-                    db.refresh(task)
-
-                    # Schedule email sending (async)
-                    asyncio.create_task(send_task_reminder_email(
-                        email_to=task.user_email,
-                        task_title=task.title,
-                        task_description=task.description,
-                        due_at=task.due_at.strftime('%Y-%m-%d %H:%M UTC'),
-                        user_name="User"  # You might want to get actual user name from User table
-                    ))
-
-                    logger.info(f"Reminder sent for task: {task.title}")
-
-                except Exception as e:
-                    logger.error(f"Error processing task {task.id}: {str(e)}")
-                    db.rollback()
+            return begin_catch_up(db, now)
+        finally:
+            db.close()
+
+    now = datetime.utcnow()
+    # Claimed before awaiting so a concurrent scan doesn't start a second drain
+    reminder_catchup.checked_at = now
+    try:
+        pending, watermark = await asyncio.get_running_loop().run_in_executor(None, check, now)
+    except Exception as e:
+        logger.error(f"Error checking the reminder backlog: {str(e)}")
+        reminder_catchup.reset()
+        return
+
+    reminder_catchup.begin(now, pending, watermark)
+    if pending:
+        logger.info(
+            f"Catching up {pending} reminders missed since {watermark.strftime('%Y-%m-%d %H:%M:%S')} UTC"
+        )
+        catch_up_task = asyncio.create_task(catch_up_reminders(now))
+
+
+def stop_catch_up() -> None:
+    global catch_up_task
+    if catch_up_task is not None:
+        catch_up_task.cancel()
+        catch_up_task = None
+    reminder_catchup.reset()
 
+
+async def catch_up_reminders(cutoff: datetime) -> None:
+    """Drain reminders due by cutoff, oldest first, one rate-limited batch at a time"""
+    def claim_batch() -> List[Row]:
+        db: Session = SessionLocal()
+        try:
+            batch = claim_reminder_batch(db, cutoff, settings.reminder_catchup_batch_size)
+            state = read_state(db)
+            reminder_catchup.progress(len(batch), state.watermark if state is not None else None)
+            if len(batch) < settings.reminder_catchup_batch_size:
+                end_catch_up(db)
+            return batch
+        finally:
+            db.close()
+
+    start = time.perf_counter()
+    loop = asyncio.get_running_loop()
+    total = 0
+    try:
+        while leader.is_leader:
+            batch = await loop.run_in_executor(None, claim_batch)
+            send_claimed_reminders(batch, cutoff)
+            total += len(batch)
+            if len(batch) < settings.reminder_catchup_batch_size:
+                logger.info(f"Caught up {total} missed reminders")
+                reminder_catchup.finish()
+                break
+            await asyncio.sleep(settings.reminder_catchup_interval_seconds)
+    except Exception as e:
+        logger.error(f"Error in catch_up_reminders: {str(e)}")
+        # Start over from the watermark on the next scan
+        reminder_catchup.reset()
+
+    observe_job("catch_up_reminders", time.perf_counter() - start, total)
+
+
+async def reconcile_counters():
+    """Repair drift in the per-user task counters behind /tasks/stats"""
+    if not leader.is_leader:
+        return
+
+    def db_work():
+        db: Session = SessionLocal()
+        try:
+            return reconcile_task_counters(db)
         except Exception as e:
-            logger.error(f"Error in send_due_reminders: {str(e)}")
+            logger.error(f"Error in reconcile_counters: {str(e)}")
+            return 0
         finally:
             db.close()
 
-    await asyncio.get_event_loop().run_in_executor(None, db_work)
\ No newline at end of file
+    start = time.perf_counter()
+    repaired = await asyncio.get_event_loop().run_in_executor(None, db_work)
+    observe_job("reconcile_counters", time.perf_counter() - start, repaired)
@@ -1,6 +1,9 @@
 from datetime import datetime
-from typing import Optional
-from pydantic import BaseModel, EmailStr, ConfigDict
+from typing import Annotated, List, Optional
+from pydantic import BaseModel, EmailStr, ConfigDict, Field, field_validator, model_validator
+
+# Lead times in minutes before due_at, up to a year, at most 10 per task
+ReminderOffsets = Annotated[List[Annotated[int, Field(ge=0, le=525600)]], Field(max_length=10)]
 
 
 class TaskBase(BaseModel):
@@ -15,6 +18,14 @@ class TaskCreate(BaseModel):
     description: Optional[str] = None
     due_at: datetime
     user_email: EmailStr
+    reminder_offsets: Optional[ReminderOffsets] = None
+
+
+def not_null(value):
+    """Optional means "may be omitted" in updates; null would violate a NOT NULL column"""
+    if value is None:
+        raise ValueError("may be omitted but not null")
+    return value
 
 
 class TaskUpdate(BaseModel):
@@ -23,6 +34,9 @@ class TaskUpdate(BaseModel):
     due_at: Optional[datetime] = None
     user_email: Optional[EmailStr] = None
     reminded: Optional[bool] = None
+    reminder_offsets: Optional[ReminderOffsets] = None
+
+    _not_null = field_validator("title", "due_at", "user_email", "reminded", mode="before")(not_null)
 
 
 class TaskRead(TaskBase):
@@ -38,10 +52,70 @@ class TaskOut(BaseModel):
     user_email: EmailStr
     reminded: bool
     created: datetime
+    remind_at: Optional[datetime] = None
+    reminder_offsets: Optional[List[int]] = None
 
     model_config = ConfigDict(from_attributes=True)
 
 
+class TaskPage(BaseModel):
+    items: List[TaskOut]
+    next_cursor: Optional[str] = None
+
+
+class TaskBatchCreate(BaseModel):
+    tasks: List[TaskCreate]
+
+
+class TaskBatchUpdateItem(BaseModel):
+    id: int
+    title: Optional[str] = None
+    description: Optional[str] = None
+    due_at: Optional[datetime] = None
+    reminded: Optional[bool] = None
+    reminder_offsets: Optional[ReminderOffsets] = None
+
+    _not_null = field_validator("title", "due_at", "reminded", mode="before")(not_null)
+
+
+class TaskBatchUpdate(BaseModel):
+    tasks: List[TaskBatchUpdateItem]
+
+    @model_validator(mode="after")
+    def unique_ids(self):
+        # One row per task keeps the counter and reminder bookkeeping exact
+        ids = [item.id for item in self.tasks]
+        if len(set(ids)) != len(ids):
+            raise ValueError("each task id may appear only once per batch")
+        return self
+
+
+class TaskBatchDelete(BaseModel):
+    ids: List[int]
+
+
+class TaskBatchItemResult(BaseModel):
+    index: int
+    id: Optional[int] = None
+    status: str
+    task: Optional[TaskOut] = None
+
+
+class TaskBatchResult(BaseModel):
+    results: List[TaskBatchItemResult]
+
+
+class TaskImportError(BaseModel):
+    row: int
+    error: str
+
+
+class TaskImportResult(BaseModel):
+    imported: int
+    failed: int
+    errors: List[TaskImportError]
+
+
 class NotificationCreate(BaseModel):
     task_id: int
     message: str
@@ -56,6 +130,11 @@ class NotificationOut(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
+class NotificationPage(BaseModel):
+    items: List[NotificationOut]
+    next_cursor: Optional[str] = None
+
+
 class UserCreate(BaseModel):
     first_name: str
     last_name: str
@@ -0,0 +1,203 @@
+"""Per-user task counters maintained alongside task writes
+
+/tasks/stats used to aggregate over every task a user owns. Instead, each
+write adjusts a running total and an hourly histogram of due times in the
+same transaction, and the stats read sums a handful of histogram rows plus
+the tasks falling inside the two partially covered hours at the window
+edges. A periodic reconciliation rebuilds any user whose counters drifted.
+"""
+
+import logging
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterable, Optional
+
+from sqlalchemy import and_, case, delete, func, or_, select, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+from .models import Task, User, UserTaskCounter, UserTaskDueBucket
+
+logger = logging.getLogger(__name__)
+
+BUCKET = timedelta(hours=1)
+
+
+def as_utc_naive(value: datetime) -> datetime:
+    """Normalise a datetime to naive UTC, the way due_at is compared everywhere"""
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+def bucket_start(due_at: datetime) -> datetime:
+    """Start of the histogram bucket a due time falls into"""
+    return as_utc_naive(due_at).replace(minute=0, second=0, microsecond=0)
+
+
+def record_task_changes(
+        db: Session,
+        user_id: int,
+        added: Iterable[datetime] = (),
+        removed: Iterable[datetime] = (),
+) -> None:
+    """
+    Apply task inserts/deletes (given by due time) to a user's counters.
+
+    Runs inside the caller's transaction, so the counters commit or roll back
+    together with the task rows. A due time change is one removal plus one
+    addition.
+    """
+    deltas: Counter = Counter()
+    for due_at in added:
+        deltas[bucket_start(due_at)] += 1
+    for due_at in removed:
+        deltas[bucket_start(due_at)] -= 1
+    total_delta = sum(deltas.values())
+    deltas = Counter({bucket: delta for bucket, delta in deltas.items() if delta})
+    if not deltas and not total_delta:
+        return
+
+    if db.get(UserTaskCounter, user_id) is None:
+        # First write since counters were introduced: count from scratch,
+        # including the rows this transaction is adding or removing
+        db.flush()
+        reconcile_user(db, user_id)
+        return
+
+    if total_delta:
+        db.execute(
+            update(UserTaskCounter)
+            .where(UserTaskCounter.user_id == user_id)
+            .values(total_tasks=UserTaskCounter.total_tasks + total_delta)
+        )
+
+    for bucket, delta in deltas.items():
+        stmt = _insert(db, UserTaskDueBucket).values(user_id=user_id, bucket_start=bucket, task_count=max(delta, 0))
+        db.execute(stmt.on_conflict_do_update(
+            index_elements=["user_id", "bucket_start"],
+            set_={"task_count": UserTaskDueBucket.task_count + delta},
+        ))
+
+    emptied = [bucket for bucket, delta in deltas.items() if delta < 0]
+    if emptied:
+        db.execute(
+            delete(UserTaskDueBucket).where(
+                UserTaskDueBucket.user_id == user_id,
+                UserTaskDueBucket.bucket_start.in_(emptied),
+                UserTaskDueBucket.task_count <= 0,
+            )
+        )
+
+
+def _insert(db: Session, model):
+    """INSERT supporting ON CONFLICT, so concurrent first writes for a key don't collide"""
+    dialect = postgresql if db.get_bind().dialect.name == "postgresql" else sqlite
+    return dialect.insert(model)
+
+
+def read_task_stats(db: Session, user_id: int, now: datetime, window_hours: int) -> Optional[Dict[str, int]]:
+    """
+    Stats from the counters, or None if the user has not been counted yet.
+
+    Whole hours come from the histogram; only the current hour and the hour
+    containing the end of the window are counted from the tasks table.
+    """
+    now = as_utc_naive(now)
+    window_end = now + timedelta(hours=window_hours)
+    current_hour = bucket_start(now)
+    last_hour = bucket_start(window_end)
+
+    def bucket_sum(predicate):
+        return (
+            select(func.coalesce(func.sum(case((predicate, UserTaskDueBucket.task_count), else_=0)), 0))
+            .where(UserTaskDueBucket.user_id == user_id)
+            .scalar_subquery()
+        )
+
+    row = db.execute(
+        select(
+            UserTaskCounter.total_tasks,
+            bucket_sum(UserTaskDueBucket.bucket_start < current_hour).label("overdue"),
+            bucket_sum(and_(
+                UserTaskDueBucket.bucket_start > current_hour,
+                UserTaskDueBucket.bucket_start < last_hour,
+            )).label("upcoming"),
+        ).where(UserTaskCounter.user_id == user_id)
+    ).first()
+    if row is None:
+        return None
+
+    # Exact counts for the partially covered hours at both edges
+    edges = db.execute(
+        select(
+            func.coalesce(func.sum(case((Task.due_at < now, 1), else_=0)), 0),
+            func.coalesce(func.sum(case((and_(Task.due_at >= now, Task.due_at <= window_end), 1), else_=0)), 0),
+        ).where(
+            Task.user_id == user_id,
+            or_(
+                and_(Task.due_at >= current_hour, Task.due_at < current_hour + BUCKET),
+                and_(Task.due_at >= last_hour, Task.due_at < last_hour + BUCKET),
+            ),
+        )
+    ).one()
+
+    return {
+        "total_tasks": row.total_tasks,
+        "overdue_tasks": row.overdue + edges[0],
+        "upcoming_tasks": row.upcoming + edges[1],
+    }
+
+
+def reconcile_user(db: Session, user_id: int) -> bool:
+    """Rebuild one user's counters from the tasks table; True if they had drifted"""
+    actual: Counter = Counter()
+    for due_at in db.execute(select(Task.due_at).where(Task.user_id == user_id)).scalars():
+        actual[bucket_start(due_at)] += 1
+
+    stored = Counter({
+        row.bucket_start: row.task_count
+        for row in db.execute(
+            select(UserTaskDueBucket.bucket_start, UserTaskDueBucket.task_count)
+            .where(UserTaskDueBucket.user_id == user_id)
+        )
+    })
+    counter = db.get(UserTaskCounter, user_id)
+    total = sum(actual.values())
+    if counter is not None and counter.total_tasks == total and stored == actual:
+        return False
+
+    db.execute(delete(UserTaskDueBucket).where(
+        UserTaskDueBucket.user_id == user_id, UserTaskDueBucket.bucket_start.notin_(list(actual))
+    ))
+    if actual:
+        stmt = _insert(db, UserTaskDueBucket)
+        db.execute(
+            stmt.on_conflict_do_update(
+                index_elements=["user_id", "bucket_start"], set_={"task_count": stmt.excluded.task_count}
+            ),
+            [{"user_id": user_id, "bucket_start": bucket, "task_count": count} for bucket, count in actual.items()],
+        )
+    stmt = _insert(db, UserTaskCounter).values(user_id=user_id, total_tasks=total)
+    db.execute(stmt.on_conflict_do_update(
+        index_elements=["user_id"], set_={"total_tasks": stmt.excluded.total_tasks}
+    ))
+    if counter is not None:
+        db.refresh(counter)
+    return True
+
+
+def reconcile_task_counters(db: Session) -> int:
+    """Repair counter drift for every user; returns the number of users fixed"""
+    repaired = 0
+    for user_id in db.execute(select(User.id)).scalars().all():
+        try:
+            if reconcile_user(db, user_id):
+                repaired += 1
+            db.commit()
+        except Exception as e:
+            logger.error(f"Error reconciling task counters for user {user_id}: {str(e)}")
+            db.rollback()
+    if repaired:
+        logger.info(f"Reconciled task counters for {repaired} users")
+    return repaired
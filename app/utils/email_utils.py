@@ -4,8 +4,10 @@ from email.mime.multipart import MIMEMultipart
 from pydantic import BaseModel, EmailStr
 import logging
 import asyncio
+import time
 from concurrent.futures import ThreadPoolExecutor
 from app.config import settings
+from app.metrics import email_send_duration, email_send_failures
 
 logger = logging.getLogger(__name__)
 
@@ -21,6 +23,7 @@ class EmailSchema(BaseModel):
 
 def _send_email_sync(message: MIMEMultipart) -> bool:
     """Synchronous email sending function for thread executor"""
+    start = time.perf_counter()
     try:
         with smtplib.SMTP(settings.MAIL_SERVER, settings.MAIL_PORT) as server:
             if settings.mail_starttls:
@@ -32,7 +35,10 @@ def _send_email_sync(message: MIMEMultipart) -> bool:
         return True
     except Exception as e:
         logger.error(f"Failed to send email: {str(e)}")
+        email_send_failures.inc()
         return False
+    finally:
+        email_send_duration.observe(time.perf_counter() - start)
 
 
 async def send_email(email: EmailSchema) -> bool:
@@ -139,12 +145,9 @@ def send_password_reset_email(email_to: str, reset_token: str, user_name: str) -
         message.attach(html_part)
 
         # Send email synchronously
-        with smtplib.SMTP(settings.MAIL_SERVER, settings.MAIL_PORT) as server:
-            if settings.mail_starttls:
-                server.starttls()
-
-            server.login(settings.MAIL_USERNAME, settings.MAIL_PASSWORD)
-            server.send_message(message)
+        if not _send_email_sync(message):
+            logger.error(f"Failed to send password reset email to {email_to}")
+            return False
 
         logger.info(f"Password reset email sent successfully to {email_to}")
         return True
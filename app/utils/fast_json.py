@@ -0,0 +1,89 @@
+"""JSON responses built straight from column rows
+
+List endpoints normally hand ORM objects to FastAPI, which validates each
+one through the response model and then encodes it with the stdlib json
+module. Selecting just the schema's columns and encoding the rows with
+pydantic-core's serializer gives byte-identical output without the
+per-row validation.
+"""
+
+from typing import Any, Iterable, List, Optional, Sequence, Type
+
+from fastapi import HTTPException, Response, status
+from pydantic import BaseModel
+from pydantic_core import to_json
+
+from app.config import settings
+
+
+def schema_columns(model, schema: Type[BaseModel], fields: Optional[Sequence[str]] = None) -> List[Any]:
+    """ORM columns backing a response schema, in the schema's field order"""
+    return [getattr(model, name) for name in (fields or schema.model_fields)]
+
+
+def parse_fields(schema: Type[BaseModel], fields: Optional[str]) -> Optional[List[str]]:
+    """
+    Validate a ``fields=a,b`` parameter against a response schema.
+
+    Returns the requested fields in schema order, or None when the parameter
+    is absent (meaning every field).
+    """
+    if fields is None:
+        return None
+    requested = {name.strip() for name in fields.split(",") if name.strip()}
+    unknown = sorted(requested - set(schema.model_fields))
+    if unknown or not requested:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown fields: {', '.join(unknown)}" if unknown else "No fields requested"
+        )
+    return [name for name in schema.model_fields if name in requested]
+
+
+def query_entities(model, schema: Type[BaseModel], fields: Optional[List[str]] = None,
+                   extra: Sequence[Any] = ()) -> List[Any]:
+    """
+    What a read route should select.
+
+    Bare columns for the requested fields (plus ``extra`` columns the route
+    needs itself, such as pagination keys) when a sparse fieldset is asked
+    for or the fast path is on; otherwise the mapped model.
+    """
+    if fields is not None:
+        return schema_columns(model, schema, fields) + [
+            column for column in extra if column.key not in fields
+        ]
+    if settings.fast_json_responses:
+        return schema_columns(model, schema)
+    return [model]
+
+
+def result_items(result, entities: List[Any]) -> list:
+    """Objects for a bare model select, rows for a column select"""
+    return result.scalars().all() if isinstance(entities[0], type) else result.all()
+
+
+def _payload(rows: Iterable, fields: Optional[List[str]]) -> List[dict]:
+    if fields is None:
+        return [row._asdict() for row in rows]
+    return [{name: row._mapping[name] for name in fields} for row in rows]
+
+
+def list_response(rows: list, fields: Optional[List[str]] = None):
+    """A list route's return value: encoded bytes in fast or sparse mode, else the rows"""
+    if fields is None and not settings.fast_json_responses:
+        return rows
+    return Response(content=to_json(_payload(rows, fields)), media_type="application/json")
+
+
+def page_response(rows: list, next_cursor: Optional[str], fields: Optional[List[str]] = None):
+    """Same as list_response for a ``{"items": [...], "next_cursor": ...}`` page"""
+    if fields is None and not settings.fast_json_responses:
+        return {"items": rows, "next_cursor": next_cursor}
+    content = to_json({"items": _payload(rows, fields), "next_cursor": next_cursor})
+    return Response(content=content, media_type="application/json")
+
+
+def item_response(row, fields: List[str]) -> Response:
+    """A single object restricted to a sparse fieldset"""
+    return Response(content=to_json(_payload([row], fields)[0]), media_type="application/json")
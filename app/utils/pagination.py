@@ -0,0 +1,64 @@
+"""Opaque cursors for keyset (seek) pagination"""
+
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Optional, Tuple
+
+from fastapi import HTTPException, Query, status
+from sqlalchemy import tuple_
+
+MAX_PAGE_SIZE = 1000
+
+# Shared by every skip/limit or cursor list route; a zero or negative limit
+# would leave keyset_page no last row to build the next cursor from
+SKIP_QUERY = Query(0, ge=0)
+LIMIT_QUERY = Query(100, ge=1, le=MAX_PAGE_SIZE)
+
+
+def encode_cursor(sort_value: datetime, row_id: int) -> str:
+    """Encode the sort key of the last row on a page"""
+    raw = json.dumps([sort_value.isoformat(), row_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Optional[Tuple[datetime, int]]:
+    """Decode a cursor from the client; an empty cursor means the first page"""
+    if not cursor:
+        return None
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        sort_value, row_id = json.loads(raw)
+        return datetime.fromisoformat(sort_value), int(row_id)
+    except (binascii.Error, ValueError, TypeError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )
+
+
+def keyset_page(query, sort_column, id_column, cursor: str, limit: int, descending: bool = False):
+    """
+    Apply a (sort_column, id) seek predicate to a query and fetch one page.
+
+    Returns the rows and the cursor for the following page (None on the last page).
+    """
+    position = decode_cursor(cursor)
+    if position is not None:
+        key = tuple_(sort_column, id_column)
+        query = query.filter(key < position if descending else key > position)
+
+    if descending:
+        query = query.order_by(sort_column.desc(), id_column.desc())
+    else:
+        query = query.order_by(sort_column, id_column)
+
+    # One extra row tells us whether there is a next page
+    rows = query.limit(limit + 1).all()
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]
+        next_cursor = encode_cursor(getattr(last, sort_column.key), getattr(last, id_column.key))
+    return rows, next_cursor
@@ -0,0 +1,133 @@
+"""Static frontend serving with precompressed variants and cache headers
+
+``scripts/precompress_static.py`` writes ``.br``/``.gz`` files next to the
+Vite build output; these are picked by ``Accept-Encoding`` instead of
+compressing on every request. Vite's content-hashed files under ``assets/``
+never change, so browsers may cache them forever; everything else is
+revalidated with its ETag.
+"""
+
+import gzip
+import hashlib
+import os
+import re
+from mimetypes import guess_type
+from typing import Dict, List, Optional, Tuple
+
+from starlette.datastructures import Headers
+from starlette.requests import Request
+from starlette.responses import FileResponse, Response
+from starlette.staticfiles import NotModifiedResponse, StaticFiles
+
+# Preferred first; extension written by scripts/precompress_static.py
+ENCODINGS = (("br", ".br"), ("gzip", ".gz"))
+
+IMMUTABLE = "public, max-age=31536000, immutable"
+REVALIDATE = "no-cache"
+
+# Vite's default output name: assets/[name]-[hash].[ext]
+HASHED_ASSET = re.compile(r"(^|/)assets/.+-[A-Za-z0-9_-]{8}\.\w+$")
+
+
+def accepted_encodings(accept_encoding: str) -> set:
+    """Codings the client accepts, dropping any sent with q=0"""
+    accepted = set()
+    for part in accept_encoding.split(","):
+        coding, *params = [piece.strip() for piece in part.split(";")]
+        quality = 1.0
+        for param in params:
+            if param.startswith("q="):
+                try:
+                    quality = float(param[2:])
+                except ValueError:
+                    quality = 0.0
+        if coding and quality > 0:
+            accepted.add(coding.lower())
+    return accepted
+
+
+def pick_encoding(request_headers: Headers, available) -> Optional[str]:
+    accepted = accepted_encodings(request_headers.get("accept-encoding", ""))
+    for encoding, _ in ENCODINGS:
+        if encoding in available and (encoding in accepted or "*" in accepted):
+            return encoding
+    return None
+
+
+def cache_control(path: str) -> str:
+    return IMMUTABLE if HASHED_ASSET.search(path.replace(os.sep, "/")) else REVALIDATE
+
+
+class PrecompressedStaticFiles(StaticFiles):
+    """StaticFiles that serves ``<file>.br``/``<file>.gz`` when the client accepts it"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Build output doesn't change while the app runs: stat variants once per file
+        self._variants: Dict[str, List[Tuple[str, str, os.stat_result]]] = {}
+
+    def variants(self, full_path: str) -> List[Tuple[str, str, os.stat_result]]:
+        found = self._variants.get(full_path)
+        if found is None:
+            found = []
+            for encoding, extension in ENCODINGS:
+                try:
+                    found.append((encoding, full_path + extension, os.stat(full_path + extension)))
+                except OSError:
+                    continue
+            self._variants[full_path] = found
+        return found
+
+    def file_response(self, full_path, stat_result, scope, status_code: int = 200) -> Response:
+        request_headers = Headers(scope=scope)
+        full_path = str(full_path)
+        media_type = guess_type(full_path)[0] or "text/plain"
+        variants = self.variants(full_path)
+
+        encoding = pick_encoding(request_headers, [variant[0] for variant in variants])
+        served_path = full_path
+        if encoding is not None:
+            _, served_path, stat_result = next(variant for variant in variants if variant[0] == encoding)
+
+        response = FileResponse(served_path, status_code=status_code, stat_result=stat_result, media_type=media_type)
+        response.headers["cache-control"] = cache_control(full_path)
+        if variants:
+            response.headers["vary"] = "Accept-Encoding"
+        if encoding is not None:
+            response.headers["content-encoding"] = encoding
+
+        if self.is_not_modified(response.headers, request_headers):
+            return NotModifiedResponse(response.headers)
+        return response
+
+
+class InMemoryPage:
+    """A small HTML file held in memory, with its compressed forms and an ETag
+
+    Used for the SPA's ``index.html``, which is requested on every navigation
+    and must always be revalidated because it names the current hashed assets.
+    """
+
+    def __init__(self, path: str):
+        with open(path, "rb") as f:
+            self.body = f.read()
+        self.encoded = {"gzip": gzip.compress(self.body, compresslevel=9, mtime=0)}
+        # Brotli is only available when the build step produced it
+        if os.path.exists(path + ".br"):
+            with open(path + ".br", "rb") as f:
+                self.encoded["br"] = f.read()
+        # Weak: the identity, gzip and br bodies are the same representation
+        self.etag = 'W/"' + hashlib.md5(self.body).hexdigest() + '"'
+        self.media_type = guess_type(path)[0] or "text/html"
+
+    def response(self, request: Request) -> Response:
+        headers = {"etag": self.etag, "cache-control": REVALIDATE, "vary": "Accept-Encoding"}
+        if_none_match = request.headers.get("if-none-match", "")
+        if self.etag[2:] in [tag.strip(" W/") for tag in if_none_match.split(",")]:
+            return Response(status_code=304, headers=headers)
+
+        encoding = pick_encoding(request.headers, self.encoded)
+        if encoding is None:
+            return Response(self.body, media_type=self.media_type, headers=headers)
+        headers["content-encoding"] = encoding
+        return Response(self.encoded[encoding], media_type=self.media_type, headers=headers)
@@ -0,0 +1,162 @@
+"""Streaming bulk import of tasks from CSV or NDJSON uploads"""
+
+import csv
+import io
+import json
+from datetime import datetime, timezone
+from itertools import islice
+from typing import IO, Any, Dict, Iterator, List, Optional, Tuple
+
+from pydantic import ValidationError, field_validator
+from sqlalchemy import insert, select
+from sqlalchemy.orm import Session
+
+from app.models import Task
+from app.reminders import reminder_schedule
+from app.schemas import TaskCreate
+from app.task_counters import as_utc_naive, record_task_changes
+
+COPY_COLUMNS = (
+    "title", "description", "due_at", "user_id", "user_email", "reminded", "created", "updated_at",
+    "reminder_offsets", "remind_at",
+)
+COPY_SQL = f"COPY tasks ({', '.join(COPY_COLUMNS)}) FROM STDIN WITH (FORMAT csv)"
+
+
+class TaskImportRow(TaskCreate):
+    """TaskCreate for one imported row
+
+    Imported tasks always belong to the importer, as with create_task, so
+    the owner email is not re-validated for every row.
+    """
+    user_email: Optional[str] = None
+
+    @field_validator("reminder_offsets", mode="before")
+    @classmethod
+    def split_offsets(cls, value):
+        # CSV cells carry lead times as "1440,60"
+        if isinstance(value, str):
+            return [part for part in value.split(",") if part.strip()]
+        return value
+
+
+def iter_records(upload: IO[bytes], fmt: str) -> Iterator[Tuple[int, Dict[str, Any] | str]]:
+    """
+    Yield (row number, record) pairs without reading the whole upload.
+
+    A record that cannot be parsed is yielded as an error string instead.
+    """
+    text = io.TextIOWrapper(upload, encoding="utf-8-sig", newline="")
+    if fmt == "csv":
+        # Row numbers count the header as row 1, like a spreadsheet
+        for row_number, row in enumerate(csv.DictReader(text), start=2):
+            yield row_number, {key: value or None for key, value in row.items() if key}
+        return
+
+    for row_number, line in enumerate(text, start=1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError as e:
+            yield row_number, f"Invalid JSON: {e}"
+            continue
+        yield row_number, record if isinstance(record, dict) else "Expected a JSON object"
+
+
+def _error_message(error: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(part) for part in err['loc'])}: {err['msg']}" for err in error.errors()
+    )
+
+
+def validate_chunk(records) -> Tuple[List[TaskImportRow], List[Dict[str, Any]]]:
+    """Validate parsed records against TaskCreate; returns (tasks, errors)"""
+    tasks, errors = [], []
+    for row_number, record in records:
+        if isinstance(record, str):
+            errors.append({"row": row_number, "error": record})
+            continue
+        try:
+            tasks.append(TaskImportRow.model_validate(record))
+        except ValidationError as e:
+            errors.append({"row": row_number, "error": _error_message(e)})
+    return tasks, errors
+
+
+def _copy_rows(db: Session, rows: List[Tuple]) -> None:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for row in rows:
+        writer.writerow([
+            value.isoformat() if isinstance(value, datetime)
+            else json.dumps(value) if isinstance(value, list)
+            else value
+            for value in row
+        ])
+    buffer.seek(0)
+
+    # The session's own connection, so COPY joins the request transaction
+    dbapi_connection = db.connection().connection.driver_connection
+    with dbapi_connection.cursor() as cursor:
+        cursor.copy_expert(COPY_SQL, buffer)
+
+
+def task_rows(user_id: int, user_email: str, tasks: List[TaskImportRow], now: datetime) -> List[Tuple]:
+    """COPY_COLUMNS values per task; due_at is naive UTC, as the insert path stores it"""
+    rows = []
+    for task in tasks:
+        due_at = as_utc_naive(task.due_at)
+        rows.append((
+            task.title, task.description, due_at, user_id, user_email, False, now, now,
+            task.reminder_offsets, reminder_schedule(due_at, task.reminder_offsets)["remind_at"],
+        ))
+    return rows
+
+
+def load_chunk(db: Session, user_id: int, user_email: str, tasks: List[TaskImportRow]) -> None:
+    """Write validated tasks with COPY on PostgreSQL, or a batched INSERT elsewhere"""
+    if not tasks:
+        return
+    rows = task_rows(user_id, user_email, tasks, datetime.now(timezone.utc))
+    if db.get_bind().dialect.name == "postgresql":
+        _copy_rows(db, rows)
+    else:
+        db.execute(insert(Task), [dict(zip(COPY_COLUMNS, row)) for row in rows])
+    record_task_changes(db, user_id, added=[task.due_at for task in tasks])
+
+
+def import_tasks(db: Session, user_id: int, user_email: str, upload: IO[bytes], fmt: str,
+                 chunk_size: int = 1000, max_errors: int = 100) -> Dict[str, Any]:
+    """
+    Parse, validate and load an upload chunk by chunk.
+
+    Valid rows are imported and invalid ones reported, the first
+    ``max_errors`` of them in detail; the caller commits. An upload that is
+    not UTF-8 raises UnicodeDecodeError part way through.
+    """
+    records = iter_records(upload, fmt)
+    imported, failed, errors = 0, 0, []
+    while True:
+        chunk = list(islice(records, chunk_size))
+        if not chunk:
+            break
+        tasks, chunk_errors = validate_chunk(chunk)
+        load_chunk(db, user_id, user_email, tasks)
+        imported += len(tasks)
+        failed += len(chunk_errors)
+        errors.extend(chunk_errors[:max_errors - len(errors)])
+
+    return {"imported": imported, "failed": failed, "errors": errors}
+
+
+def imported_reminders(db: Session, user_id: int, since: datetime, until: datetime) -> List[Tuple[int, datetime]]:
+    """(id, remind_at) of the user's tasks created since ``since`` with a reminder due by ``until``
+
+    COPY returns no ids, so the reminder timer is fed from the pending
+    remind_at index after the import commits.
+    """
+    return db.execute(
+        select(Task.id, Task.remind_at)
+        .where(Task.remind_at <= until, Task.user_id == user_id, Task.created >= since)
+    ).all()
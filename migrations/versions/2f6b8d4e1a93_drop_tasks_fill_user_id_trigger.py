@@ -0,0 +1,45 @@
+"""Drop tasks user_id fill trigger
+
+Revision ID: 2f6b8d4e1a93
+Revises: 5a9e1c7d3f48
+Create Date: 2026-10-18 14:02:51.118406
+
+Contract step of b81d0f3c6e27: run only once no instance of the code that
+inserts tasks without user_id is left.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '2f6b8d4e1a93'
+down_revision: Union[str, Sequence[str], None] = '5a9e1c7d3f48'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("DROP TRIGGER IF EXISTS tasks_fill_user_id ON tasks")
+    op.execute("DROP FUNCTION IF EXISTS tasks_fill_user_id()")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION tasks_fill_user_id() RETURNS trigger AS $$
+        BEGIN
+            IF NEW.user_id IS NULL THEN
+                SELECT id INTO NEW.user_id FROM users WHERE email = NEW.user_email;
+            END IF;
+            RETURN NEW;
+        END
+        $$ LANGUAGE plpgsql;
+        """
+    )
+    op.execute(
+        "CREATE TRIGGER tasks_fill_user_id BEFORE INSERT OR UPDATE OF user_email ON tasks "
+        "FOR EACH ROW EXECUTE FUNCTION tasks_fill_user_id()"
+    )
@@ -0,0 +1,41 @@
+"""Add user task counters
+
+Revision ID: 3f6b2c8d9a14
+Revises: 0122f9fa1bcb
+Create Date: 2026-10-17 09:12:31.418207
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f6b2c8d9a14'
+down_revision: Union[str, Sequence[str], None] = '0122f9fa1bcb'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'user_task_counters',
+        sa.Column('user_id', sa.Integer(), sa.ForeignKey('users.id', ondelete='CASCADE'), primary_key=True),
+        sa.Column('total_tasks', sa.Integer(), nullable=False, server_default='0'),
+    )
+    op.create_table(
+        'user_task_due_buckets',
+        sa.Column('user_id', sa.Integer(), sa.ForeignKey('users.id', ondelete='CASCADE'), primary_key=True),
+        sa.Column('bucket_start', sa.DateTime(), primary_key=True),
+        sa.Column('task_count', sa.Integer(), nullable=False, server_default='0'),
+    )
+    # Rows are filled lazily: on a user's next task write, or by the hourly
+    # reconciliation job. Until then /tasks/stats falls back to aggregating.
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('user_task_due_buckets')
+    op.drop_table('user_task_counters')
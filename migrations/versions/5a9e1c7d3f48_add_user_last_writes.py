@@ -0,0 +1,32 @@
+"""Add user last writes
+
+Revision ID: 5a9e1c7d3f48
+Revises: c3d58f0a7e12
+Create Date: 2026-10-18 10:21:37.640192
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5a9e1c7d3f48'
+down_revision: Union[str, Sequence[str], None] = 'c3d58f0a7e12'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'user_last_writes',
+        sa.Column('user_id', sa.Integer(), sa.ForeignKey('users.id', ondelete='CASCADE'), primary_key=True),
+        sa.Column('written_at', sa.DateTime(), nullable=False),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('user_last_writes')
@@ -0,0 +1,47 @@
+"""Composite and partial indexes for task hot paths
+
+Revision ID: 7c1e4a2b5d90
+Revises: 3f6b2c8d9a14
+Create Date: 2026-10-17 10:03:52.902114
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7c1e4a2b5d90'
+down_revision: Union[str, Sequence[str], None] = '3f6b2c8d9a14'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CONCURRENTLY can't run inside a transaction; build without blocking writes
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_tasks_user_email_due_at', 'tasks', ['user_email', 'due_at'],
+            unique=False, postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_tasks_due_at_unreminded', 'tasks', ['due_at'],
+            unique=False, postgresql_concurrently=True,
+            postgresql_where=sa.text('reminded = false'),
+        )
+        # Covered by the composite index, the partial index and the primary key
+        op.drop_index('ix_tasks_user_email', table_name='tasks', postgresql_concurrently=True)
+        op.drop_index('ix_tasks_due_at', table_name='tasks', postgresql_concurrently=True)
+        op.drop_index('ix_tasks_id', table_name='tasks', postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index('ix_tasks_id', 'tasks', ['id'], unique=False, postgresql_concurrently=True)
+        op.create_index('ix_tasks_due_at', 'tasks', ['due_at'], unique=False, postgresql_concurrently=True)
+        op.create_index('ix_tasks_user_email', 'tasks', ['user_email'], unique=False, postgresql_concurrently=True)
+        op.drop_index('ix_tasks_due_at_unreminded', table_name='tasks', postgresql_concurrently=True)
+        op.drop_index('ix_tasks_user_email_due_at', table_name='tasks', postgresql_concurrently=True)
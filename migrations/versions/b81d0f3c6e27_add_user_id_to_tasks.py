@@ -0,0 +1,123 @@
+"""Add user_id foreign key to tasks
+
+Revision ID: b81d0f3c6e27
+Revises: 7c1e4a2b5d90
+Create Date: 2026-10-17 11:26:07.335810
+
+Online migration: every step either takes only a brief lock or runs in
+small committed batches, so the app can keep serving while it runs.
+Re-running after an interruption is safe.
+
+Code deployed before this migration still inserts tasks with only
+user_email. A trigger fills user_id for those rows, so they neither become
+orphans after the backfill nor trip the NOT NULL check; 2f6b8d4e1a93 drops
+it once every instance sets user_id itself.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b81d0f3c6e27'
+down_revision: Union[str, Sequence[str], None] = '7c1e4a2b5d90'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BACKFILL_BATCH = 10_000
+
+FILL_USER_ID = """
+CREATE OR REPLACE FUNCTION tasks_fill_user_id() RETURNS trigger AS $$
+BEGIN
+    IF NEW.user_id IS NULL THEN
+        SELECT id INTO NEW.user_id FROM users WHERE email = NEW.user_email;
+    END IF;
+    RETURN NEW;
+END
+$$ LANGUAGE plpgsql;
+"""
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.get_context().autocommit_block():
+        conn = op.get_bind()
+
+        op.execute("ALTER TABLE tasks ADD COLUMN IF NOT EXISTS user_id INTEGER")
+        op.execute(
+            """
+            DO $$
+            BEGIN
+                IF NOT EXISTS (SELECT 1 FROM pg_constraint WHERE conname = 'fk_tasks_user_id_users') THEN
+                    ALTER TABLE tasks ADD CONSTRAINT fk_tasks_user_id_users
+                        FOREIGN KEY (user_id) REFERENCES users (id) ON DELETE CASCADE NOT VALID;
+                END IF;
+            END
+            $$;
+            """
+        )
+
+        # Old code writes only user_email; fill user_id for it from here on
+        op.execute(FILL_USER_ID)
+        op.execute("DROP TRIGGER IF EXISTS tasks_fill_user_id ON tasks")
+        op.execute(
+            "CREATE TRIGGER tasks_fill_user_id BEFORE INSERT OR UPDATE OF user_email ON tasks "
+            "FOR EACH ROW EXECUTE FUNCTION tasks_fill_user_id()"
+        )
+
+        # Backfill in id ranges, one short transaction per batch
+        max_id = conn.execute(sa.text("SELECT coalesce(max(id), 0) FROM tasks")).scalar()
+        for low in range(0, max_id + 1, BACKFILL_BATCH):
+            conn.execute(
+                sa.text(
+                    """
+                    UPDATE tasks SET user_id = users.id
+                    FROM users
+                    WHERE users.email = tasks.user_email
+                      AND tasks.user_id IS NULL
+                      AND tasks.id >= :low AND tasks.id < :high
+                    """
+                ),
+                {"low": low, "high": low + BACKFILL_BATCH},
+            )
+
+        orphans = conn.execute(sa.text("SELECT count(*) FROM tasks WHERE user_id IS NULL")).scalar()
+        if orphans:
+            raise RuntimeError(
+                f"{orphans} tasks have a user_email with no matching user; "
+                "reassign or delete them, then re-run this migration"
+            )
+
+        op.execute("CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_tasks_user_id_due_at ON tasks (user_id, due_at)")
+        op.execute("ALTER TABLE tasks VALIDATE CONSTRAINT fk_tasks_user_id_users")
+
+        # SET NOT NULL skips its full-table scan when a validated CHECK proves it
+        op.execute(
+            """
+            DO $$
+            BEGIN
+                IF NOT EXISTS (SELECT 1 FROM pg_constraint WHERE conname = 'ck_tasks_user_id_not_null') THEN
+                    ALTER TABLE tasks ADD CONSTRAINT ck_tasks_user_id_not_null
+                        CHECK (user_id IS NOT NULL) NOT VALID;
+                END IF;
+            END
+            $$;
+            """
+        )
+        op.execute("ALTER TABLE tasks VALIDATE CONSTRAINT ck_tasks_user_id_not_null")
+        op.execute("ALTER TABLE tasks ALTER COLUMN user_id SET NOT NULL")
+        op.execute("ALTER TABLE tasks DROP CONSTRAINT ck_tasks_user_id_not_null")
+
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_tasks_user_email_due_at")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.execute("CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_tasks_user_email_due_at ON tasks (user_email, due_at)")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_tasks_user_id_due_at")
+        op.execute("DROP TRIGGER IF EXISTS tasks_fill_user_id ON tasks")
+        op.execute("DROP FUNCTION IF EXISTS tasks_fill_user_id()")
+        op.execute("ALTER TABLE tasks DROP CONSTRAINT IF EXISTS fk_tasks_user_id_users")
+        op.execute("ALTER TABLE tasks DROP COLUMN IF EXISTS user_id")
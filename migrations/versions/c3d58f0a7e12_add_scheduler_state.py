@@ -0,0 +1,36 @@
+"""Add scheduler state
+
+Revision ID: c3d58f0a7e12
+Revises: e4a7c2d91b35
+Create Date: 2026-10-17 17:40:09.532817
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3d58f0a7e12'
+down_revision: Union[str, Sequence[str], None] = 'e4a7c2d91b35'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'scheduler_state',
+        sa.Column('name', sa.String(), primary_key=True),
+        sa.Column('watermark', sa.DateTime(), nullable=False),
+        sa.Column('catchup_until', sa.DateTime(), nullable=True),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+    )
+    # The reminders row is created by the first scheduler leader, with the
+    # watermark at the oldest reminder still pending
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('scheduler_state')
@@ -0,0 +1,69 @@
+"""Add remind_at and reminder_offsets to tasks
+
+Revision ID: e4a7c2d91b35
+Revises: b81d0f3c6e27
+Create Date: 2026-10-17 15:12:44.218903
+
+Online migration: nullable columns, a batched backfill and a concurrently
+built partial index replacing the old reminded = false scan index.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e4a7c2d91b35'
+down_revision: Union[str, Sequence[str], None] = 'b81d0f3c6e27'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BACKFILL_BATCH = 10_000
+# settings.default_reminder_minutes at the time of this migration
+DEFAULT_LEAD = "5 minutes"
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.get_context().autocommit_block():
+        conn = op.get_bind()
+
+        op.execute("ALTER TABLE tasks ADD COLUMN IF NOT EXISTS reminder_offsets JSON")
+        op.execute("ALTER TABLE tasks ADD COLUMN IF NOT EXISTS remind_at TIMESTAMP WITHOUT TIME ZONE")
+
+        # Only upcoming tasks still waiting for their reminder get one; the
+        # old scheduler never reminded tasks that were already past due
+        max_id = conn.execute(sa.text("SELECT coalesce(max(id), 0) FROM tasks")).scalar()
+        for low in range(0, max_id + 1, BACKFILL_BATCH):
+            conn.execute(
+                sa.text(
+                    f"""
+                    UPDATE tasks
+                    SET remind_at = greatest(due_at - interval '{DEFAULT_LEAD}', timezone('utc', now()))
+                    WHERE reminded = false
+                      AND remind_at IS NULL
+                      AND due_at >= timezone('utc', now())
+                      AND id >= :low AND id < :high
+                    """
+                ),
+                {"low": low, "high": low + BACKFILL_BATCH},
+            )
+
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_tasks_remind_at_pending "
+            "ON tasks (remind_at) WHERE remind_at IS NOT NULL"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_tasks_due_at_unreminded")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_tasks_due_at_unreminded "
+            "ON tasks (due_at) WHERE reminded = false"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_tasks_remind_at_pending")
+        op.execute("ALTER TABLE tasks DROP COLUMN IF EXISTS remind_at")
+        op.execute("ALTER TABLE tasks DROP COLUMN IF EXISTS reminder_offsets")
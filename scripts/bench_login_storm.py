@@ -0,0 +1,90 @@
+# scripts/bench_login_storm.py
+"""
+Measure /tasks/ latency while the server is handling a burst of logins.
+
+Start the API first (uvicorn app.main:app), make sure the user below exists
+(see test_registration.py), then run:
+
+    python scripts/bench_login_storm.py --logins 200 --concurrency 50
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+import httpx
+
+BASE_URL = "http://localhost:8000"
+EMAIL = "john.doe@example.com"
+PASSWORD = "supersecret123"
+
+
+def percentile(samples, pct):
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+async def login(client):
+    await client.post("/auth/token", data={"username": EMAIL, "password": PASSWORD})
+
+
+async def login_storm(client, total, concurrency):
+    sem = asyncio.Semaphore(concurrency)
+
+    async def one():
+        async with sem:
+            await login(client)
+
+    await asyncio.gather(*(one() for _ in range(total)))
+
+
+async def probe_tasks(client, headers, stop, samples):
+    while not stop.is_set():
+        start = time.perf_counter()
+        await client.get("/tasks/", headers=headers)
+        samples.append((time.perf_counter() - start) * 1000)
+        await asyncio.sleep(0.01)
+
+
+async def run(base_url, logins, concurrency):
+    async with httpx.AsyncClient(base_url=base_url, timeout=60) as client:
+        res = await client.post("/auth/token", data={"username": EMAIL, "password": PASSWORD})
+        res.raise_for_status()
+        headers = {"Authorization": f"Bearer {res.json()['access_token']}"}
+
+        # Baseline: /tasks/ with no auth load
+        baseline, stop = [], asyncio.Event()
+        probe = asyncio.create_task(probe_tasks(client, headers, stop, baseline))
+        await asyncio.sleep(3)
+        stop.set()
+        await probe
+
+        # Same probe while logins hammer bcrypt
+        during, stop = [], asyncio.Event()
+        probe = asyncio.create_task(probe_tasks(client, headers, stop, during))
+        start = time.perf_counter()
+        await login_storm(client, logins, concurrency)
+        storm_seconds = time.perf_counter() - start
+        stop.set()
+        await probe
+
+        health = (await client.get("/health")).json()
+
+    print(f"🔐 {logins} logins @ {concurrency} concurrent in {storm_seconds:.1f}s")
+    for label, samples in (("idle", baseline), ("login storm", during)):
+        print(
+            f"📊 /tasks/ {label:<12} n={len(samples):<5} "
+            f"p50={statistics.median(samples):7.1f}ms  p99={percentile(samples, 99):7.1f}ms"
+        )
+    print(f"⚙️  password pool: {health.get('password_hashing')}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--base-url", default=BASE_URL)
+    parser.add_argument("--logins", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=50)
+    args = parser.parse_args()
+    asyncio.run(run(args.base_url, args.logins, args.concurrency))
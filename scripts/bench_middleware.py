@@ -0,0 +1,118 @@
+# scripts/bench_middleware.py
+"""
+Per-request overhead of the security-headers/CORS layer, before and after
+moving it from @app.middleware("http") to a pure ASGI middleware.
+
+Three stacks serve the same trivial endpoints and are driven by calling the
+ASGI app directly (no sockets or HTTP client), so the difference from the
+bare app is the middleware cost alone:
+
+  bare    - no middleware
+  before  - CORSMiddleware + the old BaseHTTPMiddleware security headers
+  after   - app.middleware.SecurityHeadersMiddleware
+
+    python scripts/bench_middleware.py --requests 5000 --rounds 5
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from fastapi import FastAPI
+from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse, StreamingResponse
+
+from app.middleware import SecurityHeadersMiddleware
+
+CORS_OPTIONS = dict(
+    allow_origins=["http://localhost:5173"],
+    allow_credentials=True,
+    allow_methods=["*"],
+    allow_headers=["*"],
+    expose_headers=["Server-Timing"],
+)
+
+
+def build_app(stack):
+    app = FastAPI()
+
+    @app.get("/ping")
+    async def ping():
+        return PlainTextResponse("pong")
+
+    @app.get("/stream")
+    async def stream():
+        async def chunks():
+            for _ in range(20):
+                yield b"x" * 1024
+        return StreamingResponse(chunks())
+
+    if stack == "before":
+        app.add_middleware(CORSMiddleware, **CORS_OPTIONS)
+
+        @app.middleware("http")
+        async def add_security_headers(request, call_next):
+            response = await call_next(request)
+            response.headers["X-Content-Type-Options"] = "nosniff"
+            response.headers["X-Frame-Options"] = "DENY"
+            response.headers["X-XSS-Protection"] = "1; mode=block"
+            return response
+    elif stack == "after":
+        app.add_middleware(SecurityHeadersMiddleware, **CORS_OPTIONS)
+    return app
+
+
+def make_scope(path, origin):
+    # spec_version 2.4 (as uvicorn reports) so streaming doesn't poll receive() for disconnects
+    headers = [(b"host", b"bench")]
+    if origin:
+        headers.append((b"origin", b"http://localhost:5173"))
+    return {
+        "type": "http", "asgi": {"version": "3.0", "spec_version": "2.4"}, "http_version": "1.1", "method": "GET",
+        "scheme": "http", "path": path, "raw_path": path.encode(), "root_path": "",
+        "query_string": b"", "headers": headers, "client": ("127.0.0.1", 1), "server": ("bench", 80),
+    }
+
+
+async def run(app, path, origin, requests, rounds):
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        pass
+
+    # Build the middleware stack outside the timed loop
+    await app(make_scope(path, origin), receive, send)
+    best = float("inf")
+    # Best of several rounds, to keep GC pauses and scheduler noise out
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for _ in range(requests):
+            await app(make_scope(path, origin), receive, send)
+        best = min(best, time.perf_counter() - start)
+    return best / requests * 1e6
+
+
+async def main(requests, rounds):
+    apps = {stack: build_app(stack) for stack in ("bare", "before", "after")}
+    for path in ("/ping", "/stream"):
+        for origin in (False, True):
+            timings = {stack: await run(app, path, origin, requests, rounds) for stack, app in apps.items()}
+            before = timings["before"] - timings["bare"]
+            after = timings["after"] - timings["bare"]
+            label = f"{path}{' (cross-origin)' if origin else ''}"
+            print(f"📊 {label}: bare {timings['bare']:.1f} µs/req")
+            saving = f"⚡ {before / after:.1f}x less overhead" if after > 0 else "⚡ after is within noise of bare"
+            print(f"   before +{before:.1f} µs   after +{after:.1f} µs   {saving}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=5000, help="requests per round")
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+    asyncio.run(main(args.requests, args.rounds))
@@ -0,0 +1,100 @@
+# scripts/bench_pagination.py
+"""
+Compare offset and keyset (cursor) pagination latency for GET /tasks/.
+
+Seeds tasks for a throwaway owner in the configured database, times
+fetching page N both ways with the same queries the router uses, then
+removes the seeded rows.
+
+    python scripts/bench_pagination.py --rows 200000 --page 1000 --limit 100
+"""
+
+import argparse
+import os
+import sys
+import time
+from datetime import datetime, timedelta
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from sqlalchemy import delete, insert
+
+from app.database import SessionLocal
+from app.models import Task, User
+from app.utils.pagination import encode_cursor, keyset_page
+
+OWNER = "bench-pagination@example.com"
+
+
+def seed(db, owner, rows):
+    start = datetime.utcnow()
+    batch = []
+    for i in range(rows):
+        batch.append({
+            "title": f"bench {i}",
+            "due_at": start + timedelta(minutes=i),
+            "user_id": owner.id,
+            "user_email": owner.email,
+            "reminded": False,
+        })
+        if len(batch) == 10_000:
+            db.execute(insert(Task), batch)
+            batch.clear()
+    if batch:
+        db.execute(insert(Task), batch)
+    db.commit()
+
+
+def timed(fn, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main(rows, page, limit, repeat):
+    db = SessionLocal()
+    try:
+        print(f"🌱 Seeding {rows} tasks...")
+        owner = User(email=OWNER, hashed_password="!", first_name="Bench", last_name="Owner", age=0)
+        db.add(owner)
+        db.flush()
+        seed(db, owner, rows)
+        query = db.query(Task).filter(Task.user_id == owner.id)
+        skip = (page - 1) * limit
+
+        def offset_page():
+            return query.order_by(Task.due_at, Task.id).offset(skip).limit(limit).all()
+
+        # Cursor a client would hold after walking to the previous page
+        last = query.order_by(Task.due_at, Task.id).offset(skip - 1).limit(1).one()
+        cursor = encode_cursor(last.due_at, last.id)
+
+        def cursor_page():
+            return keyset_page(query, Task.due_at, Task.id, cursor, limit)
+
+        assert [t.id for t in offset_page()] == [t.id for t in cursor_page()[0]]
+
+        offset_ms = timed(offset_page, repeat)
+        cursor_ms = timed(cursor_page, repeat)
+        print(f"📄 page {page} x {limit} rows")
+        print(f"⏱️  offset: {offset_ms:8.2f} ms")
+        print(f"⏱️  cursor: {cursor_ms:8.2f} ms  ({offset_ms / cursor_ms:.1f}x faster)")
+    finally:
+        db.rollback()
+        db.execute(delete(Task).where(Task.user_email == OWNER))
+        db.execute(delete(User).where(User.email == OWNER))
+        db.commit()
+        db.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--page", type=int, default=1000)
+    parser.add_argument("--limit", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    main(args.rows, args.page, args.limit, args.repeat)
@@ -0,0 +1,134 @@
+# scripts/bench_reminders.py
+"""
+Claim 50k reminders that all fall due in the same minute.
+
+Seeds --rows tasks for a throwaway owner in the configured database, then
+drains them with claim_reminder_batch from --workers threads at once (each
+its own session, as separate scheduler processes would) and checks every
+task got exactly one notification. --legacy first times the old
+one-commit-per-task loop on the same rows for comparison. No email is sent.
+
+    python scripts/bench_reminders.py --rows 50000 --workers 4
+"""
+
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from sqlalchemy import delete, func, insert, select, update
+
+from app.config import settings
+from app.database import SessionLocal
+from app.models import Notification, Task, User
+from app.scheduler import claim_reminder_batch
+
+OWNER = "bench-reminders@example.com"
+
+
+def seed(db, owner, rows):
+    remind_at = datetime.utcnow()
+    due = remind_at + timedelta(minutes=1)
+    for offset in range(0, rows, 10000):
+        db.execute(insert(Task), [
+            {"title": f"reminder {i}", "due_at": due, "user_id": owner.id,
+             "user_email": owner.email, "reminded": False, "remind_at": remind_at}
+            for i in range(offset, min(offset + 10000, rows))
+        ])
+    db.commit()
+
+
+def reset(db, owner_id, remind_at):
+    task_ids = select(Task.id).where(Task.user_id == owner_id)
+    db.execute(delete(Notification).where(Notification.task_id.in_(task_ids)))
+    db.execute(update(Task).where(Task.user_id == owner_id).values(reminded=False, remind_at=remind_at))
+    db.commit()
+
+
+def legacy(owner_id, now, soon):
+    """The pre-batching loop: one notification, commit and refresh per task"""
+    db = SessionLocal()
+    try:
+        tasks = db.query(Task).filter(
+            Task.user_id == owner_id, Task.due_at <= soon, Task.due_at >= now, Task.reminded == False
+        ).all()
+        for task in tasks:
+            db.add(Notification(task_id=task.id, message=f"Task '{task.title}' due."))
+            task.reminded = True
+            db.commit()
+            db.refresh(task)
+        return len(tasks)
+    finally:
+        db.close()
+
+
+def drain(now, batch_size):
+    db = SessionLocal()
+    claimed = 0
+    try:
+        while True:
+            batch = claim_reminder_batch(db, now, batch_size)
+            claimed += len(batch)
+            if len(batch) < batch_size:
+                return claimed
+    finally:
+        db.close()
+
+
+def main(rows, workers, batch_size, run_legacy):
+    db = SessionLocal()
+    try:
+        owner = User(email=OWNER, hashed_password="!", first_name="Bench", last_name="Owner", age=0)
+        db.add(owner)
+        db.commit()
+        seed(db, owner, rows)
+        now = datetime.utcnow()
+        soon = now + timedelta(minutes=5)
+        print(f"📊 {rows} reminders due in the same minute")
+
+        if run_legacy:
+            start = time.perf_counter()
+            sent = legacy(owner.id, now, soon)
+            elapsed = time.perf_counter() - start
+            print(f"🐢 legacy loop: {sent} in {elapsed:.1f}s ({sent / elapsed:.0f}/s)")
+            reset(db, owner.id, now)
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(workers) as pool:
+            claimed = list(pool.map(lambda _: drain(now, batch_size), range(workers)))
+        elapsed = time.perf_counter() - start
+        print(f"⚡ batched claim, {workers} workers x {batch_size}/batch: {sum(claimed)} in {elapsed:.2f}s "
+              f"({sum(claimed) / elapsed:.0f}/s), per worker {claimed}")
+
+        notified = db.execute(
+            select(func.count(Notification.id), func.count(func.distinct(Notification.task_id)))
+            .join(Notification.task).where(Task.user_id == owner.id)
+        ).one()
+        if notified[0] == notified[1] == rows:
+            print("✅ every task notified exactly once")
+        else:
+            print(f"❌ {notified[0]} notifications for {notified[1]} of {rows} tasks")
+    finally:
+        db.rollback()
+        owner_id = db.query(User.id).filter(User.email == OWNER).scalar()
+        if owner_id is not None:
+            task_ids = select(Task.id).where(Task.user_id == owner_id)
+            db.execute(delete(Notification).where(Notification.task_id.in_(task_ids)))
+            db.execute(delete(Task).where(Task.user_id == owner_id))
+            db.execute(delete(User).where(User.id == owner_id))
+        db.commit()
+        db.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=50000)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--batch-size", type=int, default=settings.reminder_batch_size)
+    parser.add_argument("--legacy", action="store_true", help="also time the old per-task loop")
+    args = parser.parse_args()
+    main(args.rows, args.workers, args.batch_size, args.legacy)
@@ -0,0 +1,126 @@
+# scripts/bench_serialization.py
+"""
+Time every list route with and without the fast JSON path, and compare
+full payloads with sparse fieldsets (?fields=).
+
+Seeds tasks (half overdue, half upcoming) and one notification per task for
+a throwaway owner in the configured database, then requests each list
+route through the app in both modes and checks the bodies are identical.
+Authentication is bypassed so only query + serialization is measured.
+
+    python scripts/bench_serialization.py --rows 100 --repeat 200
+"""
+
+import argparse
+import logging
+import os
+import sys
+import time
+from datetime import datetime, timedelta
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from fastapi.testclient import TestClient
+from sqlalchemy import delete, insert, select
+
+from app.auth.dependencies import Principal, get_current_active_user
+from app.config import settings
+from app.database import SessionLocal
+from app.main import app
+from app.models import Notification, Task, User
+
+OWNER = "bench-serialization@example.com"
+
+# Dashboard-style sparse fieldsets, compared against the full payload
+SPARSE = [
+    ("/tasks/?limit={rows}", "id,title,due_at"),
+    ("/notifications/?limit={rows}", "id,message"),
+]
+
+ROUTES = [
+    "/tasks/?limit={rows}",
+    "/tasks/?cursor=&limit={rows}",
+    "/tasks/upcoming?hours=100000",
+    "/tasks/overdue",
+    "/notifications/?limit={rows}",
+    "/notifications/?cursor=&limit={rows}",
+]
+
+
+def seed(db, owner, rows):
+    now = datetime.utcnow()
+    db.execute(insert(Task), [
+        {
+            "title": f"bench task {i}",
+            "description": "Lorem ipsum dolor sit amet " * 4,
+            "due_at": now + timedelta(minutes=i - rows // 2),
+            "user_id": owner.id,
+            "user_email": owner.email,
+            "reminded": False,
+        }
+        for i in range(rows)
+    ])
+    task_ids = db.execute(select(Task.id).where(Task.user_id == owner.id)).scalars().all()
+    db.execute(insert(Notification), [
+        {"task_id": task_id, "message": f"Reminder for task {task_id}"} for task_id in task_ids
+    ])
+    db.commit()
+
+
+def timed(client, url, repeat):
+    body = client.get(url).content
+    start = time.perf_counter()
+    for _ in range(repeat):
+        client.get(url)
+    return (time.perf_counter() - start) / repeat * 1000, body
+
+
+def main(rows, repeat):
+    db = SessionLocal()
+    try:
+        owner = User(email=OWNER, hashed_password="!", first_name="Bench", last_name="Owner", age=0)
+        db.add(owner)
+        db.commit()
+        seed(db, owner, rows)
+        principal = Principal(id=owner.id, email=owner.email)
+        app.dependency_overrides[get_current_active_user] = lambda: principal
+
+        # No context manager: skip the lifespan so the scheduler stays off
+        client = TestClient(app)
+        logging.getLogger("httpx").setLevel(logging.WARNING)
+        print(f"📊 {rows} rows per page, {repeat} requests per route")
+        for route in ROUTES:
+            url = route.format(rows=rows)
+            settings.fast_json_responses = False
+            schema_ms, expected = timed(client, url, repeat)
+            settings.fast_json_responses = True
+            fast_ms, actual = timed(client, url, repeat)
+            assert actual == expected, f"{url}: fast path output differs"
+            print(f"⏱️  {url:45} schema {schema_ms:7.2f} ms  fast {fast_ms:7.2f} ms  "
+                  f"({schema_ms / fast_ms:.1f}x)")
+
+        for route, fields in SPARSE:
+            url = route.format(rows=rows)
+            full_ms, full = timed(client, url, repeat)
+            sparse_ms, sparse = timed(client, f"{url}&fields={fields}", repeat)
+            print(f"✂️  {url:45} fields={fields}: {len(full)} -> {len(sparse)} bytes, "
+                  f"{full_ms:.2f} -> {sparse_ms:.2f} ms")
+    finally:
+        app.dependency_overrides.pop(get_current_active_user, None)
+        db.rollback()
+        owner_id = db.query(User.id).filter(User.email == OWNER).scalar()
+        if owner_id is not None:
+            task_ids = select(Task.id).where(Task.user_id == owner_id)
+            db.execute(delete(Notification).where(Notification.task_id.in_(task_ids)))
+            db.execute(delete(Task).where(Task.user_id == owner_id))
+            db.execute(delete(User).where(User.id == owner_id))
+        db.commit()
+        db.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+    main(args.rows, args.repeat)
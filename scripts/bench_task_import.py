@@ -0,0 +1,90 @@
+# scripts/bench_task_import.py
+"""
+Measure bulk task import throughput (rows/sec) against one-by-one inserts.
+
+Builds a CSV in memory, loads it for a throwaway owner through the same
+path POST /tasks/import uses (COPY on PostgreSQL, batched INSERT
+elsewhere), times the per-row create_task pattern on a smaller sample,
+then removes everything it wrote.
+
+    python scripts/bench_task_import.py --rows 100000 --baseline-rows 2000
+"""
+
+import argparse
+import io
+import os
+import sys
+import time
+from datetime import datetime, timedelta
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from sqlalchemy import delete
+
+from app.database import SessionLocal
+from app.models import Task, User, UserTaskCounter, UserTaskDueBucket
+from app.task_counters import record_task_changes
+from app.utils.task_import import import_tasks
+
+OWNER = "bench-import@example.com"
+
+
+def build_csv(rows):
+    start = datetime.utcnow()
+    lines = ["title,description,due_at"]
+    for i in range(rows):
+        lines.append(f"bench {i},imported row {i},{(start + timedelta(minutes=i)).isoformat()}")
+    return ("\n".join(lines) + "\n").encode()
+
+
+def per_row(db, owner, rows):
+    start = datetime.utcnow()
+    for i in range(rows):
+        task = Task(title=f"row {i}", due_at=start + timedelta(minutes=i),
+                    user_id=owner.id, user_email=owner.email)
+        db.add(task)
+        record_task_changes(db, owner.id, added=[task.due_at])
+        db.commit()
+
+
+def main(rows, baseline_rows, chunk_size):
+    db = SessionLocal()
+    try:
+        owner = User(email=OWNER, hashed_password="!", first_name="Bench", last_name="Owner", age=0)
+        db.add(owner)
+        db.commit()
+
+        payload = build_csv(rows)
+        print(f"📦 {rows} rows, {len(payload) / 1e6:.1f} MB of CSV ({db.get_bind().dialect.name})")
+
+        start = time.perf_counter()
+        result = import_tasks(db, owner.id, owner.email, io.BytesIO(payload), "csv", chunk_size=chunk_size)
+        db.commit()
+        bulk = time.perf_counter() - start
+        assert result["imported"] == rows, result["errors"][:5]
+        print(f"🚀 import: {bulk:8.2f} s  {rows / bulk:10.0f} rows/s")
+
+        start = time.perf_counter()
+        per_row(db, owner, baseline_rows)
+        single = time.perf_counter() - start
+        print(f"🐢 per-row: {single:7.2f} s  {baseline_rows / single:10.0f} rows/s  "
+              f"({(rows / bulk) / (baseline_rows / single):.1f}x slower)")
+    finally:
+        db.rollback()
+        owner_id = db.query(User.id).filter(User.email == OWNER).scalar()
+        if owner_id is not None:
+            db.execute(delete(Task).where(Task.user_id == owner_id))
+            db.execute(delete(UserTaskDueBucket).where(UserTaskDueBucket.user_id == owner_id))
+            db.execute(delete(UserTaskCounter).where(UserTaskCounter.user_id == owner_id))
+            db.execute(delete(User).where(User.id == owner_id))
+        db.commit()
+        db.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--baseline-rows", type=int, default=2_000)
+    parser.add_argument("--chunk-size", type=int, default=1000)
+    args = parser.parse_args()
+    main(args.rows, args.baseline_rows, args.chunk_size)
@@ -0,0 +1,104 @@
+# scripts/bench_user_id_index.py
+"""
+Compare owner lookups keyed by user_email (text) versus user_id (integer).
+
+Builds two scratch tables with the same synthetic tasks in PostgreSQL, one
+indexed on (user_email, due_at) and one on (user_id, due_at), then reports
+index sizes and the latency of the upcoming-tasks query for random owners.
+The scratch tables are dropped afterwards.
+
+    python scripts/bench_user_id_index.py --rows 10000000 --users 50000
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from sqlalchemy import text
+
+from app.database import engine
+
+SETUP = [
+    "DROP TABLE IF EXISTS bench_tasks_email",
+    "DROP TABLE IF EXISTS bench_tasks_id",
+    """
+    CREATE TABLE bench_tasks_email AS
+    SELECT g AS id,
+           'user' || (g % :users) || '@example-domain.com' AS user_email,
+           now() - interval '180 days' + (g % 525600) * interval '1 minute' AS due_at
+    FROM generate_series(1, :rows) AS g
+    """,
+    """
+    CREATE TABLE bench_tasks_id AS
+    SELECT g AS id,
+           (g % :users)::integer AS user_id,
+           now() - interval '180 days' + (g % 525600) * interval '1 minute' AS due_at
+    FROM generate_series(1, :rows) AS g
+    """,
+    "CREATE INDEX bench_ix_email_due ON bench_tasks_email (user_email, due_at)",
+    "CREATE INDEX bench_ix_id_due ON bench_tasks_id (user_id, due_at)",
+    "ANALYZE bench_tasks_email",
+    "ANALYZE bench_tasks_id",
+]
+
+LOOKUPS = {
+    "user_email": (
+        "SELECT id, due_at FROM bench_tasks_email "
+        "WHERE user_email = :owner AND due_at BETWEEN now() AND now() + interval '24 hours'"
+    ),
+    "user_id": (
+        "SELECT id, due_at FROM bench_tasks_id "
+        "WHERE user_id = :owner AND due_at BETWEEN now() AND now() + interval '24 hours'"
+    ),
+}
+
+
+def index_size(conn, name):
+    return conn.execute(text("SELECT pg_relation_size(:name)"), {"name": name}).scalar()
+
+
+def main(rows, users, lookups):
+    with engine.connect() as conn:
+        print(f"🌱 Building {rows:,} rows for {users:,} users...")
+        for statement in SETUP:
+            conn.execute(text(statement), {"rows": rows, "users": users})
+        conn.commit()
+
+        try:
+            email_size = index_size(conn, "bench_ix_email_due")
+            id_size = index_size(conn, "bench_ix_id_due")
+            print(f"📦 (user_email, due_at) index: {email_size / 2**20:8.1f} MiB")
+            print(f"📦 (user_id, due_at) index:    {id_size / 2**20:8.1f} MiB  ({1 - id_size / email_size:.0%} smaller)")
+
+            owners = [random.randrange(users) for _ in range(lookups)]
+            results = {}
+            for label, sql in LOOKUPS.items():
+                timings = []
+                for owner in owners:
+                    value = f"user{owner}@example-domain.com" if label == "user_email" else owner
+                    start = time.perf_counter()
+                    conn.execute(text(sql), {"owner": value}).fetchall()
+                    timings.append((time.perf_counter() - start) * 1000)
+                results[label] = timings
+                print(
+                    f"⏱️  {label:<10} p50={statistics.median(timings):6.3f}ms "
+                    f"p99={sorted(timings)[int(len(timings) * 0.99) - 1]:6.3f}ms"
+                )
+        finally:
+            conn.execute(text("DROP TABLE IF EXISTS bench_tasks_email"))
+            conn.execute(text("DROP TABLE IF EXISTS bench_tasks_id"))
+            conn.commit()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=10_000_000)
+    parser.add_argument("--users", type=int, default=50_000)
+    parser.add_argument("--lookups", type=int, default=2_000)
+    args = parser.parse_args()
+    main(args.rows, args.users, args.lookups)
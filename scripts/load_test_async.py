@@ -0,0 +1,84 @@
+# scripts/load_test_async.py
+"""
+Closed-loop load test: N concurrent clients hammering read endpoints.
+
+Run it once against a deployment with ASYNC_DB=false and once with
+ASYNC_DB=true to compare throughput, e.g.
+
+    ASYNC_DB=false uvicorn app.main:app --port 8000 &
+    python scripts/load_test_async.py --url http://localhost:8000 \\
+        --email load@example.com --password secret123 --clients 500 --duration 30
+
+The account is registered on first use.
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+import httpx
+
+PATHS = ["/tasks/?limit=50", "/tasks/upcoming", "/tasks/stats", "/notifications/?limit=50"]
+
+
+async def login(client, email, password):
+    await client.post("/auth/register", json={
+        "first_name": "Load", "last_name": "Test", "email": email, "password": password, "age": 30,
+    })
+    res = await client.post("/auth/token", data={"username": email, "password": password})
+    res.raise_for_status()
+    return {"Authorization": f"Bearer {res.json()['access_token']}"}
+
+
+async def worker(client, headers, deadline, latencies, errors, offset):
+    i = offset
+    while time.perf_counter() < deadline:
+        path = PATHS[i % len(PATHS)]
+        i += 1
+        start = time.perf_counter()
+        try:
+            res = await client.get(path, headers=headers)
+            if res.status_code != 200:
+                errors.append(res.status_code)
+                continue
+        except httpx.HTTPError as e:
+            errors.append(type(e).__name__)
+            continue
+        latencies.append(time.perf_counter() - start)
+
+
+async def main(url, email, password, clients, duration):
+    limits = httpx.Limits(max_connections=clients, max_keepalive_connections=clients)
+    async with httpx.AsyncClient(base_url=url, limits=limits, timeout=60) as client:
+        headers = await login(client, email, password)
+        latencies, errors = [], []
+        print(f"🚦 {clients} clients for {duration}s against {url}")
+        started = time.perf_counter()
+        deadline = started + duration
+        await asyncio.gather(*[
+            worker(client, headers, deadline, latencies, errors, n) for n in range(clients)
+        ])
+        elapsed = time.perf_counter() - started
+
+    if not latencies:
+        print(f"❌ no successful requests ({len(errors)} errors)")
+        return
+    quantiles = statistics.quantiles(latencies, n=100)
+    print(f"✅ {len(latencies)} ok, {len(errors)} errors in {elapsed:.1f}s")
+    print(f"⚡ throughput: {len(latencies) / elapsed:.0f} req/s")
+    print(f"⏱️  p50 {quantiles[49] * 1000:.0f} ms  p95 {quantiles[94] * 1000:.0f} ms  "
+          f"p99 {quantiles[98] * 1000:.0f} ms")
+    if errors:
+        print(f"⚠️  errors: {sorted(set(map(str, errors)))}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--url", default="http://localhost:8000")
+    parser.add_argument("--email", default="load-test@example.com")
+    parser.add_argument("--password", default="load-test-password")
+    parser.add_argument("--clients", type=int, default=500)
+    parser.add_argument("--duration", type=int, default=30)
+    args = parser.parse_args()
+    asyncio.run(main(args.url, args.email, args.password, args.clients, args.duration))
@@ -0,0 +1,61 @@
+# scripts/precompress_static.py
+"""
+Write .gz (and, if the Brotli package is installed, .br) files next to every
+compressible file in the frontend build, for PrecompressedStaticFiles to
+serve. Run after `npm run build`; start.sh does this on deploy.
+
+    python scripts/precompress_static.py --dir frontend/dist
+"""
+
+import argparse
+import gzip
+import os
+
+try:
+    import brotli
+except ImportError:  # optional: gzip alone still covers every browser
+    brotli = None
+
+COMPRESSIBLE = {".html", ".js", ".mjs", ".css", ".json", ".svg", ".txt", ".map", ".xml", ".wasm", ".ico"}
+
+
+def write_if_smaller(path, original_size, data):
+    if len(data) >= original_size:
+        return False
+    with open(path, "wb") as f:
+        f.write(data)
+    return True
+
+
+def precompress(directory, min_size):
+    written = skipped = 0
+    for root, _, files in os.walk(directory):
+        for name in files:
+            path = os.path.join(root, name)
+            if os.path.splitext(name)[1].lower() not in COMPRESSIBLE:
+                continue
+            with open(path, "rb") as f:
+                data = f.read()
+            if len(data) < min_size:
+                skipped += 1
+                continue
+
+            # mtime=0 keeps the output reproducible across builds
+            written += write_if_smaller(path + ".gz", len(data), gzip.compress(data, compresslevel=9, mtime=0))
+            if brotli is not None:
+                written += write_if_smaller(path + ".br", len(data), brotli.compress(data, quality=11))
+    return written, skipped
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--dir", default="frontend/dist")
+    parser.add_argument("--min-size", type=int, default=1024, help="leave smaller files uncompressed")
+    args = parser.parse_args()
+
+    if not os.path.isdir(args.dir):
+        raise SystemExit(f"❌ {args.dir} does not exist - build the frontend first")
+    if brotli is None:
+        print("⚠️  Brotli not installed, writing .gz only (pip install brotli for .br)")
+    written, skipped = precompress(args.dir, args.min_size)
+    print(f"✅ wrote {written} compressed files ({skipped} below {args.min_size} bytes left as-is)")
@@ -5,6 +5,9 @@ cd frontend
 npm install
 npm run build
 
-echo "🚀 Starting FastAPI server..."
+echo "🗜️  Precompressing static assets..."
 cd ..
+python scripts/precompress_static.py --dir frontend/dist
+
+echo "🚀 Starting FastAPI server..."
 uvicorn app.main:app --host 0.0.0.0 --port 10000
@@ -1,4 +1,6 @@
 # tests/conftest.py
+import os
+
 import pytest
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
@@ -6,6 +8,13 @@ from fastapi.testclient import TestClient
 from sqlalchemy.pool import StaticPool
 
 
+# 0️⃣ Tests never touch the configured database: skip the startup pool warm-up
+os.environ["DB_POOL_WARMUP"] = "false"
+# ... and don't run leader election against it either
+os.environ["SCHEDULER_LEADER_ELECTION"] = "false"
+# ... or scan it at startup to fill the reminder timer
+os.environ["REMINDER_TIMER"] = "false"
+
 # 1️⃣ Bring in your FastAPI app
 from app.main import app
 
@@ -44,3 +53,24 @@ app.dependency_overrides[get_db] = override_get_db
 def client():
     with TestClient(app) as c:
         yield c
+
+
+# 8️⃣ Register (once) and log in test users, returning auth headers
+TEST_PASSWORD = "supersecret123"
+
+
+def login_as(client, email):
+    client.post("/auth/register", json={
+        "first_name": "Test",
+        "last_name": "User",
+        "email": email,
+        "password": TEST_PASSWORD,
+        "age": 30,
+    })
+    res = client.post("/auth/token", data={"username": email, "password": TEST_PASSWORD})
+    return {"Authorization": f"Bearer {res.json()['access_token']}"}
+
+
+@pytest.fixture(scope="module")
+def auth_headers(client):
+    return login_as(client, "tester@example.com")
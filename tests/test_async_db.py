@@ -0,0 +1,102 @@
+"""The async routers against an aiosqlite engine, with the sync routers behind them"""
+import asyncio
+
+import pytest
+from fastapi import FastAPI
+from fastapi.routing import APIRoute
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool
+
+from app.database import Base, async_database_url
+from app.dependencies import get_async_db, get_db
+from app.main import include_async_routers
+from app.routers import auth, notifications, tasks, users
+from tests.conftest import TEST_PASSWORD, login_as
+
+EMAIL = "async@example.com"
+
+
+@pytest.fixture(scope="module")
+def async_client(tmp_path_factory):
+    url = f"sqlite:///{tmp_path_factory.mktemp('async_db') / 'tasks.db'}"
+    sync_engine = create_engine(url, connect_args={"check_same_thread": False})
+    Base.metadata.create_all(sync_engine)
+    SyncSession = sessionmaker(bind=sync_engine, autoflush=False)
+    async_engine = create_async_engine(async_database_url(url), poolclass=NullPool)
+    AsyncSession = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+
+    def override_get_db():
+        with SyncSession() as db:
+            yield db
+
+    async def override_get_async_db():
+        async with AsyncSession() as db:
+            yield db
+
+    app = FastAPI()
+    include_async_routers(app)
+    app.include_router(auth.router, prefix="/auth")
+    app.include_router(tasks.router, prefix="/tasks")
+    app.include_router(notifications.router, prefix="/notifications")
+    app.include_router(users.router, prefix="/users")
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_async_db] = override_get_async_db
+
+    with TestClient(app) as client:
+        yield client
+    sync_engine.dispose()
+
+
+def endpoint_for(client, path, method):
+    for route in client.app.routes:
+        if isinstance(route, APIRoute) and method in route.methods and route.path_regex.match(path):
+            return route.endpoint
+
+
+def test_hot_paths_are_served_async(async_client):
+    for path, method in [("/tasks/", "GET"), ("/tasks/1", "PUT"), ("/auth/token", "POST"),
+                         ("/notifications/", "GET"), ("/users/me", "GET")]:
+        assert asyncio.iscoroutinefunction(endpoint_for(async_client, path, method)), path
+    assert endpoint_for(async_client, "/tasks/export", "GET") is tasks.export_tasks
+
+
+def test_task_lifecycle(async_client):
+    headers = login_as(async_client, EMAIL)
+    assert async_client.get("/users/me", headers=headers).json()["email"] == EMAIL
+
+    created = [
+        async_client.post("/tasks/", headers=headers, json={
+            "title": f"async {i}", "due_at": f"2031-01-0{i + 1}T09:00:00", "user_email": EMAIL,
+        }).json()
+        for i in range(3)
+    ]
+    assert [t["title"] for t in async_client.get("/tasks/", headers=headers).json()] == ["async 0", "async 1", "async 2"]
+
+    page = async_client.get("/tasks/?cursor=&limit=2&fields=title", headers=headers).json()
+    assert page["items"] == [{"title": "async 0"}, {"title": "async 1"}] and page["next_cursor"]
+
+    task_id = created[0]["id"]
+    res = async_client.put(f"/tasks/{task_id}", headers=headers, json={"title": "renamed"})
+    assert res.json()["title"] == "renamed"
+    assert async_client.get(f"/tasks/{task_id}?fields=title", headers=headers).json() == {"title": "renamed"}
+
+    notification = async_client.post("/notifications/", headers=headers,
+                                      json={"task_id": task_id, "message": "ping"}).json()
+    assert async_client.get(f"/notifications/{notification['id']}", headers=headers).json()["message"] == "ping"
+    assert async_client.get("/notifications/unread/count", headers=headers).json() == {"unread_count": 1}
+
+    assert async_client.delete(f"/tasks/{task_id}", headers=headers).status_code == 204
+    assert async_client.get(f"/tasks/{task_id}", headers=headers).status_code == 404
+    assert async_client.get("/tasks/stats", headers=headers).json()["total_tasks"] == 2
+
+    # Routes without an async version still work against the same database
+    export = async_client.get("/tasks/export", headers=headers)
+    assert len(export.text.splitlines()) == 2
+
+
+def test_login_rejects_bad_password(async_client):
+    res = async_client.post("/auth/token", data={"username": EMAIL, "password": TEST_PASSWORD + "x"})
+    assert res.status_code == 401
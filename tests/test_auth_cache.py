@@ -0,0 +1,26 @@
+from app.auth.cache import principal_cache
+
+
+def test_repeated_requests_hit_principal_cache(client, auth_headers):
+    principal_cache.clear()
+    before = principal_cache.stats()
+
+    assert client.get("/users/me", headers=auth_headers).status_code == 200
+    assert client.get("/users/me", headers=auth_headers).status_code == 200
+
+    after = principal_cache.stats()
+    assert after["misses"] == before["misses"] + 1
+    assert after["hits"] == before["hits"] + 1
+
+
+def test_profile_update_through_cached_user_is_persisted(client, auth_headers):
+    # Warm the cache so the update runs against a cached principal
+    client.get("/users/me", headers=auth_headers)
+
+    res = client.put("/users/me", json={"first_name": "Cached"}, headers=auth_headers)
+    assert res.status_code == 200
+    assert res.json()["first_name"] == "Cached"
+
+    # The update invalidated the entry, so this read comes from the database
+    res = client.get("/users/me", headers=auth_headers)
+    assert res.json()["first_name"] == "Cached"
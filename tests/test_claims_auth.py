@@ -0,0 +1,30 @@
+import pytest
+
+from app.auth.cache import principal_cache
+from app.config import settings
+from tests.conftest import login_as
+
+
+@pytest.fixture
+def claims_mode(monkeypatch):
+    monkeypatch.setattr(settings, "auth_claims_tokens", True)
+
+
+def test_claims_token_skips_user_lookup(client, claims_mode):
+    headers = login_as(client, "claims@example.com")
+    principal_cache.clear()
+    before = principal_cache.stats()
+
+    assert client.get("/tasks/", headers=headers).status_code == 200
+    assert client.get("/notifications/", headers=headers).status_code == 200
+
+    after = principal_cache.stats()
+    assert (after["hits"], after["misses"]) == (before["hits"], before["misses"])
+
+
+def test_deactivation_revokes_claims_tokens(client, claims_mode):
+    headers = login_as(client, "claims-revoked@example.com")
+    assert client.get("/tasks/", headers=headers).status_code == 200
+
+    assert client.delete("/users/me", headers=headers).status_code == 204
+    assert client.get("/tasks/", headers=headers).status_code == 401
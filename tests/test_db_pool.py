@@ -0,0 +1,76 @@
+import asyncio
+
+import pytest
+from sqlalchemy import create_engine, exc
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.config import settings
+from app.database import engine_options
+from app.db_pool import InstrumentedAsyncQueuePool, InstrumentedQueuePool, pool_stats, warm_up, warm_up_async
+
+
+@pytest.fixture
+def pooled_engine(tmp_path):
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'pool.db'}", poolclass=InstrumentedQueuePool,
+        pool_size=2, max_overflow=0, pool_timeout=0.1,
+    )
+    yield engine
+    engine.dispose()
+
+
+def test_warm_up_fills_the_pool(pooled_engine):
+    assert warm_up(pooled_engine, 2) == 2
+    stats = pool_stats(pooled_engine)
+    assert stats["idle"] == 2 and stats["checked_out"] == 0
+    assert stats["connects"] == 2
+
+
+def test_async_warm_up_fills_the_pool(tmp_path):
+    async def warm():
+        engine = create_async_engine(
+            f"sqlite+aiosqlite:///{tmp_path / 'pool.db'}", poolclass=InstrumentedAsyncQueuePool, pool_size=2,
+        )
+        try:
+            return await warm_up_async(engine, 2), pool_stats(engine.sync_engine)
+        finally:
+            await engine.dispose()
+
+    opened, stats = asyncio.run(warm())
+    assert opened == 2
+    assert stats["idle"] == 2 and stats["connects"] == 2
+
+
+def test_gauges_track_checkouts_and_waits(pooled_engine):
+    first, second = pooled_engine.connect(), pooled_engine.connect()
+    assert pool_stats(pooled_engine)["checked_out"] == 2
+
+    with pytest.raises(exc.TimeoutError):
+        pooled_engine.connect()
+    stats = pool_stats(pooled_engine)
+    assert stats["timeouts"] == 1
+    assert stats["wait_ms_max"] >= 100
+
+    first.close()
+    second.close()
+    assert pool_stats(pooled_engine)["checked_out"] == 0
+
+
+def test_postgres_engine_options(monkeypatch):
+    monkeypatch.setattr(settings, "db_statement_timeout_ms", 5000)
+    options = engine_options("postgresql://u:p@db/tasks")
+    assert options["poolclass"] is InstrumentedQueuePool
+    assert options["pool_pre_ping"] is settings.db_pool_pre_ping
+    assert options["connect_args"] == {"options": "-c statement_timeout=5000"}
+
+    async_options = engine_options("postgresql://u:p@db/tasks", is_async=True)
+    assert async_options["poolclass"] is InstrumentedAsyncQueuePool
+    assert async_options["connect_args"] == {"server_settings": {"statement_timeout": "5000"}}
+
+    monkeypatch.setattr(settings, "db_statement_timeout_ms", 0)
+    assert "connect_args" not in engine_options("postgresql://u:p@db/tasks")
+
+
+def test_health_reports_pool(client):
+    pool = client.get("/health").json()["db_pool"]
+    assert {"size", "checked_out", "overflow", "wait_ms_avg"} <= set(pool["primary"])
@@ -0,0 +1,45 @@
+import pytest
+
+from app.config import settings
+from tests.conftest import login_as
+
+ROUTES = [
+    "/tasks/",
+    "/tasks/?cursor=",
+    "/tasks/?cursor=&limit=2",
+    "/tasks/upcoming?hours=100000",
+    "/tasks/overdue",
+    "/notifications/",
+    "/notifications/?cursor=&limit=1",
+]
+
+
+@pytest.fixture(scope="module")
+def headers(client):
+    headers = login_as(client, "fastjson@example.com")
+    for title, description, due_at in [
+        ("Überweisung prüfen ✓", None, "2020-05-01T08:30:00.123456"),
+        ('quotes "and" \\ slashes', "line\nbreak", "2031-01-01T00:00:00"),
+        ("plain", "", "2031-06-01T12:00:00+02:00"),
+    ]:
+        task = client.post("/tasks/", headers=headers, json={
+            "title": title, "description": description, "due_at": due_at,
+            "user_email": "fastjson@example.com",
+        }).json()
+        client.post("/notifications/", headers=headers, json={
+            "task_id": task["id"], "message": f"Reminder — {title}",
+        })
+    return headers
+
+
+@pytest.mark.parametrize("route", ROUTES)
+def test_fast_path_is_byte_identical(client, headers, route, monkeypatch):
+    monkeypatch.setattr(settings, "fast_json_responses", False)
+    expected = client.get(route, headers=headers)
+    monkeypatch.setattr(settings, "fast_json_responses", True)
+    actual = client.get(route, headers=headers)
+
+    assert actual.status_code == expected.status_code == 200
+    assert actual.headers["content-type"] == expected.headers["content-type"]
+    assert actual.content == expected.content
+    assert len(actual.json()) > 0
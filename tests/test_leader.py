@@ -0,0 +1,40 @@
+import pytest
+from sqlalchemy import create_engine
+
+from app.leader import LeaderElection, fcntl
+
+
+@pytest.fixture
+def sqlite_engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'leader.db'}")
+    yield engine
+    engine.dispose()
+
+
+@pytest.mark.skipif(fcntl is None, reason="file locks need fcntl")
+def test_file_lock_elects_one_leader_and_fails_over(sqlite_engine, tmp_path):
+    lock_file = str(tmp_path / "scheduler.lock")
+    first = LeaderElection(sqlite_engine, 1, lock_file)
+    second = LeaderElection(sqlite_engine, 1, lock_file)
+
+    assert first.check() and first.backend == "file"
+    assert not second.check()
+    assert first.check() and not second.is_leader
+
+    # Leader goes away: the follower takes over on its next check
+    first.release()
+    assert not first.is_leader
+    assert second.check()
+    assert second.stats()["leader"] and second.stats()["leader_since"]
+    second.release()
+
+
+def test_disabled_election_always_leads(sqlite_engine, tmp_path):
+    election = LeaderElection(sqlite_engine, 1, str(tmp_path / "x.lock"), enabled=False)
+    assert election.is_leader and election.check()
+
+
+def test_health_reports_leadership(client):
+    scheduler = client.get("/health").json()["scheduler"]
+    assert scheduler["leader"] is True
+    assert scheduler["election"] is False
@@ -0,0 +1,59 @@
+import logging
+
+from app.config import settings
+from app.metrics import Histogram, normalize_sql, observe_job, scheduler_batch_size
+
+
+def test_metrics_are_labelled_by_route_template(client, auth_headers):
+    task = client.post("/tasks/", headers=auth_headers, json={
+        "title": "Metric", "due_at": "2030-01-01T00:00:00", "user_email": "tester@example.com",
+    }).json()
+    client.get(f"/tasks/{task['id']}", headers=auth_headers)
+    client.get("/no-such-page")
+
+    body = client.get("/metrics").text
+    assert 'http_requests_total{method="GET",route="/tasks/{task_id}",status="200"}' in body
+    assert f"/tasks/{task['id']}\"" not in body
+    assert 'route="<unmatched>",status="404"' in body
+    assert 'db_queries_per_request_count{route="/tasks/{task_id}"}' in body
+    assert "threadpool_threads_total " in body
+
+
+def test_histogram_buckets_are_cumulative():
+    histogram = Histogram("demo_seconds", "demo", ("job",), buckets=(0.1, 1.0))
+    for value in (0.05, 0.5, 5):
+        histogram.observe(value, "x")
+    lines = list(histogram.render())
+    assert 'demo_seconds_bucket{job="x",le="0.1"} 1' in lines
+    assert 'demo_seconds_bucket{job="x",le="1"} 2' in lines
+    assert 'demo_seconds_bucket{job="x",le="+Inf"} 3' in lines
+    assert 'demo_seconds_count{job="x"} 3' in lines
+
+
+def test_observe_job_records_batch_size():
+    before = scheduler_batch_size.count("unit_test_job")
+    observe_job("unit_test_job", 0.2, 42)
+    assert scheduler_batch_size.count("unit_test_job") == before + 1
+
+
+def test_server_timing_header(client, auth_headers):
+    res = client.get("/tasks/", headers=auth_headers)
+    db_part, app_part = res.headers["server-timing"].split(", ")
+    assert db_part.startswith("db;dur=") and float(db_part[7:]) > 0
+    assert app_part.startswith("app;dur=")
+
+
+def test_slow_queries_are_logged_with_route(client, auth_headers, monkeypatch, caplog):
+    monkeypatch.setattr(settings, "slow_query_ms", 1e-6)
+    with caplog.at_level(logging.WARNING, logger="app.metrics"):
+        client.get("/tasks/?limit=7", headers=auth_headers)
+    slow = [r.getMessage() for r in caplog.records if r.getMessage().startswith("Slow query")]
+    assert slow and all("on /tasks/:" in message for message in slow)
+    assert any("LIMIT ? OFFSET ?" in message for message in slow)
+
+
+def test_normalize_sql():
+    assert normalize_sql("SELECT *\n  FROM t WHERE id IN (?, ?, ?) AND name = 'o''k' AND n > 10") == \
+        "SELECT * FROM t WHERE id IN (?) AND name = ? AND n > ?"
+    assert normalize_sql("SELECT x::text FROM t WHERE a = %(a_1)s AND b = $2") == \
+        "SELECT x::text FROM t WHERE a = ? AND b = ?"
@@ -0,0 +1,58 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from tests.conftest import login_as
+
+
+@pytest.fixture(scope="module")
+def headers(client):
+    headers = login_as(client, "pager@example.com")
+    base = datetime.now(timezone.utc) + timedelta(days=1)
+    for i in range(5):
+        client.post("/tasks/", headers=headers, json={
+            "title": f"task {i}",
+            # two tasks share a due time to exercise the id tie-breaker
+            "due_at": (base + timedelta(hours=i // 2)).isoformat(),
+            "user_email": "pager@example.com",
+        })
+    return headers
+
+
+def test_cursor_pages_cover_all_tasks_in_order(client, headers):
+    seen, cursor = [], ""
+    while True:
+        res = client.get("/tasks/", params={"limit": 2, "cursor": cursor}, headers=headers)
+        assert res.status_code == 200
+        page = res.json()
+        seen.extend(page["items"])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+
+    assert [t["title"] for t in seen] == [f"task {i}" for i in range(5)]
+    keys = [(t["due_at"], t["id"]) for t in seen]
+    assert keys == sorted(keys)
+
+
+def test_offset_mode_still_returns_a_list(client, headers):
+    res = client.get("/tasks/", params={"skip": 1, "limit": 2}, headers=headers)
+    assert res.status_code == 200
+    assert isinstance(res.json(), list)
+    assert len(res.json()) == 2
+
+
+def test_invalid_cursor_is_rejected(client, headers):
+    res = client.get("/tasks/", params={"cursor": "not-a-cursor"}, headers=headers)
+    assert res.status_code == 400
+
+
+@pytest.mark.parametrize("params", [
+    {"cursor": "", "limit": 0},
+    {"cursor": "", "limit": -1},
+    {"limit": 1001},
+    {"skip": -1},
+])
+def test_page_bounds_are_validated(client, headers, params):
+    for path in ("/tasks/", "/notifications/"):
+        assert client.get(path, params=params, headers=headers).status_code == 422
@@ -0,0 +1,27 @@
+import asyncio
+
+import pytest
+
+from app.utils.password_hashing import PasswordHasher, PasswordHasherBusy
+
+
+def test_pool_hashes_and_verifies():
+    hasher = PasswordHasher(max_workers=1, max_pending=4)
+    try:
+        hashed = asyncio.run(hasher.hash("s3cret"))
+        assert asyncio.run(hasher.verify("s3cret", hashed))
+        assert not asyncio.run(hasher.verify("wrong", hashed))
+        assert hasher.stats()["completed"] == 3
+        assert hasher.stats()["in_flight"] == 0
+    finally:
+        hasher.shutdown()
+
+
+def test_pool_rejects_when_queue_is_full():
+    hasher = PasswordHasher(max_workers=1, max_pending=0)
+    try:
+        with pytest.raises(PasswordHasherBusy):
+            asyncio.run(hasher.hash("s3cret"))
+        assert hasher.stats()["rejected"] == 1
+    finally:
+        hasher.shutdown()
@@ -0,0 +1,71 @@
+"""Guard the task hot paths against regressing to full table scans"""
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import event, insert, text
+
+from app.models import Task
+from app.scheduler import due_reminders_query
+from tests.conftest import TestingSessionLocal, engine, login_as
+
+OWNER = "plans@example.com"
+
+
+@pytest.fixture(scope="module")
+def headers(client):
+    headers = login_as(client, OWNER)
+    now = datetime.utcnow()
+    db = TestingSessionLocal()
+    try:
+        rows = [
+            {"title": f"seed {i}", "due_at": now + timedelta(minutes=37 * i - 5000),
+             "user_id": 1000 + i % 50, "user_email": f"seed{i % 50}@example.com", "reminded": i % 3 == 0}
+            for i in range(2000)
+        ]
+        db.execute(insert(Task), rows)
+        db.commit()
+    finally:
+        db.close()
+    return headers
+
+
+def capture_task_queries(fn):
+    statements = []
+
+    def listener(conn, cursor, statement, parameters, context, executemany):
+        if "FROM tasks" in statement:
+            statements.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", listener)
+    try:
+        fn()
+    finally:
+        event.remove(engine, "before_cursor_execute", listener)
+    return statements
+
+
+def query_plan(statement, parameters):
+    with engine.connect() as conn:
+        rows = conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters).fetchall()
+    return " | ".join(row[-1] for row in rows)
+
+
+@pytest.mark.parametrize("path", ["/tasks/upcoming", "/tasks/overdue", "/tasks/"])
+def test_task_reads_use_owner_due_index(client, headers, path):
+    statements = capture_task_queries(lambda: client.get(path, headers=headers))
+    assert statements
+    for statement, parameters in statements:
+        plan = query_plan(statement, parameters)
+        assert "ix_tasks_user_id_due_at" in plan, plan
+
+
+def test_scheduler_scan_uses_partial_index(headers):
+    db = TestingSessionLocal()
+    try:
+        now = datetime.utcnow()
+        statement = due_reminders_query(db, now).statement
+        compiled = statement.compile(dialect=engine.dialect, compile_kwargs={"literal_binds": True})
+    finally:
+        db.close()
+    plan = query_plan(str(compiled), ())
+    assert "ix_tasks_remind_at_pending" in plan, plan
@@ -0,0 +1,111 @@
+"""Read routing across a primary and two replica SQLite files"""
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import create_engine, func, insert, select
+from sqlalchemy.orm import sessionmaker
+
+from app import database
+from app.config import settings
+from app.database import Base, RoutingSession
+from app.dependencies import get_db
+from app.main import app
+from app.models import Task, UserLastWrite
+from tests.conftest import login_as
+
+EMAIL = "replicas@example.com"
+
+
+def file_engine(path):
+    engine = create_engine(f"sqlite:///{path}", connect_args={"check_same_thread": False})
+    Base.metadata.create_all(engine)
+    return engine
+
+
+@pytest.fixture(scope="module")
+def dbs(tmp_path_factory):
+    root = tmp_path_factory.mktemp("replicas")
+    primary = file_engine(root / "primary.db")
+    replicas = [file_engine(root / f"replica{i}.db") for i in range(2)]
+    PrimarySession = sessionmaker(bind=primary, autoflush=False)
+
+    def override_get_db():
+        with PrimarySession() as db:
+            yield db
+
+    previous = app.dependency_overrides[get_db]
+    app.dependency_overrides[get_db] = override_get_db
+    yield primary, replicas
+    app.dependency_overrides[get_db] = previous
+
+
+@pytest.fixture(scope="module")
+def seeded(client, dbs):
+    primary, replicas = dbs
+    headers = login_as(client, EMAIL)
+    user_id = client.get("/users/me", headers=headers).json()["id"]
+    # Stand-in for replicated rows: each replica holds a differently titled copy
+    for i, replica in enumerate(replicas):
+        with replica.begin() as conn:
+            conn.execute(insert(Task).values(
+                title=f"replica {i}", due_at=datetime.utcnow() + timedelta(hours=1),
+                user_id=user_id, user_email=EMAIL, reminded=False,
+            ))
+    return headers
+
+
+@pytest.fixture
+def headers(seeded, dbs, monkeypatch):
+    monkeypatch.setattr(database, "replica_engines", dbs[1])
+    return seeded
+
+
+def titles(client, headers, path="/tasks/"):
+    return [task["title"] for task in client.get(path, headers=headers).json()]
+
+
+def test_reads_round_robin_across_replicas(client, headers):
+    seen = {tuple(titles(client, headers)) for _ in range(4)}
+    assert seen == {("replica 0",), ("replica 1",)}
+    assert client.get("/tasks/stats", headers=headers).json()["total_tasks"] == 1
+
+
+def test_writer_sticks_to_primary(client, headers, dbs, monkeypatch):
+    client.post("/tasks/", headers=headers, json={
+        "title": "written", "due_at": "2031-01-01T09:00:00", "user_email": EMAIL,
+    })
+    # Read-your-writes: every read in the window is served by the primary
+    assert all(titles(client, headers) == ["written"] for _ in range(3))
+    assert titles(client, headers, "/tasks/upcoming?hours=100000") == ["written"]
+
+    # The mark lives on the primary, keyed by user, so every worker sees it
+    with dbs[0].connect() as conn:
+        assert conn.scalar(select(func.count()).select_from(UserLastWrite)) == 1
+
+    # Once the window has passed, reads go back to the replicas
+    monkeypatch.setattr(settings, "replica_sticky_seconds", 0)
+    client.post("/tasks/", headers=headers, json={
+        "title": "written again", "due_at": "2031-01-02T09:00:00", "user_email": EMAIL,
+    })
+    assert titles(client, headers)[0].startswith("replica")
+
+
+def test_routing_session_sends_writes_to_primary(dbs):
+    primary, replicas = dbs
+    with RoutingSession(bind=primary, info={"replica": replicas[0]}) as db:
+        db.add(Task(title="routed", due_at=datetime.utcnow(), user_id=999, user_email="x@example.com"))
+        db.commit()
+        assert db.scalars(select(Task.title).where(Task.user_id == 999)).all() == []
+
+    with primary.connect() as conn:
+        assert conn.scalars(select(Task.title).where(Task.user_id == 999)).all() == ["routed"]
+
+
+def test_sticky_reads_leave_the_rotation_alone(client, headers, monkeypatch):
+    client.post("/tasks/", headers=headers, json={
+        "title": "rotation", "due_at": "2031-01-03T09:00:00", "user_email": EMAIL,
+    })
+    calls = []
+    monkeypatch.setattr(database, "next_replica", lambda: calls.append(1))
+    titles(client, headers)
+    assert calls == []
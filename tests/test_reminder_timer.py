@@ -0,0 +1,74 @@
+import asyncio
+import threading
+from datetime import datetime, timedelta
+
+from app.reminder_timer import ReminderTimer
+
+
+def run_timer(scenario, window=timedelta(minutes=1)):
+    fired_at = []
+
+    async def on_due():
+        fired_at.append(datetime.utcnow())
+        return 0
+
+    async def main():
+        timer = ReminderTimer()
+        timer.start(on_due, window)
+        try:
+            await scenario(timer)
+        finally:
+            timer.stop()
+
+    asyncio.run(main())
+    return fired_at
+
+
+def test_fires_when_the_next_reminder_is_due():
+    async def scenario(timer):
+        due = datetime.utcnow() + timedelta(seconds=0.3)
+        timer.schedule(1, due)
+        await asyncio.sleep(0.1)
+        assert timer.stats()["pending"] == 1
+        await asyncio.sleep(0.4)
+        assert timer.stats()["pending"] == 0
+
+    fired_at = run_timer(scenario)
+    assert len(fired_at) == 1
+
+
+def test_clearing_remind_at_disarms():
+    async def scenario(timer):
+        timer.schedule(1, datetime.utcnow() + timedelta(seconds=0.2))
+        timer.schedule(1, None)
+        await asyncio.sleep(0.4)
+
+    assert run_timer(scenario) == []
+
+
+def test_cancelled_and_moved_reminders():
+    async def scenario(timer):
+        now = datetime.utcnow()
+        timer.schedule(1, now + timedelta(seconds=0.2))
+        timer.schedule(2, now + timedelta(seconds=0.2))
+        timer.cancel(1)
+        # Moved later: the stale 0.2s entry must not fire
+        timer.schedule(2, now + timedelta(seconds=0.6))
+        await asyncio.sleep(0.4)
+        assert timer.fired == 0
+        await asyncio.sleep(0.4)
+        assert timer.fired == 1
+
+    run_timer(scenario)
+
+
+def test_outside_window_and_threadsafe_updates():
+    async def scenario(timer):
+        timer.schedule(1, datetime.utcnow() + timedelta(hours=2))
+        worker = threading.Thread(target=timer.schedule_many, args=([(2, datetime.utcnow())],))
+        worker.start()
+        worker.join()
+        await asyncio.sleep(0.1)
+        assert timer.stats()["pending"] == 0
+
+    assert len(run_timer(scenario)) == 1
@@ -0,0 +1,60 @@
+from datetime import datetime, timedelta
+
+from app.reminders import reminder_changes, reminder_schedule
+
+NOW = datetime(2030, 1, 1, 12, 0)
+
+
+def test_schedule_uses_the_earliest_future_lead_time():
+    due = NOW + timedelta(days=3)
+    assert reminder_schedule(due, [60, 24 * 60], NOW)["remind_at"] == due - timedelta(days=1)
+    assert reminder_schedule(due, None, NOW)["remind_at"] == due - timedelta(minutes=5)
+
+
+def test_passed_lead_times_collapse_into_one_immediate_reminder():
+    due = NOW + timedelta(minutes=30)
+    assert reminder_schedule(due, [60, 24 * 60], NOW)["remind_at"] == NOW
+    assert reminder_schedule(NOW - timedelta(minutes=1), None, NOW)["remind_at"] is None
+    assert reminder_schedule(due, [], NOW)["remind_at"] is None
+
+
+def test_changes_only_when_the_schedule_moves():
+    due = NOW + timedelta(days=1)
+    assert reminder_changes({"title": "x"}, due, None) == {}
+    # Edit forms send the unchanged due time back with every save
+    assert reminder_changes({"title": "x", "due_at": due, "reminder_offsets": None}, due, None) == {}
+    assert reminder_changes({"reminder_offsets": [5]}, due, [5]) == {}
+    assert reminder_changes({"reminder_offsets": [60]}, due, [5])["remind_at"] == due - timedelta(hours=1)
+    assert reminder_changes({"reminded": True}, due, None) == {"remind_at": None}
+    moved = reminder_changes({"due_at": due + timedelta(days=1)}, due, None)
+    assert moved["reminded"] is False and moved["remind_at"] > due
+
+
+def test_moving_a_reminded_task_rearms_it(client, auth_headers):
+    due = (datetime.utcnow() + timedelta(days=2)).replace(microsecond=0)
+    task = client.post("/tasks/", headers=auth_headers, json={
+        "title": "Lead times", "due_at": due.isoformat(), "user_email": "tester@example.com",
+        "reminder_offsets": [24 * 60, 60],
+    }).json()
+    assert task["reminder_offsets"] == [24 * 60, 60]
+    assert task["remind_at"] == (due - timedelta(days=1)).isoformat()
+
+    done = client.put(f"/tasks/{task['id']}", headers=auth_headers, json={"reminded": True}).json()
+    assert done["reminded"] is True and done["remind_at"] is None
+
+    renamed = client.put(f"/tasks/{task['id']}", headers=auth_headers, json={
+        "title": "Renamed", "due_at": due.isoformat(),
+    }).json()
+    assert renamed["reminded"] is True and renamed["remind_at"] is None
+
+    moved = client.put(f"/tasks/{task['id']}", headers=auth_headers, json={
+        "due_at": (due + timedelta(days=1)).isoformat(),
+    }).json()
+    assert moved["reminded"] is False
+    assert moved["remind_at"] == due.isoformat()
+
+    bad = client.post("/tasks/", headers=auth_headers, json={
+        "title": "Bad", "due_at": due.isoformat(), "user_email": "tester@example.com",
+        "reminder_offsets": [-5],
+    })
+    assert bad.status_code == 422
@@ -0,0 +1,164 @@
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import delete, func, insert, select
+
+from app import scheduler
+from app.config import settings
+from app.metrics import reminder_backlog
+from app.models import Notification, SchedulerState, Task, User
+from app.reminder_catchup import read_state, reminder_catchup
+from app.reminders import reminder_schedule
+from tests.conftest import TestingSessionLocal
+
+OWNER = "reminders@example.com"
+
+
+@pytest.fixture
+def due_tasks(monkeypatch):
+    sent = []
+
+    async def fake_send(**kwargs):
+        sent.append(kwargs)
+        return True
+
+    monkeypatch.setattr(scheduler, "SessionLocal", TestingSessionLocal)
+    monkeypatch.setattr(scheduler, "send_task_reminder_email", fake_send)
+    monkeypatch.setattr(settings, "reminder_batch_size", 4)
+
+    db = TestingSessionLocal()
+    owner = User(email=OWNER, hashed_password="!", first_name="Rita", last_name="Minder", age=30)
+    db.add(owner)
+    db.commit()
+    now = datetime.utcnow()
+    soon, later = now + timedelta(minutes=2), now + timedelta(hours=2)
+    db.execute(insert(Task), [
+        {"title": f"due {i}", "due_at": soon, "user_id": owner.id, "user_email": OWNER,
+         **reminder_schedule(soon, None)}
+        for i in range(10)
+    ] + [
+        {"title": "later", "due_at": later, "user_id": owner.id, "user_email": OWNER,
+         **reminder_schedule(later, None)}
+    ])
+    db.commit()
+    # Scans run the live path; the catch-up has its own test
+    reminder_catchup.checked_at = now
+    yield db, owner.id, sent
+
+    task_ids = select(Task.id).where(Task.user_id == owner.id)
+    db.execute(delete(Notification).where(Notification.task_id.in_(task_ids)))
+    db.execute(delete(Task).where(Task.user_id == owner.id))
+    db.execute(delete(User).where(User.id == owner.id))
+    db.execute(delete(SchedulerState))
+    db.commit()
+    db.close()
+    scheduler.stop_catch_up()
+
+
+async def run_and_drain():
+    await scheduler.send_due_reminders()
+    await asyncio.gather(*scheduler.pending_emails)
+
+
+def test_due_tasks_are_claimed_once_in_batches(due_tasks):
+    db, owner_id, sent = due_tasks
+
+    asyncio.run(run_and_drain())
+    assert len(sent) == 10
+    assert {mail["task_title"] for mail in sent} == {f"due {i}" for i in range(10)}
+    assert sent[0]["email_to"] == OWNER and sent[0]["user_name"] == "Rita"
+
+    notifications = db.execute(
+        select(func.count(Notification.id)).join(Notification.task).where(Task.user_id == owner_id)
+    ).scalar()
+    assert notifications == 10
+    assert db.query(Task).filter(Task.user_id == owner_id, Task.reminded == False).count() == 1
+
+    asyncio.run(run_and_drain())
+    assert len(sent) == 10
+
+
+def test_claims_are_disjoint(due_tasks):
+    db, _, _ = due_tasks
+    now = datetime.utcnow()
+    first = scheduler.claim_reminder_batch(db, now, 6)
+    second = scheduler.claim_reminder_batch(db, now, 6)
+    assert len(first) == 6 and len(second) == 4
+    assert not {task.id for task in first} & {task.id for task in second}
+
+
+def test_scan_loads_the_reminder_timer(due_tasks):
+    db, owner_id, _ = due_tasks
+    later_id = db.query(Task.id).filter(Task.user_id == owner_id, Task.title == "later").scalar()
+
+    async def scan():
+        timer = scheduler.reminder_timer
+        timer.start(scheduler.process_due_reminders, timedelta(hours=3))
+        try:
+            await run_and_drain()
+            return dict(timer._fire_at)
+        finally:
+            timer.stop()
+
+    armed = asyncio.run(scan())
+    # The ten due now were sent; the task due in two hours is armed for later
+    assert later_id in armed
+    assert not set(armed) & {
+        task_id for (task_id,) in db.query(Task.id).filter(Task.user_id == owner_id, Task.reminded == True)
+    }
+
+
+def test_claim_rearms_later_lead_times(due_tasks):
+    db, owner_id, _ = due_tasks
+    now = datetime.utcnow()
+    due_at = now + timedelta(days=2)
+    task = Task(title="two leads", due_at=due_at, user_id=owner_id, user_email=OWNER,
+                reminder_offsets=[60, 24 * 60], **reminder_schedule(due_at, [60, 24 * 60], now))
+    db.add(task)
+    db.commit()
+    assert task.remind_at == due_at - timedelta(days=1)
+
+    # A day later the first reminder is claimed and the one-hour lead is armed
+    claimed = scheduler.claim_reminder_batch(db, now + timedelta(days=1, seconds=1), 100)
+    assert task.id in {row.id for row in claimed}
+    db.refresh(task)
+    assert task.reminded and task.remind_at == due_at - timedelta(hours=1)
+
+
+def test_missed_reminders_are_caught_up_in_batches(due_tasks, monkeypatch):
+    db, owner_id, sent = due_tasks
+    monkeypatch.setattr(settings, "reminder_catchup_batch_size", 4)
+    monkeypatch.setattr(settings, "reminder_catchup_interval_seconds", 0.01)
+    # Left behind by the last leader before the service went down
+    db.add(SchedulerState(name="reminders", watermark=datetime.utcnow() - timedelta(hours=6)))
+    db.commit()
+
+    # Hold the drain back so nothing claims concurrently on the one test connection
+    drain, cutoffs = scheduler.catch_up_reminders, []
+
+    async def deferred(cutoff):
+        cutoffs.append(cutoff)
+
+    monkeypatch.setattr(scheduler, "catch_up_reminders", deferred)
+
+    async def restart():
+        reminder_catchup.reset()
+        await scheduler.start_catch_up()
+        await scheduler.catch_up_task
+        assert reminder_catchup.active and reminder_catchup.pending == 10
+        assert reminder_backlog.read() == 10
+        # Regular claims leave the backlog to the rate-limited drain
+        assert await scheduler.process_due_reminders() == 0
+        await drain(*cutoffs)
+        await asyncio.gather(*scheduler.pending_emails)
+
+    asyncio.run(restart())
+    assert sorted(mail["task_title"] for mail in sent) == sorted(f"due {i}" for i in range(10))
+    assert not reminder_catchup.active and reminder_catchup.sent == 10
+    assert reminder_backlog.read() == 0
+
+    db.expire_all()
+    state = read_state(db)
+    assert state.catchup_until is None
+    assert state.watermark >= reminder_catchup.checked_at
@@ -0,0 +1,50 @@
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from app.main import app
+
+ORIGIN = "http://localhost:5173"
+
+
+def test_no_base_http_middleware():
+    assert all(m.cls is not BaseHTTPMiddleware for m in app.user_middleware)
+
+
+def test_security_headers_without_origin(client):
+    res = client.get("/")
+    assert res.headers["x-content-type-options"] == "nosniff"
+    assert res.headers["x-frame-options"] == "DENY"
+    assert res.headers["x-xss-protection"] == "1; mode=block"
+    assert "access-control-allow-origin" not in res.headers
+
+
+def test_allowed_origin_is_echoed(client):
+    res = client.get("/", headers={"Origin": ORIGIN})
+    assert res.headers["access-control-allow-origin"] == ORIGIN
+    assert res.headers["access-control-allow-credentials"] == "true"
+    assert "Server-Timing" in res.headers["access-control-expose-headers"]
+    assert res.headers["vary"] == "Origin"
+    assert res.headers["x-frame-options"] == "DENY"
+
+
+def test_disallowed_origin(client):
+    res = client.get("/", headers={"Origin": "https://evil.example"})
+    assert "access-control-allow-origin" not in res.headers
+    assert res.headers["x-frame-options"] == "DENY"
+
+
+def test_preflight(client):
+    res = client.options("/tasks/", headers={
+        "Origin": ORIGIN,
+        "Access-Control-Request-Method": "POST",
+        "Access-Control-Request-Headers": "authorization",
+    })
+    assert res.status_code == 200
+    assert res.headers["access-control-allow-origin"] == ORIGIN
+    assert res.headers["access-control-allow-headers"] == "authorization"
+    assert res.headers["x-content-type-options"] == "nosniff"
+
+
+def test_streaming_response_gets_headers(client, auth_headers):
+    res = client.get("/tasks/export?format=ndjson", headers=auth_headers)
+    assert res.status_code == 200
+    assert res.headers["x-content-type-options"] == "nosniff"
@@ -0,0 +1,69 @@
+import pytest
+from sqlalchemy import event
+
+from tests.conftest import engine, login_as
+
+EMAIL = "sparse@example.com"
+
+
+@pytest.fixture(scope="module")
+def headers(client):
+    headers = login_as(client, EMAIL)
+    for i in range(3):
+        task = client.post("/tasks/", headers=headers, json={
+            "title": f"sparse {i}", "description": "x" * 500,
+            "due_at": f"2031-01-0{i + 1}T09:00:00", "user_email": EMAIL,
+        }).json()
+        client.post("/notifications/", headers=headers, json={"task_id": task["id"], "message": "ping"})
+    return headers
+
+
+def selected_sql(fn):
+    statements = []
+
+    def listener(conn, cursor, statement, parameters, context, executemany):
+        if statement.startswith("SELECT") and "FROM tasks" in statement:
+            statements.append(statement.split("FROM")[0])
+
+    event.listen(engine, "before_cursor_execute", listener)
+    try:
+        result = fn()
+    finally:
+        event.remove(engine, "before_cursor_execute", listener)
+    return result, statements
+
+
+def test_task_fields_limit_select_and_payload(client, headers):
+    res, statements = selected_sql(lambda: client.get("/tasks/?fields=title, id,due_at", headers=headers))
+    assert res.status_code == 200
+    tasks = res.json()
+    assert [list(t) for t in tasks] == [["id", "title", "due_at"]] * 3
+    assert statements and not any("description" in s for s in statements)
+
+    full = client.get("/tasks/", headers=headers)
+    assert len(res.content) * 5 < len(full.content)
+
+    single = client.get(f"/tasks/{tasks[0]['id']}?fields=title", headers=headers)
+    assert single.json() == {"title": tasks[0]["title"]}
+
+
+def test_cursor_pages_without_sort_fields(client, headers):
+    page = client.get("/tasks/?cursor=&limit=2&fields=title", headers=headers).json()
+    assert page["items"] == [{"title": "sparse 0"}, {"title": "sparse 1"}]
+    rest = client.get(f"/tasks/?cursor={page['next_cursor']}&limit=2&fields=title", headers=headers).json()
+    assert rest == {"items": [{"title": "sparse 2"}], "next_cursor": None}
+
+
+def test_notification_fields(client, headers):
+    notifications = client.get("/notifications/?fields=id,message", headers=headers).json()
+    assert [list(n) for n in notifications] == [["id", "message"]] * 3
+    page = client.get("/notifications/?cursor=&limit=1&fields=message", headers=headers).json()
+    assert page["items"] == [{"message": "ping"}] and page["next_cursor"]
+    single = client.get(f"/notifications/{notifications[0]['id']}?fields=task_id", headers=headers)
+    assert list(single.json()) == ["task_id"]
+
+
+@pytest.mark.parametrize("path", ["/tasks/?fields=id,password", "/tasks/overdue?fields=", "/notifications/?fields=user_id"])
+def test_unknown_fields_are_rejected(client, headers, path):
+    res = client.get(path, headers=headers)
+    assert res.status_code == 400
@@ -0,0 +1,80 @@
+import os
+import sys
+
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+
+from app.utils.static_files import IMMUTABLE, REVALIDATE, InMemoryPage, PrecompressedStaticFiles
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "scripts"))
+from precompress_static import precompress  # noqa: E402
+
+BUNDLE = "console.log('tasklytics');\n" * 200
+
+
+@pytest.fixture
+def frontend(tmp_path):
+    (tmp_path / "assets").mkdir()
+    (tmp_path / "assets" / "index-BxK2a9fQ.js").write_text(BUNDLE)
+    (tmp_path / "robots.txt").write_text("User-agent: *\n")
+    (tmp_path / "index.html").write_text("<html><script src='/static/assets/index-BxK2a9fQ.js'></script>" +
+                                         "<!-- padding -->" * 100 + "</html>")
+    precompress(str(tmp_path), min_size=1024)
+
+    app = FastAPI()
+    app.mount("/static", PrecompressedStaticFiles(directory=str(tmp_path)), name="static")
+    page = InMemoryPage(str(tmp_path / "index.html"))
+
+    @app.get("/app")
+    async def index(request: Request):
+        return page.response(request)
+
+    return TestClient(app)
+
+
+def test_precompressed_variant_is_negotiated(frontend):
+    res = frontend.get("/static/assets/index-BxK2a9fQ.js", headers={"Accept-Encoding": "gzip"})
+    assert res.headers["content-encoding"] == "gzip"
+    assert res.headers["content-type"].startswith("text/javascript")
+    assert res.headers["vary"] == "Accept-Encoding"
+    assert res.headers["cache-control"] == IMMUTABLE
+    assert int(res.headers["content-length"]) < len(BUNDLE)
+    assert res.text == BUNDLE
+
+    plain = frontend.get("/static/assets/index-BxK2a9fQ.js", headers={"Accept-Encoding": "gzip;q=0"})
+    assert "content-encoding" not in plain.headers
+    assert plain.text == BUNDLE
+
+
+def test_small_unhashed_files_revalidate(frontend):
+    res = frontend.get("/static/robots.txt", headers={"Accept-Encoding": "gzip"})
+    assert "content-encoding" not in res.headers
+    assert res.headers["cache-control"] == REVALIDATE
+    again = frontend.get("/static/robots.txt", headers={"If-None-Match": res.headers["etag"]})
+    assert again.status_code == 304
+
+
+def test_index_from_memory_with_etag(frontend):
+    res = frontend.get("/app", headers={"Accept-Encoding": "gzip"})
+    assert res.headers["content-encoding"] == "gzip"
+    assert res.headers["cache-control"] == REVALIDATE
+    assert "index-BxK2a9fQ.js" in res.text
+
+    again = frontend.get("/app", headers={"If-None-Match": res.headers["etag"]})
+    assert again.status_code == 304
+    assert again.content == b""
+
+
+def test_large_json_responses_are_gzipped(client, auth_headers):
+    for i in range(30):
+        client.post("/tasks/", headers=auth_headers, json={
+            "title": f"gzip {i}", "description": "x" * 50,
+            "due_at": "2030-01-01T00:00:00", "user_email": "tester@example.com",
+        })
+    res = client.get("/tasks/", headers={**auth_headers, "Accept-Encoding": "gzip"})
+    assert res.headers["content-encoding"] == "gzip"
+    assert len(res.json()) >= 30
+
+    small = client.get("/", headers={"Accept-Encoding": "gzip"})
+    assert "content-encoding" not in small.headers
@@ -0,0 +1,70 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.config import settings
+from tests.conftest import login_as
+
+
+@pytest.fixture(scope="module")
+def headers(client):
+    return login_as(client, "batch@example.com")
+
+
+def _task(i):
+    due = datetime.now(timezone.utc) + timedelta(hours=i + 1)
+    return {"title": f"batch {i}", "due_at": due.isoformat(), "user_email": "batch@example.com"}
+
+
+def test_batch_create_update_delete(client, headers):
+    res = client.post("/tasks/batch", json={"tasks": [_task(i) for i in range(3)]}, headers=headers)
+    assert res.status_code == 201
+    results = res.json()["results"]
+    assert [r["status"] for r in results] == ["created"] * 3
+    assert [r["task"]["title"] for r in results] == ["batch 0", "batch 1", "batch 2"]
+    ids = [r["id"] for r in results]
+
+    res = client.put("/tasks/batch", headers=headers, json={"tasks": [
+        {"id": ids[0], "title": "renamed"},
+        {"id": 999999, "title": "nope"},
+    ]})
+    assert [r["status"] for r in res.json()["results"]] == ["updated", "not_found"]
+    assert res.json()["results"][0]["task"]["title"] == "renamed"
+
+    res = client.post("/tasks/batch/delete", json={"ids": ids[:2] + [999999]}, headers=headers)
+    assert [r["status"] for r in res.json()["results"]] == ["deleted", "deleted", "not_found"]
+
+    stats = client.get("/tasks/stats", headers=headers).json()
+    assert stats["total_tasks"] == 1
+
+
+def test_batch_cannot_touch_other_users_tasks(client, headers):
+    other = login_as(client, "batch-other@example.com")
+    task_id = client.post("/tasks/", json=_task(0), headers=other).json()["id"]
+
+    res = client.put("/tasks/batch", json={"tasks": [{"id": task_id, "title": "hijack"}]}, headers=headers)
+    assert res.json()["results"][0]["status"] == "not_found"
+    res = client.post("/tasks/batch/delete", json={"ids": [task_id]}, headers=headers)
+    assert res.json()["results"][0]["status"] == "not_found"
+    assert client.get(f"/tasks/{task_id}", headers=other).json()["title"] == "batch 0"
+
+
+def test_batch_size_is_limited(client, headers, monkeypatch):
+    monkeypatch.setattr(settings, "task_batch_max_items", 2)
+    res = client.post("/tasks/batch", json={"tasks": [_task(i) for i in range(3)]}, headers=headers)
+    assert res.status_code == 400
+
+
+def test_batch_update_rejects_duplicates_and_nulls(client, headers):
+    task_id = client.post("/tasks/", json=_task(0), headers=headers).json()["id"]
+
+    for tasks in (
+        [{"id": task_id, "title": "a"}, {"id": task_id, "title": "b"}],
+        [{"id": task_id, "due_at": None}],
+        [{"id": task_id, "title": None}],
+    ):
+        assert client.put("/tasks/batch", json={"tasks": tasks}, headers=headers).status_code == 422
+
+    assert client.put(f"/tasks/{task_id}", json={"due_at": None}, headers=headers).status_code == 422
+    res = client.put(f"/tasks/{task_id}", json={"description": None}, headers=headers)
+    assert res.status_code == 200 and res.json()["description"] is None
@@ -0,0 +1,67 @@
+import csv
+import io
+import json
+import tracemalloc
+from datetime import datetime, timedelta
+
+from sqlalchemy import insert
+
+from app.models import Task, User
+from app.utils.task_export import stream_tasks
+from tests.conftest import TestingSessionLocal, engine, login_as
+
+EMAIL = "export@example.com"
+
+
+def _seed(email, rows):
+    with TestingSessionLocal() as db:
+        owner = db.query(User).filter(User.email == email).one()
+        start = datetime(2030, 1, 1)
+        db.execute(insert(Task), [
+            {"title": f"export {i}", "due_at": start + timedelta(minutes=i),
+             "user_id": owner.id, "user_email": email, "reminded": False}
+            for i in range(rows)
+        ])
+        db.commit()
+        return owner.id
+
+
+def test_export_ndjson_and_csv(client):
+    headers = login_as(client, EMAIL)
+    client.post("/tasks/", headers=headers, json={
+        "title": "first", "due_at": "2029-01-01T09:00:00", "user_email": EMAIL,
+    })
+
+    res = client.get("/tasks/export", headers=headers)
+    assert res.status_code == 200
+    assert res.headers["content-type"].startswith("application/x-ndjson")
+    lines = [json.loads(line) for line in res.text.splitlines()]
+    assert lines == client.get("/tasks/", headers=headers).json()
+
+    res = client.get("/tasks/export?format=csv", headers=headers)
+    rows = list(csv.DictReader(io.StringIO(res.text)))
+    assert rows[0]["title"] == "first"
+    assert rows[0]["due_at"] == "2029-01-01T09:00:00"
+
+    assert client.get("/tasks/export?format=xml", headers=headers).status_code == 422
+
+
+def _export_peak(user_id):
+    tracemalloc.start()
+    exported = 0
+    for chunk in stream_tasks(engine, user_id, "ndjson"):
+        exported += len(chunk)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return exported, peak
+
+
+def test_export_memory_stays_flat(client):
+    login_as(client, "export-small@example.com")
+    login_as(client, "export-large@example.com")
+    small_size, small_peak = _export_peak(_seed("export-small@example.com", 2_000))
+    large_size, large_peak = _export_peak(_seed("export-large@example.com", 20_000))
+
+    # Ten times the output, but still only one chunk held at a time
+    assert large_size > 9 * small_size
+    assert large_peak < 1.5 * small_peak
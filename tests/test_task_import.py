@@ -0,0 +1,114 @@
+import csv
+import io
+import json
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+from app.config import settings
+from app.routers import tasks as tasks_router
+from app.utils import task_import
+from tests.conftest import login_as
+
+EMAIL = "import@example.com"
+
+
+def test_import_csv_reports_bad_rows(client):
+    headers = login_as(client, EMAIL)
+    body = (
+        "title,description,due_at\n"
+        "one,first,2030-01-01T09:00:00\n"
+        ",missing title,2030-01-01T10:00:00\n"
+        "three,,not a date\n"
+        "four,,2030-01-02T09:00:00\n"
+    )
+    res = client.post("/tasks/import", headers=headers,
+                      files={"file": ("tasks.csv", body, "text/csv")})
+    assert res.status_code == 200
+    result = res.json()
+    assert result["imported"] == 2
+    assert [e["row"] for e in result["errors"]] == [3, 4]
+    assert "due_at" in result["errors"][1]["error"]
+
+    tasks = client.get("/tasks/", headers=headers).json()
+    assert [t["title"] for t in tasks] == ["one", "four"]
+    assert all(t["user_email"] == EMAIL for t in tasks)
+    assert client.get("/tasks/stats", headers=headers).json()["total_tasks"] == 2
+
+
+def test_import_ndjson(client):
+    headers = login_as(client, "import-ndjson@example.com")
+    lines = [json.dumps({"title": f"task {i}", "due_at": "2030-02-01T09:00:00"}) for i in range(5)]
+    body = "\n".join(lines + ["{broken", "[1, 2]"]) + "\n"
+    res = client.post("/tasks/import", headers=headers,
+                      files={"file": ("tasks.ndjson", body, "application/x-ndjson")})
+    result = res.json()
+    assert result["imported"] == 5
+    assert [e["row"] for e in result["errors"]] == [6, 7]
+    assert len(client.get("/tasks/", headers=headers).json()) == 5
+
+
+def test_import_rejects_non_utf8(client):
+    headers = login_as(client, "import-latin1@example.com")
+    body = "title\nok\n".encode() + b"\xff\xfebad\n"
+    res = client.post("/tasks/import", headers=headers,
+                      files={"file": ("tasks.csv", body, "text/csv")})
+    assert res.status_code == 400
+    assert "UTF-8" in res.json()["detail"]
+    assert client.get("/tasks/", headers=headers).json() == []
+
+
+def test_import_caps_listed_errors(client, monkeypatch):
+    monkeypatch.setattr(settings, "task_import_max_errors", 2)
+    monkeypatch.setattr(settings, "task_import_chunk_size", 3)
+    headers = login_as(client, "import-errors@example.com")
+    body = "title,due_at\n" + "".join(f"bad {i},never\n" for i in range(5)) + "good,2030-01-01T09:00:00\n"
+    res = client.post("/tasks/import", headers=headers,
+                      files={"file": ("tasks.csv", body, "text/csv")})
+    result = res.json()
+    assert result["imported"] == 1
+    assert result["failed"] == 5
+    assert [e["row"] for e in result["errors"]] == [2, 3]
+
+
+def test_import_schedules_reminders_in_the_window(client, monkeypatch):
+    scheduled = []
+    timer = SimpleNamespace(running=True, window=timedelta(hours=1), schedule_many=lambda pairs: scheduled.extend(pairs))
+    monkeypatch.setattr(tasks_router, "reminder_timer", timer)
+    headers = login_as(client, "import-timer@example.com")
+    soon = (datetime.now(timezone.utc) + timedelta(minutes=30)).isoformat()
+    body = "\n".join([
+        json.dumps({"title": "soon", "due_at": soon}),
+        json.dumps({"title": "later", "due_at": "2030-01-01T09:00:00"}),
+    ]) + "\n"
+    res = client.post("/tasks/import", headers=headers,
+                      files={"file": ("tasks.ndjson", body, "application/x-ndjson")})
+    assert res.json()["imported"] == 2
+
+    soon_id = next(t["id"] for t in client.get("/tasks/", headers=headers).json() if t["title"] == "soon")
+    assert [task_id for task_id, _ in scheduled] == [soon_id]
+
+
+def test_copy_writes_due_at_as_naive_utc():
+    class Cursor:
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            return False
+
+        def copy_expert(self, sql, buffer):
+            self.copied = buffer.getvalue()
+
+    cursor = Cursor()
+    # Just enough of a Session for _copy_rows to reach the DBAPI cursor
+    driver_connection = SimpleNamespace(cursor=lambda: cursor)
+    db = SimpleNamespace(connection=lambda: SimpleNamespace(connection=SimpleNamespace(driver_connection=driver_connection)))
+
+    row = task_import.TaskImportRow.model_validate({"title": "tz", "due_at": "2030-01-01T12:00:00+02:00"})
+    rows = task_import.task_rows(1, EMAIL, [row], datetime(2029, 12, 1, tzinfo=timezone.utc))
+    task_import._copy_rows(db, rows)
+
+    copied = dict(zip(task_import.COPY_COLUMNS, next(csv.reader(io.StringIO(cursor.copied)))))
+    # timestamp without time zone would silently drop a +02:00 offset
+    assert copied["due_at"] == "2030-01-01T10:00:00"
+    assert copied["remind_at"] == "2030-01-01T09:55:00"
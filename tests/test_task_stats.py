@@ -0,0 +1,56 @@
+from datetime import datetime, timedelta, timezone
+
+from app.models import User, UserTaskCounter
+from app.task_counters import reconcile_task_counters
+from tests.conftest import TestingSessionLocal, login_as
+
+
+def test_stats_counts_every_bucket_in_one_response(client):
+    headers = login_as(client, "stats@example.com")
+    now = datetime.now(timezone.utc)
+    for offset in (timedelta(hours=-2), timedelta(hours=3), timedelta(hours=30)):
+        client.post("/tasks/", headers=headers, json={
+            "title": "t", "due_at": (now + offset).isoformat(), "user_email": "stats@example.com",
+        })
+
+    res = client.get("/tasks/stats", headers=headers)
+    assert res.json() == {"total_tasks": 3, "overdue_tasks": 1, "upcoming_tasks": 1, "window_hours": 24}
+
+    res = client.get("/tasks/stats", params={"window_hours": 48}, headers=headers)
+    assert res.json()["upcoming_tasks"] == 2
+
+
+def test_counters_follow_updates_and_deletes(client):
+    headers = login_as(client, "counters@example.com")
+    now = datetime.now(timezone.utc)
+    task = client.post("/tasks/", headers=headers, json={
+        "title": "t", "due_at": (now + timedelta(hours=2)).isoformat(), "user_email": "counters@example.com",
+    }).json()
+    assert client.get("/tasks/stats", headers=headers).json()["upcoming_tasks"] == 1
+
+    client.put(f"/tasks/{task['id']}", headers=headers, json={"due_at": (now - timedelta(days=3)).isoformat()})
+    stats = client.get("/tasks/stats", headers=headers).json()
+    assert (stats["overdue_tasks"], stats["upcoming_tasks"]) == (1, 0)
+
+    client.delete(f"/tasks/{task['id']}", headers=headers)
+    assert client.get("/tasks/stats", headers=headers).json()["total_tasks"] == 0
+
+
+def test_reconciliation_repairs_drift(client):
+    headers = login_as(client, "drift@example.com")
+    client.post("/tasks/", headers=headers, json={
+        "title": "t", "due_at": datetime.now(timezone.utc).isoformat(), "user_email": "drift@example.com",
+    })
+
+    db = TestingSessionLocal()
+    try:
+        user_id = db.query(User.id).filter(User.email == "drift@example.com").scalar()
+        db.get(UserTaskCounter, user_id).total_tasks = 42
+        db.commit()
+        assert client.get("/tasks/stats", headers=headers).json()["total_tasks"] == 42
+
+        assert reconcile_task_counters(db) >= 1
+    finally:
+        db.close()
+
+    assert client.get("/tasks/stats", headers=headers).json()["total_tasks"] == 1